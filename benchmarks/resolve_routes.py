@@ -0,0 +1,80 @@
+"""Route resolution benchmark: rAPIdy router vs aiohttp router.
+
+Usage: python -m benchmarks.resolve_routes [--number 2000]
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Tuple
+
+from aiohttp.test_utils import make_mocked_request
+from aiohttp.web_urldispatcher import UrlDispatcher as AioHTTPUrlDispatcher
+
+from rapidy import web
+from rapidy.web_urldispatcher import UrlDispatcher
+
+ROUTE_COUNTS = (100, 1_000, 10_000)
+
+
+async def handler(request: web.Request) -> web.Response:
+    return web.Response()
+
+
+def create_routes(route_count: int) -> List[Tuple[str, str]]:
+    routes = []
+    for index in range(route_count):
+        resource_name = f'resource{index}'
+        if index % 2:
+            routes.append(('GET', f'/api/v1/{resource_name}/{{item_id}}'))
+        else:
+            routes.append(('GET', f'/api/v1/{resource_name}'))
+    return routes
+
+
+def create_paths(route_count: int) -> List[Tuple[str, str]]:
+    last_plain = route_count - 2
+    last_dynamic = route_count - 1
+    return [
+        ('first plain', '/api/v1/resource0'),
+        ('last plain', f'/api/v1/resource{last_plain}'),
+        ('last dynamic', f'/api/v1/resource{last_dynamic}/42'),
+        ('not found', '/api/v2/unknown'),
+    ]
+
+
+async def measure(router: AioHTTPUrlDispatcher, method: str, path: str, number: int) -> float:
+    request = make_mocked_request(method, path)
+    started_at = time.perf_counter()
+    for _ in range(number):
+        await router.resolve(request)
+    return (time.perf_counter() - started_at) / number * 1_000_000
+
+
+async def main(number: int) -> None:
+    print(f'{"routes":>8} {"path":>14} {"aiohttp, us":>12} {"rapidy, us":>12} {"speedup":>8}')
+
+    for route_count in ROUTE_COUNTS:
+        aiohttp_router = AioHTTPUrlDispatcher()
+        rapidy_router = UrlDispatcher()
+        for method, path in create_routes(route_count):
+            aiohttp_router.add_route(method, path, handler)
+            rapidy_router.add_route(method, path, handler)
+
+        aiohttp_router.freeze()
+        rapidy_router.freeze()
+
+        for path_name, path in create_paths(route_count):
+            aiohttp_time = await measure(aiohttp_router, 'GET', path, number)
+            rapidy_time = await measure(rapidy_router, 'GET', path, number)
+            print(
+                f'{route_count:>8} {path_name:>14} {aiohttp_time:>12.2f} {rapidy_time:>12.2f} '
+                f'{aiohttp_time / rapidy_time:>7.1f}x',
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=2_000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.number))
@@ -1,7 +1,7 @@
 import inspect
 from abc import ABC, abstractmethod
 from types import FunctionType
-from typing import Any, Dict, Iterator, Optional, Set, Type, Union
+from typing import Any, Dict, Iterator, Mapping, Optional, Set, Type, Union
 
 from aiohttp.web_request import Request
 from typing_extensions import get_args
@@ -9,7 +9,8 @@ from typing_extensions import get_args
 from rapidy._annotation_extractor import extract_handler_attr_annotations, NotParameterError
 from rapidy._client_errors import _create_handler_attr_info_msg, _create_handler_info_msg, ExtractError
 from rapidy._fields import ModelField
-from rapidy._validators import validate_request_param_data
+from rapidy._path_converters import PathConverter
+from rapidy._validators import NO_CONVERTERS, validate_request_param_data, ValueConverter
 from rapidy.request_params import create_param_model_field_by_request_param, ParamFieldInfo, ParamType, ValidateType
 from rapidy.typedefs import Handler, MethodHandler, Middleware, NoArgAnyCallable, ValidateReturn
 
@@ -65,6 +66,10 @@ class ParamAnnotationContainer(ABC):
         self._extractor = extractor
         self._param_type = param_type
 
+    @property
+    def param_type(self) -> ParamType:
+        return self._param_type
+
     @abstractmethod
     async def get_request_data(  # noqa: WPS463
             self,
@@ -129,6 +134,15 @@ class ValidateParamAnnotationContainer(ParamAnnotationContainer, ABC):
     def __init__(self, extractor: Any, param_type: ParamType):
         super().__init__(extractor=extractor, param_type=param_type)
         self._map_model_fields_by_alias: Dict[str, ModelField] = {}
+        self._prevalidated_converters: Mapping[str, ValueConverter] = NO_CONVERTERS
+
+    def set_path_converters(self, path_converters: Mapping[str, PathConverter]) -> None:
+        # NOTE: the raw values stay strings, only the fields of the converter type without constraints skip validation
+        self._prevalidated_converters = {
+            alias: path_converters[alias].convert
+            for alias, model_field in self._map_model_fields_by_alias.items()
+            if alias in path_converters and model_field.is_plain_type(path_converters[alias].type_)
+        }
 
     async def get_request_data(
             self,
@@ -147,6 +161,7 @@ class ValidateParamAnnotationContainer(ParamAnnotationContainer, ABC):
             required_fields_map=self._map_model_fields_by_alias,
             raw_data=raw_data,
             is_single_model=self.single_model,
+            prevalidated_converters=self._prevalidated_converters,
         )
 
     def _add_field(
@@ -241,6 +256,7 @@ class AnnotationContainer:
         self._params: Dict[str, ParamAnnotationContainer] = {}
         self._request_exists: bool = False
         self._request_param_name: Optional[str] = None
+        self._body_max_size: Optional[int] = None
 
     def __iter__(self) -> Iterator[ParamAnnotationContainer]:
         for param_container in self._params.values():
@@ -254,10 +270,19 @@ class AnnotationContainer:
         self._request_exists = True
         self._request_param_name = request_param_name
 
+    def set_path_converters(self, path_converters: Mapping[str, PathConverter]) -> None:
+        param_container = self._params.get(ParamType.path)
+        if isinstance(param_container, ParamAnnotationContainerValidateParams):
+            param_container.set_path_converters(path_converters)
+
     @property
     def request_exists(self) -> bool:
         return self._request_exists
 
+    @property
+    def body_max_size(self) -> Optional[int]:
+        return self._body_max_size
+
     @property
     def request_param_name(self) -> str:
         if not self._request_exists or not self._request_param_name:
@@ -289,6 +314,9 @@ class AnnotationContainer:
         except AttributeAlreadyExistError:
             raise AttributeDefinitionError(handler=self._handler, param_name=name)
 
+        if field_info.param_type == ParamType.body:
+            self._body_max_size = getattr(field_info, 'body_max_size', None)
+
     def _get_or_create_param_container(
             self,
             type_: ParamType,
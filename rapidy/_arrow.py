@@ -0,0 +1,126 @@
+from typing import Any, cast, Final, List, Optional, TYPE_CHECKING, Union
+
+from aiohttp.abc import Request
+from aiohttp.typedefs import LooseHeaders
+from aiohttp.web_response import StreamResponse
+
+from rapidy._client_errors import ExtractArrowError
+from rapidy._extractors import _read_full_body
+from rapidy.media_types import ApplicationArrowStream
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+    from pyarrow import Buffer, RecordBatch, Schema, Table
+else:
+    try:
+        import pyarrow as pa
+    except ImportError:  # pragma: no cover
+        pa = None
+
+    Buffer = Any
+    RecordBatch = Any
+    Schema = Any
+    Table = Any
+
+__all__ = (
+    'ArrowStreamResponse',
+    'extract_body_arrow',
+    'raise_if_pyarrow_is_not_installed',
+)
+
+# NOTE: IPC metadata is written by pyarrow in many tiny pieces, they are merged before being sent
+_SMALL_CHUNK_SIZE: Final[int] = 65536
+
+
+def raise_if_pyarrow_is_not_installed() -> None:
+    if pa is None:  # pragma: no cover
+        raise ModuleNotFoundError(
+            'PyArrow is required to work with Apache Arrow IPC streams. '
+            'Please install it: `pip install rapidy[arrow]`.',
+        )
+
+
+async def extract_body_arrow(request: Request, max_size: int) -> Table:
+    body = await _read_full_body(request=request, max_size=max_size)
+
+    # NOTE: zero-copy - the columns of the record batches reference the body buffer
+    try:
+        with pa.ipc.open_stream(pa.py_buffer(body)) as reader:
+            return reader.read_all()
+    except (pa.ArrowInvalid, OSError) as arrow_err:
+        raise ExtractArrowError(arrow_error=arrow_err)
+
+
+class _ArrowChunkSink:
+    def __init__(self) -> None:
+        self._chunks: List[Union[bytes, memoryview]] = []
+        self._small_chunk = bytearray()
+        self.closed = False
+
+    def write(self, data: Union[bytes, Buffer]) -> int:
+        chunk = memoryview(data)
+        if chunk.nbytes < _SMALL_CHUNK_SIZE:
+            self._small_chunk.extend(chunk)
+        else:
+            self._flush_small_chunk()
+            self._chunks.append(chunk)
+
+        return chunk.nbytes
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def pop_chunks(self) -> List[Union[bytes, memoryview]]:
+        self._flush_small_chunk()
+        chunks = self._chunks
+        self._chunks = []
+        return chunks
+
+    def _flush_small_chunk(self) -> None:
+        if self._small_chunk:
+            self._chunks.append(bytes(self._small_chunk))
+            self._small_chunk.clear()
+
+
+class ArrowStreamResponse(StreamResponse):
+    def __init__(
+            self,
+            schema: Schema,
+            *,
+            status: int = 200,
+            reason: Optional[str] = None,
+            headers: Optional[LooseHeaders] = None,
+    ) -> None:
+        raise_if_pyarrow_is_not_installed()
+
+        super().__init__(status=status, reason=reason, headers=headers)
+        self.content_type = ApplicationArrowStream
+
+        self._sink = _ArrowChunkSink()
+        self._writer = pa.ipc.new_stream(self._sink, schema)
+        self._is_writer_closed = False
+
+    async def write_batch(self, batch: RecordBatch) -> None:
+        # NOTE: the batch buffers are sent as is, every batch is written as soon as it is produced
+        self._writer.write_batch(batch)
+        await self._drain_sink()
+
+    async def write_table(self, table: Table, max_chunksize: Optional[int] = None) -> None:
+        for batch in table.to_batches(max_chunksize=max_chunksize):
+            await self.write_batch(batch)
+
+    async def write_eof(self, data: bytes = b'') -> None:
+        if not self._is_writer_closed:
+            self._is_writer_closed = True
+            self._writer.close()  # NOTE: writes the end-of-stream marker
+            await self._drain_sink()
+
+        await super().write_eof(data)
+
+    async def _drain_sink(self) -> None:
+        for chunk in self._sink.pop_chunks():
+            # NOTE: the transport accepts any bytes-like object - the batch buffers are not copied
+            await self.write(cast(bytes, chunk))
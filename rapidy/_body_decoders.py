@@ -0,0 +1,102 @@
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Optional
+
+from aiohttp.abc import Request
+from aiohttp.typedefs import DEFAULT_JSON_DECODER
+
+from rapidy._client_errors import ExtractBodyDecodeError
+from rapidy._extractors import (
+    _read_full_body,
+    extract_body_bytes,
+    extract_body_json,
+    extract_body_multi_part,
+    extract_body_text,
+    extract_body_x_www_form,
+)
+from rapidy.media_types import ApplicationBytes, ApplicationJSON, ApplicationXWWWForm, MultipartForm, TextPlain
+from rapidy.typedefs import BodyDecoder, BodyExtractor
+
+__all__ = (
+    'BodyDecoderRegistry',
+    'normalize_media_type',
+)
+
+DEFAULT_BODY_EXTRACTORS: Final[Mapping[str, BodyExtractor]] = MappingProxyType({
+    ApplicationJSON: partial(extract_body_json, json_decoder=DEFAULT_JSON_DECODER),
+    ApplicationXWWWForm: partial(
+        extract_body_x_www_form,
+        attrs_case_sensitive=False,
+        duplicated_attrs_parse_as_array=False,
+    ),
+    MultipartForm: partial(
+        extract_body_multi_part,
+        attrs_case_sensitive=False,
+        duplicated_attrs_parse_as_array=False,
+    ),
+    TextPlain: extract_body_text,
+    ApplicationBytes: extract_body_bytes,
+})
+
+# NOTE: RFC 6839 structured syntax suffixes, e.g. `application/vnd.api+json` is decoded as `application/json`.
+STRUCTURED_SYNTAX_SUFFIXES: Final[Mapping[str, str]] = MappingProxyType({
+    'json': ApplicationJSON,
+})
+
+
+def normalize_media_type(media_type: str) -> str:
+    return media_type.partition(';')[0].strip().lower()
+
+
+def _create_body_decoder_extractor(media_type: str, decoder: BodyDecoder) -> BodyExtractor:
+    async def extractor(request: Request, max_size: int) -> Any:
+        bytes_body = await _read_full_body(request=request, max_size=max_size)
+        try:
+            return decoder(bytes_body)
+        except Exception as decode_err:
+            raise ExtractBodyDecodeError(media_type=media_type, decode_err_msg=decode_err)
+
+    return extractor
+
+
+class BodyDecoderRegistry:
+    def __init__(self, decoders: Optional[Mapping[str, BodyDecoder]] = None) -> None:
+        self._extractors: Dict[str, BodyExtractor] = {}
+        self._dispatch_table: Dict[str, BodyExtractor] = dict(DEFAULT_BODY_EXTRACTORS)
+        self._frozen = False
+
+        for media_type, decoder in (decoders or {}).items():
+            self.add(media_type, decoder)
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def add(self, media_type: str, decoder: BodyDecoder) -> None:
+        if self._frozen:
+            raise RuntimeError('Cannot add body decoder to frozen application')
+
+        normalized_media_type = normalize_media_type(media_type)
+        extractor = _create_body_decoder_extractor(normalized_media_type, decoder)
+
+        self._extractors[normalized_media_type] = extractor
+        self._dispatch_table[normalized_media_type] = extractor
+
+    def freeze(self, parent: Optional['BodyDecoderRegistry'] = None) -> None:
+        # NOTE: The dispatch table is built once, the decoders of the sub application override the parent ones.
+        base_table = parent._dispatch_table if parent is not None else DEFAULT_BODY_EXTRACTORS
+        self._dispatch_table = {**base_table, **self._extractors}
+        self._frozen = True
+
+    def resolve(self, media_type: str) -> Optional[BodyExtractor]:
+        extractor = self._dispatch_table.get(media_type)
+        if extractor is not None:
+            return extractor
+
+        _, plus, suffix = media_type.rpartition('+')
+        if plus:
+            suffix_media_type = STRUCTURED_SYNTAX_SUFFIXES.get(suffix)
+            if suffix_media_type is not None:
+                return self._dispatch_table.get(suffix_media_type)
+
+        return None
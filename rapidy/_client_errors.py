@@ -14,7 +14,8 @@ class ClientBaseError(ABC, ValueError):
     msg_template: str
 
     def __init__(self, *_: Any, **error_ctx: Any) -> None:
-        self._err_msg = self.msg_template.format(**error_ctx)
+        # NOTE: the messages without the context are rendered once - the template is the message
+        self._err_msg = self.msg_template.format(**error_ctx) if error_ctx else self.msg_template
 
     @abstractmethod
     def get_error_info(
@@ -65,21 +66,17 @@ if PYDANTIC_V1:
         return use_errors
 
 elif PYDANTIC_V2:
-    from pydantic import ValidationError
-    from pydantic_core import InitErrorDetails, PydanticCustomError
-
     class ClientError(ClientBaseError, ABC):  # type: ignore[no-redef]
         def get_error_info(
                 self,
                 loc: Tuple[str, ...],
         ) -> Dict[str, Any]:
-            err = PydanticCustomError(self.type, self._err_msg)
-            err_details = InitErrorDetails(type=err, loc=loc, input=input)
-            return ValidationError.from_exception_data(
-                title='',
-                line_errors=[err_details],
-                hide_input=True,
-            ).errors()[0]
+            # NOTE: the same error details as a pydantic custom error has, without building a `ValidationError`
+            return {
+                'type': self.type,
+                'loc': loc,
+                'msg': self._err_msg,
+            }
 
     class RequiredFieldIsMissing(ClientError):  # type: ignore[no-redef]
         type = 'missing'
@@ -96,9 +93,7 @@ elif PYDANTIC_V2:
         ]
 
     def _normalize_errors(errors: List[Any]) -> ValidationErrorList:
-        for error in errors:  # TODO: FIXME
-            error.pop('url', None)
-            error.pop('input', None)
+        # NOTE: the errors are created without `url` and `input` - they are already normalized
         return errors
 
 else:
@@ -121,6 +116,34 @@ class ExtractJsonError(ExtractBodyError):
     msg_template = 'Failed to extract body data as Json: {json_decode_err_msg}'
 
 
+class ExtractJsonLimitError(ExtractBodyError):
+    msg_template = 'Failed to extract body data as Json: {limit_error}'
+
+
+class ExtractBodyDecodeError(ExtractBodyError):
+    msg_template = 'Failed to extract body data as `{media_type}`: {decode_err_msg}'
+
+
+class UnsupportedMediaTypeError(ExtractBodyError):
+    msg_template = 'Failed to extract body data. Unsupported media type `{media_type}`'
+
+
+class ExtractNDArrayError(ExtractBodyError):
+    msg_template = 'Failed to extract body data as NDArray: {ndarray_error}'
+
+
+class ExtractArrowError(ExtractBodyError):
+    msg_template = 'Failed to extract body data as Arrow IPC stream: {arrow_error}'
+
+
+class ExtractCsvError(ExtractBodyError):
+    msg_template = 'Failed to extract body data as CSV: {csv_error}'
+
+
+class ExtractFileError(ExtractBodyError):
+    msg_template = 'Failed to extract body data as file: {file_error}'
+
+
 class ExtractMultipartError(ExtractBodyError):
     msg_template = 'Failed to extract body data as Multipart: {multipart_error}'
 
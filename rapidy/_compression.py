@@ -0,0 +1,285 @@
+import asyncio
+import zlib
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Final, FrozenSet, Iterable, Optional, Sequence, Tuple
+
+from aiohttp.web_middlewares import middleware
+from aiohttp.web_request import Request
+from aiohttp.web_response import ContentCoding, Response, StreamResponse
+
+from rapidy import hdrs
+from rapidy.typedefs import Handler, Middleware
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+__all__ = (
+    'CompressionStats',
+    'compression_middleware',
+    'DEFAULT_COMPRESSION_CODINGS',
+    'DEFAULT_NOT_COMPRESSIBLE_CONTENT_TYPES',
+)
+
+BodyCompressor = Callable[[bytes], bytes]
+
+GZIP_CODING: Final[str] = 'gzip'
+BROTLI_CODING: Final[str] = 'br'
+ZSTD_CODING: Final[str] = 'zstd'
+
+# NOTE: the order is the server preference when the client accepts several codings with the same quality
+DEFAULT_COMPRESSION_CODINGS: Final[Tuple[str, ...]] = (BROTLI_CODING, ZSTD_CODING, GZIP_CODING)
+
+# NOTE: aiohttp payload writer compresses streamed responses only with zlib
+STREAM_COMPRESSION_CODINGS: Final[Tuple[str, ...]] = (GZIP_CODING,)
+
+DEFAULT_NOT_COMPRESSIBLE_CONTENT_TYPES: Final[FrozenSet[str]] = frozenset((
+    'application/gzip',
+    'application/x-gzip',
+    'application/zip',
+    'application/zstd',
+    'application/x-bzip2',
+    'application/x-xz',
+    'application/x-7z-compressed',
+    'application/x-rar-compressed',
+    'application/octet-stream',
+    'image/png',
+    'image/jpeg',
+    'image/gif',
+    'image/webp',
+    'image/avif',
+    'audio/*',
+    'video/*',
+    'font/woff',
+    'font/woff2',
+    'text/event-stream',  # NOTE: the compressor buffers the events - the client gets them late
+))
+
+COMPRESSION_MIN_SIZE: Final[int] = 1024
+COMPRESSION_EXECUTOR_MIN_SIZE: Final[int] = 65536
+
+_GZIP_WBITS_OFFSET: Final[int] = 16
+_NEGOTIATION_CACHE_SIZE: Final[int] = 256
+
+
+@dataclass
+class CompressionStats:
+    compressed_responses: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _create_body_compressor(coding: str, level: Optional[int]) -> BodyCompressor:
+    if coding == GZIP_CODING:
+        gzip_level = level if level is not None else 6
+
+        def compress_gzip(body: bytes) -> bytes:
+            compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, _GZIP_WBITS_OFFSET + zlib.MAX_WBITS)
+            return compressor.compress(body) + compressor.flush()
+
+        return compress_gzip
+
+    if coding == BROTLI_CODING:
+        if brotli is None:  # pragma: no cover
+            raise ModuleNotFoundError(
+                'Brotli is required for `br` compression. Please install it: `pip install rapidy[compression]`.',
+            )
+
+        brotli_quality = level if level is not None else 4
+        return lambda body: brotli.compress(body, quality=brotli_quality)
+
+    if coding == ZSTD_CODING:
+        if zstandard is None:  # pragma: no cover
+            raise ModuleNotFoundError(
+                'Zstandard is required for `zstd` compression. Please install it: `pip install rapidy[compression]`.',
+            )
+
+        # NOTE: the compressor object is not thread-safe - it is created for every body
+        zstd_level = level if level is not None else 3
+        return lambda body: zstandard.ZstdCompressor(level=zstd_level).compress(body)
+
+    raise ValueError(f'Unsupported compression coding `{coding}`.')
+
+
+def _is_coding_available(coding: str) -> bool:
+    if coding == BROTLI_CODING:
+        return brotli is not None
+    if coding == ZSTD_CODING:
+        return zstandard is not None
+    return True
+
+
+@lru_cache(maxsize=_NEGOTIATION_CACHE_SIZE)
+def _negotiate_coding(accept_encoding: str, codings: Tuple[str, ...]) -> Optional[str]:
+    accepted_codings: Dict[str, float] = {}
+    for accepted_coding in accept_encoding.lower().split(','):
+        coding_name, _, params = accepted_coding.partition(';')
+        accepted_codings[coding_name.strip()] = _parse_quality(params)
+
+    default_quality = accepted_codings.get('*', 0)
+
+    best_coding = None
+    best_quality: float = 0
+    for coding in codings:
+        quality = accepted_codings.get(coding, default_quality)
+        if quality > best_quality:
+            best_coding = coding
+            best_quality = quality
+
+    return best_coding
+
+
+def _parse_quality(params: str) -> float:
+    param_name, _, param_value = params.strip().partition('=')
+    if param_name.strip() != 'q':
+        return 1
+
+    try:
+        return float(param_value)
+    except ValueError:
+        return 0
+
+
+def _create_content_type_filter(not_compressible_content_types: Iterable[str]) -> Callable[[str], bool]:
+    exact_content_types = set()
+    content_type_prefixes = []
+    for not_compressible_content_type in not_compressible_content_types:
+        if not_compressible_content_type.endswith('/*'):
+            content_type_prefixes.append(not_compressible_content_type[:-1])
+        else:
+            exact_content_types.add(not_compressible_content_type)
+
+    prefixes = tuple(content_type_prefixes)
+
+    def is_compressible(content_type: str) -> bool:
+        return content_type not in exact_content_types and not content_type.startswith(prefixes)
+
+    return is_compressible
+
+
+def _is_compressible_response(resp: StreamResponse) -> bool:
+    if resp.prepared or resp.status < 200 or resp.status in {204, 304}:  # noqa: WPS432
+        return False
+
+    if hdrs.CONTENT_ENCODING in resp.headers:
+        return False
+
+    return 'no-transform' not in resp.headers.get(hdrs.CACHE_CONTROL, '')
+
+
+def _weaken_etag(resp: StreamResponse) -> None:
+    # NOTE: RFC 9110 - a strong ETag identifies the representation bytes, the encoded body is another representation.
+    #  The weak ETag still matches the identity one in `If-None-Match`, which uses the weak comparison.
+    etag = resp.headers.get(hdrs.ETAG)
+    if etag is not None and not etag.startswith('W/'):
+        resp.headers[hdrs.ETAG] = f'W/{etag}'
+
+
+class _ResponseCompressor:
+    def __init__(
+            self,
+            *,
+            codings: Sequence[str],
+            min_size: int,
+            level: Optional[int],
+            executor_min_size: int,
+            executor: Optional[Executor],
+            stats: Optional[CompressionStats],
+    ) -> None:
+        # NOTE: the codings without the installed library are not offered to the clients
+        self._codings = tuple(coding for coding in codings if _is_coding_available(coding))
+        self._stream_codings = tuple(coding for coding in self._codings if coding in STREAM_COMPRESSION_CODINGS)
+        self._body_compressors = {coding: _create_body_compressor(coding, level) for coding in self._codings}
+        self._min_size = min_size
+        self._executor_min_size = executor_min_size
+        self._executor = executor
+        self._stats = stats
+
+    async def compress_response(self, request: Request, resp: Response) -> None:
+        body = resp.body
+        if not isinstance(body, (bytes, bytearray)):
+            return
+
+        if len(body) < self._min_size:
+            return
+
+        resp.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+        coding = _negotiate_coding(request.headers.get(hdrs.ACCEPT_ENCODING, ''), self._codings)
+        if coding is not None:
+            await self._compress_body(resp, bytes(body), coding)
+
+    def compress_stream_response(self, request: Request, resp: StreamResponse) -> None:
+        resp.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+        coding = _negotiate_coding(request.headers.get(hdrs.ACCEPT_ENCODING, ''), self._stream_codings)
+        if coding is not None:
+            # NOTE: the chunks are compressed while they are written, large chunks are compressed in the executor
+            resp.enable_compression(ContentCoding(coding))
+            _weaken_etag(resp)
+
+    async def _compress_body(self, resp: Response, body: bytes, coding: str) -> None:
+        compress = self._body_compressors[coding]
+        if len(body) >= self._executor_min_size:
+            compressed_body = await asyncio.get_running_loop().run_in_executor(self._executor, compress, body)
+        else:
+            compressed_body = compress(body)
+
+        if len(compressed_body) >= len(body):
+            return
+
+        resp.body = compressed_body
+        resp.headers[hdrs.CONTENT_ENCODING] = coding
+        _weaken_etag(resp)
+
+        if self._stats is not None:
+            self._stats.compressed_responses += 1
+            self._stats.bytes_before += len(body)
+            self._stats.bytes_after += len(compressed_body)
+
+
+def compression_middleware(
+        *,
+        codings: Sequence[str] = DEFAULT_COMPRESSION_CODINGS,
+        min_size: int = COMPRESSION_MIN_SIZE,
+        level: Optional[int] = None,
+        not_compressible_content_types: Iterable[str] = DEFAULT_NOT_COMPRESSIBLE_CONTENT_TYPES,
+        executor_min_size: int = COMPRESSION_EXECUTOR_MIN_SIZE,
+        executor: Optional[Executor] = None,
+        stats: Optional[CompressionStats] = None,
+) -> Middleware:
+    compressor = _ResponseCompressor(
+        codings=codings,
+        min_size=min_size,
+        level=level,
+        executor_min_size=executor_min_size,
+        executor=executor,
+        stats=stats,
+    )
+    is_compressible_content_type = _create_content_type_filter(not_compressible_content_types)
+
+    # NOTE: the middleware has no request parameters - it is not wrapped by the rAPIdy validation
+    @middleware
+    async def compression(request: Request, handler: Handler) -> StreamResponse:
+        resp = await handler(request)
+        if not _is_compressible_response(resp) or not is_compressible_content_type(resp.content_type):
+            return resp
+
+        if isinstance(resp, Response):
+            await compressor.compress_response(request, resp)
+        else:
+            compressor.compress_stream_response(request, resp)
+
+        return resp
+
+    return compression
@@ -0,0 +1,160 @@
+import asyncio
+import hashlib
+import inspect
+from typing import Any, Dict, Final, NamedTuple, Optional, Sequence, Tuple
+
+from aiohttp.typedefs import LooseHeaders
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from rapidy import hdrs
+from rapidy._compression import (
+    _create_body_compressor,
+    _is_coding_available,
+    _negotiate_coding,
+    DEFAULT_COMPRESSION_CODINGS,
+)
+from rapidy._etag import ETAG_DIGEST_SIZE, is_etag_matched
+from rapidy._json_encoders import create_json_bytes_encoder
+from rapidy.media_types import ApplicationBytes, ApplicationJSON, TextPlain
+from rapidy.web_request import Request
+from rapidy.web_response import Response
+
+__all__ = (
+    'ConstantHandler',
+)
+
+IDENTITY_CODING: Final[str] = 'identity'
+
+
+class _EncodedVariant(NamedTuple):
+    body: bytes
+    headers: CIMultiDictProxy[str]
+
+
+class _EncodedConstant(NamedTuple):
+    variants: Dict[str, _EncodedVariant]
+    codings: Tuple[str, ...]
+
+
+def _encode_data(data: Any, content_type: Optional[str]) -> Tuple[bytes, str]:
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data), content_type or ApplicationBytes
+
+    if isinstance(data, str):
+        return data.encode(), f'{content_type or TextPlain}; charset=utf-8'
+
+    return create_json_bytes_encoder()(data), f'{content_type or ApplicationJSON}; charset=utf-8'
+
+
+class ConstantHandler:
+    def __init__(
+            self,
+            data: Any,
+            *,
+            content_type: Optional[str] = None,
+            headers: Optional[LooseHeaders] = None,
+            codings: Sequence[str] = DEFAULT_COMPRESSION_CODINGS,
+            compression_min_size: int = 1024,
+    ) -> None:
+        # NOTE: a callable is the factory of the data - it is called once and after every `invalidate()`
+        self._data = data
+        self._content_type = content_type
+        self._headers = headers
+        self._codings = tuple(coding for coding in codings if _is_coding_available(coding))
+        self._compression_min_size = compression_min_size
+
+        self._encoded_constant: Optional[_EncodedConstant] = None
+        self._encode_lock: Optional[asyncio.Lock] = None
+        self._version = 0
+
+    def invalidate(self) -> None:
+        self._encoded_constant = None
+        self._version += 1
+
+    async def handle(self, request: Request) -> Response:
+        encoded_constant = self._encoded_constant
+        if encoded_constant is None:
+            encoded_constant = await self._encode()
+
+        coding = IDENTITY_CODING
+        if encoded_constant.codings:
+            coding = _negotiate_coding(
+                request.headers.get(hdrs.ACCEPT_ENCODING, ''),
+                encoded_constant.codings,
+            ) or IDENTITY_CODING
+
+        variant = encoded_constant.variants[coding]
+
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None and is_etag_matched(if_none_match, variant.headers[hdrs.ETAG]):
+            return Response(status=304, headers=variant.headers)  # noqa: WPS432
+
+        return Response(body=variant.body, headers=variant.headers)
+
+    async def _encode(self) -> _EncodedConstant:
+        if self._encode_lock is None:
+            self._encode_lock = asyncio.Lock()
+
+        # NOTE: the concurrent requests wait for a single encoding
+        async with self._encode_lock:
+            if self._encoded_constant is not None:
+                return self._encoded_constant
+
+            version = self._version
+
+            data = self._data
+            if callable(data):
+                data = data()
+                if inspect.isawaitable(data):
+                    data = await data
+
+            encoded_constant = await asyncio.get_running_loop().run_in_executor(None, self._encode_variants, data)
+            # NOTE: the data invalidated while it was encoded is not cached
+            if version == self._version:
+                self._encoded_constant = encoded_constant
+
+            return encoded_constant
+
+    def _encode_variants(self, data: Any) -> _EncodedConstant:
+        body, content_type = _encode_data(data, self._content_type)
+        digest = hashlib.blake2b(body, digest_size=ETAG_DIGEST_SIZE).hexdigest()
+        compressed_bodies = self._compress_body(body)
+
+        identity_variant = self._create_variant(body, content_type, f'"{digest}"', None, compressed_bodies)
+        variants = {IDENTITY_CODING: identity_variant}
+        for coding, compressed_body in compressed_bodies.items():
+            # NOTE: the representations differ - every coding has its own strong ETag
+            etag = f'"{digest}-{coding}"'
+            variants[coding] = self._create_variant(compressed_body, content_type, etag, coding, compressed_bodies)
+
+        return _EncodedConstant(variants=variants, codings=tuple(compressed_bodies))
+
+    def _compress_body(self, body: bytes) -> Dict[str, bytes]:
+        compressed_bodies: Dict[str, bytes] = {}
+        if len(body) < self._compression_min_size:
+            return compressed_bodies
+
+        for coding in self._codings:
+            compressed_body = _create_body_compressor(coding, level=None)(body)
+            if len(compressed_body) < len(body):
+                compressed_bodies[coding] = compressed_body
+
+        return compressed_bodies
+
+    def _create_variant(
+            self,
+            body: bytes,
+            content_type: str,
+            etag: str,
+            coding: Optional[str],
+            compressed_bodies: Dict[str, bytes],
+    ) -> _EncodedVariant:
+        headers: CIMultiDict[str] = CIMultiDict(self._headers or {})
+        headers[hdrs.CONTENT_TYPE] = content_type
+        headers[hdrs.ETAG] = etag
+        if compressed_bodies:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if coding is not None:
+            headers[hdrs.CONTENT_ENCODING] = coding
+
+        return _EncodedVariant(body=body, headers=CIMultiDictProxy(headers))
@@ -0,0 +1,236 @@
+import codecs
+import csv
+import io
+from collections import deque
+from typing import Any, cast, Deque, Dict, Final, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from aiohttp.abc import Request
+
+from rapidy._client_errors import _normalize_errors, BodyDataSizeExceedError, ExtractCsvError
+from rapidy._extractors import _read_request_buffer_chunk
+from rapidy._fields import ModelField
+from rapidy._validators import _validate_data_by_field
+from rapidy.web_exceptions import HTTPValidationFailure
+
+__all__ = (
+    'CsvRowsReader',
+    'extract_body_csv',
+)
+
+CSV_READ_CHUNK_SIZE: Final[int] = 65536
+
+_Loc = Tuple[Any, ...]
+_RowValidationResult = Tuple[Any, List[Dict[str, Any]]]
+
+RowT = TypeVar('RowT')
+
+
+class CsvRowsReader(Generic[RowT]):
+    def __init__(
+            self,
+            request: Request,
+            *,
+            max_size: int,
+            row_field: ModelField,
+            batch_size: int,
+            columns: Optional[Sequence[str]],
+            has_header: bool,
+            delimiter: str,
+            quotechar: str,
+            skip_invalid_rows: bool,
+    ) -> None:
+        self._request = request
+        self._available_bytes_to_read = max_size
+        self._max_size = max_size
+        self._row_field = row_field
+        self._batch_size = batch_size
+        self._columns = columns
+        self._has_header = has_header
+        self._delimiter = delimiter
+        self._quotechar = quotechar
+        self._skip_invalid_rows = skip_invalid_rows
+
+        self._decoder = codecs.getincrementaldecoder(request.charset or 'utf-8')()
+        # NOTE: the text after the last complete record, split by the read chunks
+        self._text_chunks: List[str] = []
+        self._is_quoted = False
+        self._records: Deque[Tuple[int, List[str]]] = deque()
+        self._num_of_records = 0
+        self._is_eof = False
+
+        self.errors: List[Dict[str, Any]] = []
+
+    def __aiter__(self) -> 'CsvRowsReader[RowT]':
+        return self
+
+    async def __anext__(self) -> List[RowT]:
+        batch: List[RowT] = []
+        batch_errors: List[Dict[str, Any]] = []
+
+        while len(batch) < self._batch_size:
+            record = await self._next_record()
+            if record is None:
+                break
+
+            row_num, row = record
+            row_data, row_errors = self._validate_row(row_num, row)
+            if row_errors:
+                batch_errors.extend(row_errors)
+            else:
+                batch.append(row_data)
+
+        if batch_errors:
+            batch_errors = _normalize_errors(batch_errors)
+            self.errors.extend(batch_errors)
+            if not self._skip_invalid_rows:
+                self._raise_validation_failure(batch_errors)
+
+        if not batch:
+            raise StopAsyncIteration
+
+        return batch
+
+    def _validate_row(self, row_num: int, row: List[str]) -> _RowValidationResult:
+        loc: _Loc = (self._row_field.rapid_param_type, row_num)
+
+        columns = cast(Sequence[str], self._columns)
+        if len(row) != len(columns):
+            csv_error = f'row has `{len(row)}` columns, expected `{len(columns)}`'
+            return None, [ExtractCsvError(csv_error=csv_error).get_error_info(loc=loc)]
+
+        return _validate_data_by_field(
+            raw_data=dict(zip(columns, row)),
+            loc=loc,
+            model_field=self._row_field,
+            values={},
+        )
+
+    async def _next_record(self) -> Optional[Tuple[int, List[str]]]:
+        while not self._records:
+            if self._is_eof:
+                return None
+
+            await self._read_records()
+
+        return self._records.popleft()
+
+    async def _read_records(self) -> None:
+        chunk = await self._read_chunk()
+        if chunk:
+            complete_text = self._pop_complete_records_text(self._decoder.decode(chunk))
+        else:
+            self._is_eof = True
+            self._text_chunks.append(self._decoder.decode(b'', final=True))
+            complete_text = ''.join(self._text_chunks)
+            self._text_chunks = []
+
+        if not complete_text:
+            return
+
+        csv_reader = csv.reader(
+            io.StringIO(complete_text, newline=''),
+            delimiter=self._delimiter,
+            quotechar=self._quotechar,
+        )
+        try:
+            self._add_records(csv_reader)
+        except csv.Error as csv_err:
+            loc: _Loc = (self._row_field.rapid_param_type, self._num_of_records + 1)
+            self._raise_validation_failure([ExtractCsvError(csv_error=csv_err).get_error_info(loc=loc)])
+
+    def _add_records(self, rows: Iterable[List[str]]) -> None:
+        for row in rows:
+            self._add_record(row)
+
+    def _add_record(self, row: List[str]) -> None:
+        if not row:  # NOTE: empty lines are skipped
+            return
+
+        self._num_of_records += 1
+
+        if self._num_of_records == 1 and self._has_header:
+            if self._columns is None:
+                self._columns = row
+            return
+
+        self._records.append((self._num_of_records, row))
+
+    def _pop_complete_records_text(self, text: str) -> str:
+        # NOTE: a line break is the end of the record only outside of a quoted field,
+        # the incomplete record stays in the buffer until the next chunk is read.
+        # The quote state is kept between the chunks - every chunk is scanned only once.
+        end_of_records = -1
+        line_start = 0
+
+        while True:
+            line_end = text.find('\n', line_start)
+            if line_end == -1:
+                break
+
+            self._toggle_quoted(text.count(self._quotechar, line_start, line_end))
+            line_start = line_end + 1
+            if not self._is_quoted:
+                end_of_records = line_start
+
+        self._toggle_quoted(text.count(self._quotechar, line_start))
+
+        if end_of_records == -1:
+            self._text_chunks.append(text)
+            return ''
+
+        self._text_chunks.append(text[:end_of_records])
+        complete_text = ''.join(self._text_chunks)
+        self._text_chunks = [text[end_of_records:]]
+        return complete_text
+
+    def _toggle_quoted(self, num_of_quotes: int) -> None:
+        if num_of_quotes % 2:
+            self._is_quoted = not self._is_quoted
+
+    async def _read_chunk(self) -> bytes:
+        if self._available_bytes_to_read <= 0:
+            is_body_size_exceeded = bool(await _read_request_buffer_chunk(1, self._request))
+            if is_body_size_exceeded:
+                loc: _Loc = (self._row_field.rapid_param_type,)
+                error = BodyDataSizeExceedError(body_max_size=self._max_size).get_error_info(loc=loc)
+                self._raise_validation_failure([error])
+            return b''
+
+        chunk = await _read_request_buffer_chunk(
+            min(CSV_READ_CHUNK_SIZE, self._available_bytes_to_read),
+            self._request,
+        )
+        self._available_bytes_to_read -= len(chunk)
+        return chunk
+
+    def _raise_validation_failure(self, errors: List[Dict[str, Any]]) -> None:
+        raise HTTPValidationFailure(
+            validation_failure_field_name=self._request._cache['errors_response_field_name'],  # FIXME
+            errors=_normalize_errors(errors),
+            errors_max_count=self._request._cache['errors_max_count'],  # FIXME
+            error_msg_max_length=self._request._cache['error_msg_max_length'],  # FIXME
+        )
+
+
+async def extract_body_csv(
+        request: Request,
+        max_size: int,
+        row_field: ModelField,
+        batch_size: int,
+        columns: Optional[Sequence[str]],
+        has_header: bool,
+        delimiter: str,
+        quotechar: str,
+        skip_invalid_rows: bool,
+) -> CsvRowsReader[Any]:
+    return CsvRowsReader(
+        request,
+        max_size=max_size,
+        row_field=row_field,
+        batch_size=batch_size,
+        columns=columns,
+        has_header=has_header,
+        delimiter=delimiter,
+        quotechar=quotechar,
+        skip_invalid_rows=skip_invalid_rows,
+    )
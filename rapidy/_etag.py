@@ -0,0 +1,111 @@
+import hashlib
+import inspect
+from functools import wraps
+from typing import Any, Awaitable, Callable, Final, Optional, Union
+
+from aiohttp.web_request import Request
+from aiohttp.web_response import Response, StreamResponse
+from multidict import CIMultiDict
+
+from rapidy import hdrs
+from rapidy.typedefs import Handler
+from rapidy.web_exceptions import HTTPNotModified
+
+__all__ = (
+    'ETagVersion',
+    'check_etag',
+    'create_etag_wrapper',
+    'is_etag_matched',
+)
+
+ETAG_CACHE_KEY: Final[str] = 'etag'
+ETAG_DIGEST_SIZE: Final[int] = 16
+
+ETagVersion = Callable[[Request], Union[str, Awaitable[str]]]
+
+# NOTE: RFC 9110 - the headers that are sent in the 304 response if they would be sent in the 200 response
+_NOT_MODIFIED_HEADERS: Final = (hdrs.CACHE_CONTROL, hdrs.CONTENT_LOCATION, hdrs.EXPIRES, hdrs.VARY)
+
+
+def is_etag_matched(if_none_match: str, etag: str) -> bool:
+    # NOTE: `If-None-Match` uses the weak comparison
+    etag = etag[2:] if etag.startswith('W/') else etag
+    for request_etag in if_none_match.split(','):
+        request_etag = request_etag.strip()
+        if request_etag.startswith('W/'):
+            request_etag = request_etag[2:]
+
+        if request_etag in ('*', etag):
+            return True
+
+    return False
+
+
+def check_etag(request: Request, version: str) -> str:
+    if '"' in version:
+        raise ValueError('ETag version must not contain `"`.')
+
+    etag = f'"{version}"'
+    request._cache[ETAG_CACHE_KEY] = etag  # FIXME
+
+    if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+    if if_none_match is not None and is_etag_matched(if_none_match, etag):
+        raise HTTPNotModified(headers={hdrs.ETAG: etag})
+
+    return etag
+
+
+def _create_body_etag(body: bytes) -> str:
+    return '"{0}"'.format(hashlib.blake2b(body, digest_size=ETAG_DIGEST_SIZE).hexdigest())
+
+
+def _get_resp_etag(request: Request, resp: StreamResponse) -> Optional[str]:
+    resp_etag: Optional[str] = request._cache.get(ETAG_CACHE_KEY)  # FIXME
+    if resp_etag is not None:
+        return resp_etag
+
+    if not isinstance(resp, Response) or not isinstance(resp.body, bytes):
+        return None
+
+    return _create_body_etag(resp.body)
+
+
+def _create_not_modified(resp: StreamResponse, etag: str) -> HTTPNotModified:
+    headers: CIMultiDict[str] = CIMultiDict({hdrs.ETAG: etag})
+    for header_name in _NOT_MODIFIED_HEADERS:
+        if header_name in resp.headers:
+            headers[header_name] = resp.headers[header_name]
+
+    return HTTPNotModified(headers=headers)
+
+
+def create_etag_wrapper(handler: Handler, etag: Union[bool, ETagVersion]) -> Handler:
+    @wraps(handler)
+    async def inner(request: Request) -> StreamResponse:
+        if request.method not in (hdrs.METH_GET, hdrs.METH_HEAD):
+            return await handler(request)
+
+        if callable(etag):
+            # NOTE: the cheap version is compared before the handler is called - the response is not rendered
+            version: Any = etag(request)
+            if inspect.isawaitable(version):
+                version = await version
+            check_etag(request, version)
+
+        resp = await handler(request)
+        if resp.prepared or resp.status != 200 or hdrs.ETAG in resp.headers:  # noqa: WPS432
+            return resp
+
+        resp_etag = _get_resp_etag(request, resp)
+        if resp_etag is None:
+            return resp
+
+        resp.headers[hdrs.ETAG] = resp_etag
+
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None and is_etag_matched(if_none_match, resp_etag):
+            raise _create_not_modified(resp, resp_etag)
+
+        return resp
+
+    return inner
@@ -1,5 +1,6 @@
+import asyncio
 from json import JSONDecodeError
-from typing import cast, Dict, Optional, Tuple, Union
+from typing import Any, Awaitable, cast, Dict, Final, Mapping, Optional, Tuple, TypeVar, Union
 from urllib.parse import parse_qsl, unquote
 
 from aiohttp import BodyPartReader, MultipartReader
@@ -11,13 +12,22 @@ from multidict import MultiDict
 from rapidy import hdrs
 from rapidy._client_errors import (
     BodyDataSizeExceedError,
+    ExtractBodyDecodeError,
     ExtractJsonError,
     ExtractMultipartError,
     ExtractMultipartPartError,
+    UnsupportedMediaTypeError,
 )
+from rapidy._json_limits import JsonLimits
 from rapidy._parsers import parse_multi_params
+from rapidy.constants import BODY_MIN_READ_RATE_GRACE_PERIOD
 from rapidy.media_types import ApplicationJSON
 from rapidy.typedefs import DictStrAny, DictStrListAny, DictStrListStr, DictStrStr
+from rapidy.web_exceptions import HTTPRequestTimeout
+
+T = TypeVar('T')
+
+BODY_READ_STARTED_AT_CACHE_KEY: Final[str] = 'body_read_started_at'
 
 
 async def extract_path(request: Request) -> DictStrStr:
@@ -60,11 +70,20 @@ async def extract_body_json(
         request: Request,
         max_size: int,
         json_decoder: JSONDecoder,
+        json_limits: Optional[JsonLimits] = None,
 ) -> DictStrAny:
     if not request.body_exists:
         return {}
 
     text_body = await extract_body_text(request=request, max_size=max_size)
+
+    if json_limits is None:
+        json_limits = _get_request_option(request, 'json_limits')
+
+    if json_limits is not None:
+        # NOTE: the structure is checked before decoding - the decoder and the validation work is bounded
+        json_limits.check(text_body)
+
     try:
         return json_decoder(text_body)
     except JSONDecodeError as json_decode_err:
@@ -129,7 +148,7 @@ async def extract_body_multi_part(
     # NOTE: For multipart, the body length exceed is checked for useful information only
 
     while True:
-        part = await _get_next_part(multipart_reader=multipart_reader, current_part_num=part_num)
+        part = await _get_next_part(request=request, multipart_reader=multipart_reader, current_part_num=part_num)
         if part is None:
             break
         if not isinstance(part, BodyPartReader):  # pragma: no cover  # NOTE: Scenario is impossible.
@@ -138,6 +157,7 @@ async def extract_body_multi_part(
         part_name = _get_part_name(part=part, current_part_num=part_num)
 
         part_data, updated_available_bytes_to_read = await _get_part_data(
+            request=request,
             part=part,
             available_bytes_to_read=available_bytes_to_read,
             body_max_size=max_size,
@@ -162,6 +182,30 @@ async def extract_body_multi_part(
     return parse_multi_params(data, parse_as_array=duplicated_attrs_parse_as_array)
 
 
+async def extract_body_by_content_type(request: Request, max_size: int) -> Any:
+    if not request.body_exists:
+        return {}
+
+    media_type = request.content_type
+
+    # NOTE: the dispatch table is resolved once on application freeze - here is only a dict lookup
+    body_extractor = request.app.body_decoders.resolve(media_type)  # type: ignore[attr-defined]
+    if body_extractor is None:
+        raise UnsupportedMediaTypeError(media_type=media_type)
+
+    return await body_extractor(request=request, max_size=max_size)
+
+
+async def extract_body_params_by_content_type(request: Request, max_size: int) -> Mapping[str, Any]:
+    body_data = await extract_body_by_content_type(request=request, max_size=max_size)
+
+    # NOTE: the params are taken from the body by name - text, bytes, arrays and scalars do not have them
+    if not isinstance(body_data, Mapping):
+        raise ExtractBodyDecodeError(media_type=request.content_type, decode_err_msg='the body is not an object')
+
+    return body_data
+
+
 async def _get_multipart_reader(request: Request) -> MultipartReader:
     try:
         reader = await request.multipart()
@@ -174,6 +218,7 @@ async def _get_multipart_reader(request: Request) -> MultipartReader:
 
 
 async def _get_part_data(
+        request: Request,
         part: BodyPartReader,
         available_bytes_to_read: int,
         body_max_size: int,
@@ -181,7 +226,7 @@ async def _get_part_data(
     part_data = bytearray()
 
     while True:
-        chunk_data, chunk_len = await _read_part_chunk(part)
+        chunk_data, chunk_len = await _read_part_chunk(request, part)
 
         if chunk_len == 0:
             break
@@ -199,6 +244,15 @@ async def _get_part_data(
 
 
 async def _get_next_part(
+        request: Request,
+        multipart_reader: MultipartReader,
+        current_part_num: int,
+) -> Optional[Union[MultipartReader, BodyPartReader]]:
+    # NOTE: the deadline wraps the part parsing - the timeout error is not reported as an invalid part
+    return await _wait_body_read(request, _read_next_part(multipart_reader, current_part_num))
+
+
+async def _read_next_part(
         multipart_reader: MultipartReader,
         current_part_num: int,
 ) -> Optional[Union[MultipartReader, BodyPartReader]]:
@@ -231,11 +285,11 @@ def _get_part_name(
     return part_name
 
 
-async def _read_part_chunk(part: BodyPartReader) -> Tuple[bytes, int]:
+async def _read_part_chunk(request: Request, part: BodyPartReader) -> Tuple[bytes, int]:
     if part._at_eof:  # noqa:  WPS437
         return b'', 0
 
-    chunk_data = await part.read_chunk(part.chunk_size)
+    chunk_data = await _wait_body_read(request, part.read_chunk(part.chunk_size))
     chunk_len = len(chunk_data)
 
     return chunk_data, chunk_len
@@ -265,11 +319,63 @@ async def _read_request_buffer_chunk(n: int, request: Request) -> bytes:  # prag
         raise reader._exception  # noqa:  WPS437
 
     while not reader._buffer and not reader._eof:  # noqa:  WPS437
-        await reader._wait('BodyExtractor._read_request_buffer_chunk')  # noqa:  WPS437
+        await _wait_body_read(
+            request,
+            reader._wait('BodyExtractor._read_request_buffer_chunk'),  # noqa:  WPS437
+        )
 
     return reader._read_nowait(n)  # noqa:  WPS437
 
 
+def _get_request_option(request: Request, option_name: str) -> Any:
+    # NOTE: the route option overrides the option of the application, the sub application overrides the parent one
+    match_info = request.match_info
+    option_value = getattr(match_info.route, option_name, None)
+    if option_value is not None:
+        return option_value
+
+    for app in reversed(match_info.apps):
+        option_value = getattr(app, option_name, None)
+        if option_value is not None:
+            return option_value
+
+    return None
+
+
+def _get_body_read_deadline(request: Request) -> Optional[float]:
+    body_read_timeout: Optional[float] = _get_request_option(request, 'body_read_timeout')
+    body_min_read_rate: Optional[float] = _get_request_option(request, 'body_min_read_rate')
+    if body_read_timeout is None and body_min_read_rate is None:
+        return None
+
+    started_at: float = request._cache.setdefault(  # FIXME: cache management should be centralized
+        BODY_READ_STARTED_AT_CACHE_KEY,
+        asyncio.get_running_loop().time(),
+    )
+
+    deadline = float('inf')
+    if body_read_timeout is not None:
+        deadline = started_at + body_read_timeout
+
+    if body_min_read_rate is not None:
+        # NOTE: the next data must arrive before the average rate falls below the minimum
+        received_bytes = request.content.total_bytes
+        deadline = min(deadline, started_at + BODY_MIN_READ_RATE_GRACE_PERIOD + received_bytes / body_min_read_rate)
+
+    return deadline
+
+
+async def _wait_body_read(request: Request, awaitable: Awaitable[T]) -> T:
+    deadline = _get_body_read_deadline(request)
+    if deadline is None:
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(awaitable, timeout=deadline - asyncio.get_running_loop().time())
+    except asyncio.TimeoutError:
+        raise HTTPRequestTimeout(text='Request body was not received in time')
+
+
 async def _read_full_body(request: Request, max_size: int) -> bytes:
     if request._read_bytes is None:  # noqa:  WPS437
         available_bytes_to_read = max_size
@@ -74,6 +74,10 @@ if PYDANTIC_V1:  # noqa: C901
             if rapid_param_type:
                 self.rapid_param_type = rapid_param_type
 
+        def is_plain_type(self, type_: Type[Any]) -> bool:
+            # NOTE: a field with constraints has a constrained type
+            return self.outer_type_ is type_ and not self.pre_validators and not self.post_validators
+
     def create_field(
             name: str,
             type_: Type[Any],
@@ -137,6 +141,10 @@ elif PYDANTIC_V2:
         def type_(self) -> Any:
             return self.field_info.annotation
 
+        def is_plain_type(self, type_: Type[Any]) -> bool:
+            # NOTE: the constraints and the validators of a field are stored in its metadata
+            return self.field_info.annotation is type_ and not self.field_info.metadata
+
         def __post_init__(self) -> None:
             self._type_adapter: TypeAdapter[Any] = TypeAdapter(Annotated[self.field_info.annotation, self.field_info])
 
@@ -154,7 +162,7 @@ elif PYDANTIC_V2:
                 )
             except ValidationError as exc:
                 return None, _regenerate_error_with_loc(
-                    errors=exc.errors(),
+                    errors=exc.errors(include_url=False, include_input=False),
                     loc_prefix=loc,
                 )
 
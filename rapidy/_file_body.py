@@ -0,0 +1,283 @@
+import asyncio
+import base64
+import hashlib
+import os
+import tempfile
+import zlib
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType, TracebackType
+from typing import Any, cast, Dict, Final, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+from aiohttp.abc import Request
+
+from rapidy import hdrs
+from rapidy._client_errors import BodyDataSizeExceedError, ExtractFileError
+from rapidy._extractors import _read_request_buffer_chunk
+
+__all__ = (
+    'UploadedFile',
+    'extract_body_file',
+    'FILE_BODY_CHUNK_SIZE',
+    'SUPPORTED_FILE_DIGESTS',
+)
+
+TEMPORARY_FILES_CACHE_KEY: Final[str] = 'temporary_files'
+
+CRC32_DIGEST_NAME: Final[str] = 'crc32'
+
+FILE_BODY_CHUNK_SIZE: Final[int] = 262144
+
+SUPPORTED_FILE_DIGESTS: Final[Tuple[str, ...]] = (
+    *sorted(name for name in hashlib.algorithms_guaranteed if not name.startswith('shake_')),
+    CRC32_DIGEST_NAME,
+)
+
+# NOTE: RFC 3230 digest algorithm names
+DIGEST_HEADER_ALGORITHMS: Final[Mapping[str, str]] = MappingProxyType({
+    'md5': 'md5',
+    'sha': 'sha1',
+    'sha-256': 'sha256',
+    'sha-512': 'sha512',
+})
+
+
+class _Crc32:
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data: bytes) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def digest(self) -> bytes:
+        return self._value.to_bytes(4, 'big')
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+
+def _create_hash(digest_name: str) -> Any:
+    if digest_name == CRC32_DIGEST_NAME:
+        return _Crc32()
+
+    return hashlib.new(digest_name)
+
+
+class UploadedFile:
+    def __init__(self, path: Path, size: int, digests: Dict[str, str], *, is_temporary: bool) -> None:
+        self._path = path
+        self._size = size
+        self._digests = digests
+        self._is_temporary = is_temporary
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def digests(self) -> Dict[str, str]:
+        return self._digests
+
+    def hexdigest(self, digest_name: str) -> str:
+        return self._digests[digest_name]
+
+    async def move_to(self, path: Union[str, 'os.PathLike[str]']) -> Path:
+        # NOTE: the moved file is no longer temporary and is not removed after the request
+        target_path = Path(path)
+        await asyncio.get_running_loop().run_in_executor(None, os.replace, self._path, target_path)
+        self._path = target_path
+        self._is_temporary = False
+        return target_path
+
+    def remove_temporary(self) -> None:
+        if self._is_temporary:
+            self._is_temporary = False
+            _remove_file(self._path)
+
+    def __repr__(self) -> str:
+        return f'<UploadedFile path={str(self._path)!r} size={self._size}>'
+
+
+def _remove_file(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:  # pragma: no cover
+        pass
+
+
+def _decode_digest(encoded_digest: str) -> bytes:
+    try:
+        return base64.b64decode(encoded_digest.strip(), validate=True)
+    except ValueError:
+        raise ExtractFileError(file_error='invalid digest header')
+
+
+def _parse_digest_headers(request: Request) -> Dict[str, bytes]:
+    expected_digests: Dict[str, bytes] = {}
+
+    content_md5 = request.headers.get(hdrs.CONTENT_MD5)
+    if content_md5 is not None:
+        expected_digests['md5'] = _decode_digest(content_md5)
+
+    for digest_value in request.headers.getall(hdrs.DIGEST, ()):
+        for instance_digest in digest_value.split(','):
+            algorithm, _, encoded_digest = instance_digest.strip().partition('=')
+            digest_name = DIGEST_HEADER_ALGORITHMS.get(algorithm.lower())
+            if digest_name is not None:
+                expected_digests[digest_name] = _decode_digest(encoded_digest)
+
+    return expected_digests
+
+
+class _FileWriter:
+    def __init__(self, fd: int, digest_names: Sequence[str]) -> None:
+        self._file = os.fdopen(fd, 'wb')
+        self._loop = asyncio.get_running_loop()
+        self._pending_write: Optional['asyncio.Future[None]'] = None
+        self.hashes = {digest_name: _create_hash(digest_name) for digest_name in digest_names}
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc: Optional[BaseException],
+            traceback: Optional[TracebackType],
+    ) -> None:
+        # NOTE: the file is closed only after the write in flight is finished, even if the reading failed
+        await self.wait_pending_write()
+        await self._loop.run_in_executor(None, self._file.close)
+
+    async def write(self, chunk: bytes) -> None:
+        # NOTE: one write is in flight - the next chunk is read from the network while the previous one is written
+        await self.wait_pending_write()
+        self._pending_write = self._loop.run_in_executor(None, self._write, chunk)
+
+    async def wait_pending_write(self) -> None:
+        pending_write = self._pending_write
+        if pending_write is not None:
+            self._pending_write = None
+            await pending_write
+
+    def _write(self, chunk: bytes) -> None:
+        # NOTE: the data is hashed while it is written - the body is passed over once
+        self._file.write(chunk)
+        for body_hash in self.hashes.values():
+            body_hash.update(chunk)
+
+
+async def _stream_body_to_file(
+        request: Request,
+        writer: _FileWriter,
+        *,
+        max_size: int,
+        chunk_size: int,
+) -> int:
+    size = 0
+    buffer = bytearray()
+
+    while True:
+        chunk = await _read_request_buffer_chunk(max(chunk_size - len(buffer), 1), request)
+        size += len(chunk)
+        if size > max_size:
+            raise BodyDataSizeExceedError(body_max_size=max_size)
+
+        buffer.extend(chunk)
+        if chunk and len(buffer) < chunk_size:
+            continue
+
+        if buffer:
+            await writer.write(bytes(buffer))
+            buffer.clear()
+
+        if not chunk:
+            return size
+
+
+async def _write_body_to_file(
+        request: Request,
+        fd: int,
+        *,
+        digest_names: Sequence[str],
+        expected_digests: Mapping[str, bytes],
+        max_size: int,
+        chunk_size: int,
+) -> Tuple[int, Dict[str, Any]]:
+    writer = _FileWriter(fd, digest_names)
+    async with writer:
+        size = await _stream_body_to_file(request, writer, max_size=max_size, chunk_size=chunk_size)
+
+    for digest_name, expected_digest in expected_digests.items():
+        if writer.hashes[digest_name].digest() != expected_digest:
+            raise ExtractFileError(file_error=f'`{digest_name}` digest does not match the body')
+
+    return size, writer.hashes
+
+
+async def extract_body_file(
+        request: Request,
+        max_size: int,
+        directory: Optional[str],
+        digest_names: Sequence[str],
+        verify_digest_headers: bool,
+        chunk_size: int,
+) -> UploadedFile:
+    expected_digests = _parse_digest_headers(request) if verify_digest_headers else {}
+
+    loop = asyncio.get_running_loop()
+    fd, raw_path = await loop.run_in_executor(None, tempfile.mkstemp, None, None, directory)
+    path = Path(raw_path)
+
+    try:
+        size, hashes = await _write_body_to_file(
+            request,
+            fd,
+            digest_names=tuple(dict.fromkeys((*digest_names, *expected_digests))),
+            expected_digests=expected_digests,
+            max_size=max_size,
+            chunk_size=chunk_size,
+        )
+    except (Exception, asyncio.CancelledError):
+        await loop.run_in_executor(None, _remove_file, path)
+        raise
+
+    uploaded_file = UploadedFile(
+        path=path,
+        size=size,
+        digests={name: hashes[name].hexdigest() for name in digest_names},
+        is_temporary=directory is None,
+    )
+    if directory is None:
+        _add_temporary_file(request, uploaded_file)
+
+    return uploaded_file
+
+
+def _add_temporary_file(request: Request, uploaded_file: UploadedFile) -> None:
+    temporary_files: Optional[List[UploadedFile]] = request._cache.get(TEMPORARY_FILES_CACHE_KEY)  # FIXME
+    if temporary_files is None:
+        temporary_files = []
+        request._cache[TEMPORARY_FILES_CACHE_KEY] = temporary_files  # FIXME
+
+        # NOTE: the request task ends after the response is sent - the handler may respond with the file itself
+        request_task = cast('asyncio.Task[Any]', asyncio.current_task())
+        request_task.add_done_callback(partial(_remove_temporary_files, temporary_files))
+
+    temporary_files.append(uploaded_file)
+
+
+def _remove_temporary_files(temporary_files: List[UploadedFile], request_task: 'asyncio.Task[Any]') -> None:
+    try:
+        request_task.get_loop().run_in_executor(None, _remove_uploaded_files, temporary_files)
+    except RuntimeError:  # pragma: no cover  # NOTE: the loop or its executor is already closed
+        _remove_uploaded_files(temporary_files)
+
+
+def _remove_uploaded_files(uploaded_files: List[UploadedFile]) -> None:
+    for uploaded_file in uploaded_files:
+        uploaded_file.remove_temporary()
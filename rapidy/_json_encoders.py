@@ -0,0 +1,47 @@
+import json
+from typing import Any, Callable, Optional
+
+from rapidy.constants import PYDANTIC_V1, PYDANTIC_V2
+
+__all__ = (
+    'JsonBytesEncoder',
+    'create_json_bytes_encoder',
+    'encode_json_errors',
+)
+
+JsonBytesEncoder = Callable[[Any], bytes]
+
+
+if PYDANTIC_V1:
+    from pydantic.json import pydantic_encoder
+
+    def create_json_bytes_encoder(model: Optional[Any] = None) -> JsonBytesEncoder:  # noqa: WPS440
+        # NOTE: pydantic v1 has no compiled serializers - the model would be ignored silently, so it is rejected
+        if model is not None:
+            raise TypeError('`response_model` is supported only with pydantic v2.')
+
+        def encode(data: Any) -> bytes:
+            return json.dumps(data, default=pydantic_encoder, separators=(',', ':')).encode()
+
+        return encode
+
+    def encode_json_errors(errors: Any) -> bytes:  # noqa: WPS440
+        return json.dumps(errors, default=str, separators=(',', ':')).encode()
+
+elif PYDANTIC_V2:
+    import pydantic_core
+    from pydantic import TypeAdapter
+
+    def create_json_bytes_encoder(model: Optional[Any] = None) -> JsonBytesEncoder:  # noqa: WPS440
+        if model is None:
+            return pydantic_core.to_json
+
+        # NOTE: the serializer is built once and writes json bytes without an intermediate dict
+        return TypeAdapter(model).dump_json
+
+    def encode_json_errors(errors: Any) -> bytes:  # noqa: WPS440
+        # NOTE: the error context may contain any objects (e.g. exceptions) - they are rendered as strings
+        return pydantic_core.to_json(errors, serialize_unknown=True)
+
+else:
+    raise Exception
@@ -0,0 +1,109 @@
+import json
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Final, List, Mapping, Optional, Pattern
+
+from rapidy._client_errors import ExtractJsonLimitError
+
+__all__ = (
+    'JsonLimits',
+)
+
+# NOTE: json decoder can't parse deeper documents anyway - it is the limit of the structure scan
+MAX_JSON_DEPTH: Final[int] = 1000
+
+_ASCII_SIZE: Final[int] = 128
+
+_JSON_STRING_RE: Final[Pattern[str]] = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# NOTE: `str.translate` deletes everything except brackets and commas in a single pass
+_JSON_NOT_STRUCTURAL_CHARS: Final[Mapping[int, None]] = MappingProxyType(dict.fromkeys(
+    char_code for char_code in range(_ASCII_SIZE) if chr(char_code) not in '{[,]}'
+))
+
+
+@dataclass(frozen=True)
+class JsonLimits:
+    max_depth: Optional[int] = None
+    max_keys: Optional[int] = None
+    max_array_length: Optional[int] = None
+    max_string_length: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        for limit_name in ('max_depth', 'max_keys', 'max_array_length', 'max_string_length'):
+            limit = getattr(self, limit_name)
+            if limit is not None and limit < 1:
+                raise ValueError(f'JsonLimits `{limit_name}` must be greater than 0.')
+
+    def check(self, json_text: str) -> None:
+        # NOTE: every check is a single pass over the text - the cost is bounded by the body size, not by its nesting
+        if self.max_string_length is not None:
+            _check_string_length(json_text, self.max_string_length)
+
+        if self.max_depth is None and self.max_keys is None and self.max_array_length is None:
+            return
+
+        # NOTE: strings, numbers and literals can't change the structure - only brackets and commas are left
+        structure = _JSON_STRING_RE.sub('', json_text).translate(_JSON_NOT_STRUCTURAL_CHARS)
+        _JsonStructureScanner(self).scan(structure)
+
+
+class _JsonStructureScanner:
+    def __init__(self, json_limits: JsonLimits) -> None:
+        self._max_depth = json_limits.max_depth if json_limits.max_depth is not None else MAX_JSON_DEPTH
+        self._max_keys = json_limits.max_keys
+        self._max_array_length = json_limits.max_array_length
+
+    def scan(self, structure: str) -> None:
+        # NOTE: one pass over brackets and commas, the stacks keep the outer containers and their items
+        outer_brackets: List[str] = []
+        outer_num_of_items: List[int] = []
+        bracket = ''
+        num_of_items = 0
+
+        for char in structure:
+            if char == ',':
+                num_of_items += 1
+            elif char in '[{':
+                if len(outer_brackets) >= self._max_depth:
+                    raise ExtractJsonLimitError(limit_error=f'nesting depth exceeds the allowed `{self._max_depth}`')
+
+                outer_brackets.append(bracket)
+                outer_num_of_items.append(num_of_items)
+                bracket = char
+                num_of_items = 1  # NOTE: `[1]` and `[]` look the same, the limits are at least 1
+            elif char in ']}':
+                self._check_num_of_items(bracket, num_of_items)
+                if not outer_brackets:
+                    return  # NOTE: invalid JSON - the decoder reports the error
+
+                bracket = outer_brackets.pop()
+                num_of_items = outer_num_of_items.pop()
+
+    def _check_num_of_items(self, bracket: str, num_of_items: int) -> None:
+        if bracket == '[':
+            if self._max_array_length is not None and num_of_items > self._max_array_length:
+                raise ExtractJsonLimitError(
+                    limit_error=f'array length exceeds the allowed `{self._max_array_length}`',
+                )
+
+        elif self._max_keys is not None and num_of_items > self._max_keys:
+            raise ExtractJsonLimitError(limit_error=f'object key count exceeds the allowed `{self._max_keys}`')
+
+
+def _check_string_length(json_text: str, max_string_length: int) -> None:
+    for string_match in _JSON_STRING_RE.finditer(json_text):
+        json_string = string_match.group()
+        if len(json_string) - 2 > max_string_length and _get_string_length(json_string) > max_string_length:
+            raise ExtractJsonLimitError(limit_error=f'string length exceeds the allowed `{max_string_length}`')
+
+
+def _get_string_length(json_string: str) -> int:
+    # NOTE: only the strings that are too long with escape sequences are decoded to get their real length
+    if '\\' not in json_string:
+        return len(json_string) - 2
+
+    try:
+        return len(json.loads(json_string))
+    except ValueError:
+        return 0  # NOTE: invalid JSON - the decoder reports the error
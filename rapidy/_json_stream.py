@@ -0,0 +1,117 @@
+from types import TracebackType
+from typing import Any, AsyncIterable, Final, Optional, Type
+
+from aiohttp.abc import AbstractStreamWriter, BaseRequest
+from aiohttp.typedefs import LooseHeaders
+from aiohttp.web_response import StreamResponse
+
+from rapidy._json_encoders import create_json_bytes_encoder, JsonBytesEncoder
+from rapidy.media_types import ApplicationJSON, ApplicationNDJSON
+
+__all__ = (
+    'ClosingAsyncIterable',
+    'JsonStreamFormat',
+    'JsonStreamResponse',
+)
+
+JSON_STREAM_CHUNK_SIZE: Final[int] = 65536
+
+
+class JsonStreamFormat:
+    ndjson: Final[str] = 'ndjson'
+    json_array: Final[str] = 'json_array'
+
+
+class JsonStreamResponse(StreamResponse):
+    def __init__(
+            self,
+            items: AsyncIterable[Any],
+            *,
+            stream_format: str = JsonStreamFormat.ndjson,
+            json_encoder: Optional[JsonBytesEncoder] = None,
+            chunk_size: int = JSON_STREAM_CHUNK_SIZE,
+            status: int = 200,
+            reason: Optional[str] = None,
+            headers: Optional[LooseHeaders] = None,
+    ) -> None:
+        if stream_format not in (JsonStreamFormat.ndjson, JsonStreamFormat.json_array):
+            raise ValueError(f'Unsupported json stream format `{stream_format}`.')
+
+        super().__init__(status=status, reason=reason, headers=headers)
+        self.content_type = ApplicationNDJSON if stream_format == JsonStreamFormat.ndjson else ApplicationJSON
+        self.charset = 'utf-8'
+
+        self._items = items
+        self._stream_format = stream_format
+        self._encode_item = json_encoder or create_json_bytes_encoder()
+        self._chunk_size = chunk_size
+
+    async def prepare(self, request: BaseRequest) -> Optional[AbstractStreamWriter]:
+        if self._payload_writer is not None:
+            return self._payload_writer
+
+        writer = await super().prepare(request)
+        if request.method == 'HEAD':
+            await self._close_items()
+        else:
+            await self._write_items()
+
+        return writer
+
+    async def _write_items(self) -> None:
+        is_ndjson = self._stream_format == JsonStreamFormat.ndjson
+        buffer = bytearray() if is_ndjson else bytearray(b'[')
+        is_first_item = True
+
+        # NOTE: the generator is closed even if the client has gone
+        async with ClosingAsyncIterable(self._items):
+            async for item in self._items:
+                if not is_ndjson and not is_first_item:
+                    buffer.extend(b',')
+                is_first_item = False
+
+                buffer.extend(self._encode_item(item))
+                if is_ndjson:
+                    buffer.extend(b'\n')
+
+                # NOTE: small items are coalesced, so every write is a reasonably sized chunk
+                if len(buffer) >= self._chunk_size:
+                    await self._write_chunk(buffer)
+                    buffer.clear()
+
+        if not is_ndjson:
+            buffer.extend(b']')
+
+        if buffer:
+            await self._write_chunk(buffer)
+
+    async def _close_items(self) -> None:
+        await _close_items(self._items)
+
+    async def _write_chunk(self, chunk: bytearray) -> None:
+        await self.write(bytes(chunk))
+        # NOTE: waits while the transport is paused - a slow client holds the producer
+        await self._payload_writer.drain()  # type: ignore[union-attr]
+
+
+class ClosingAsyncIterable:
+    # NOTE: `contextlib.aclosing` is available only since python 3.10
+    def __init__(self, items: AsyncIterable[Any]) -> None:
+        self._items = items
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType],
+    ) -> None:
+        await _close_items(self._items)
+
+
+async def _close_items(items: AsyncIterable[Any]) -> None:
+    aclose = getattr(items, 'aclose', None)
+    if aclose is not None:
+        await aclose()
@@ -0,0 +1,291 @@
+import warnings
+from typing import Any, Final, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from aiohttp.abc import Request
+
+from rapidy._client_errors import ExtractNDArrayError, UnsupportedMediaTypeError
+from rapidy._extractors import _read_full_body
+from rapidy.media_types import ApplicationBytes, ApplicationJSON
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy import dtype as DType, ndarray as NDArray  # noqa: N812
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover
+        np = None
+
+    DType = Any
+    NDArray = Any
+
+__all__ = (
+    'NDARRAY_DTYPE_HEADER',
+    'NDARRAY_SHAPE_HEADER',
+    'extract_body_ndarray',
+    'create_ndarray_dtype',
+)
+
+NDARRAY_DTYPE_HEADER: Final[str] = 'X-NDArray-Dtype'
+NDARRAY_SHAPE_HEADER: Final[str] = 'X-NDArray-Shape'
+
+# NOTE: only numeric arrays - `bool`, `int`, `uint`, `float` and `complex` can be built from the raw buffer.
+NUMERIC_DTYPE_KINDS: Final[str] = 'biufc'
+
+_JSON_WHITESPACES: Final[bytes] = b' \t\r\n'
+_OPEN_BRACKET: Final[int] = ord('[')
+_CLOSE_BRACKET: Final[int] = ord(']')
+_COMMA: Final[int] = ord(',')
+_STRUCTURE_TOKENS: Final[Tuple[int, ...]] = (_OPEN_BRACKET, _CLOSE_BRACKET, _COMMA)
+# NOTE: `numpy.fromstring` silently fills empty values, e.g. `[1,]`, they are rejected before parsing
+_JSON_MISSING_VALUE_SEPARATORS: Final[Tuple[bytes, ...]] = (b',,', b'[,', b',]')
+_BRACKETS_TO_SPACES: Final[bytes] = bytes.maketrans(b'[]', b'  ')
+
+
+def _raise_if_numpy_is_not_installed() -> None:
+    if np is None:  # pragma: no cover
+        raise ModuleNotFoundError(
+            'NumPy is required to extract the body as `numpy.ndarray`. '
+            'Please install it: `pip install rapidy[numpy]`.',
+        )
+
+
+def create_ndarray_dtype(dtype: Any) -> Optional[DType]:
+    _raise_if_numpy_is_not_installed()
+
+    if dtype is None:
+        return None
+
+    ndarray_dtype = np.dtype(dtype)
+    if ndarray_dtype.kind not in NUMERIC_DTYPE_KINDS:
+        raise TypeError(f'NDArrayBody supports only numeric dtypes, got `{ndarray_dtype}`.')
+
+    return ndarray_dtype
+
+
+def _parse_header_dtype(raw_dtype: str) -> DType:
+    try:
+        header_dtype = np.dtype(raw_dtype)
+    except TypeError:
+        raise ExtractNDArrayError(ndarray_error=f'invalid dtype `{raw_dtype}`')
+
+    if header_dtype.kind not in NUMERIC_DTYPE_KINDS:
+        raise ExtractNDArrayError(ndarray_error=f'unsupported dtype `{raw_dtype}`')
+
+    return header_dtype
+
+
+def _parse_header_shape(raw_shape: str) -> Tuple[int, ...]:
+    try:
+        shape = tuple(int(dim) for dim in raw_shape.split(','))
+    except ValueError:
+        raise ExtractNDArrayError(ndarray_error=f'invalid shape `{raw_shape}`')
+
+    if any(dim < 0 for dim in shape):
+        raise ExtractNDArrayError(ndarray_error=f'invalid shape `{raw_shape}`')
+
+    return shape
+
+
+def _raise_if_too_many_elements(num_of_elements: int, max_elements: Optional[int]) -> None:
+    if max_elements is not None and num_of_elements > max_elements:
+        raise ExtractNDArrayError(
+            ndarray_error=f'number of elements exceeds the allowed `{max_elements}`',
+        )
+
+
+def _create_ndarray_from_bytes(
+        body: bytes,
+        *,
+        raw_dtype: Optional[str],
+        raw_shape: Optional[str],
+        dtype: Optional[DType],
+        max_elements: Optional[int],
+) -> NDArray:
+    if raw_dtype is not None:
+        body_dtype = _parse_header_dtype(raw_dtype)
+    elif dtype is not None:
+        body_dtype = dtype
+    else:
+        raise ExtractNDArrayError(ndarray_error=f'header `{NDARRAY_DTYPE_HEADER}` is required')
+
+    num_of_elements, remainder = divmod(len(body), body_dtype.itemsize)
+    if remainder:
+        raise ExtractNDArrayError(
+            ndarray_error=f'body size is not a multiple of the dtype `{body_dtype}` item size',
+        )
+
+    _raise_if_too_many_elements(num_of_elements, max_elements)
+
+    shape: Tuple[int, ...] = (num_of_elements,)
+    if raw_shape is not None:
+        shape = _parse_header_shape(raw_shape)
+        if int(np.prod(shape)) != num_of_elements:
+            raise ExtractNDArrayError(ndarray_error=f'shape `{raw_shape}` does not match the body size')
+
+    # NOTE: zero-copy - the array is a read-only view of the body buffer
+    ndarray = np.frombuffer(body, dtype=body_dtype).reshape(shape)
+
+    if dtype is not None and body_dtype != dtype:
+        # NOTE: only the byte order is allowed to differ, any other cast can silently lose data
+        if not np.can_cast(body_dtype, dtype, casting='equiv'):
+            raise ExtractNDArrayError(ndarray_error=f'dtype `{body_dtype}` cannot be converted to `{dtype}`')
+        ndarray = ndarray.astype(dtype)
+
+    return ndarray
+
+
+def _is_valid_depth(depth: NDArray) -> bool:
+    # NOTE: the depth never goes below zero and returns to zero only after the last bracket
+    if depth.min() < 0 or depth[-1] != 0:
+        return False
+    return bool(depth[:-1].all())
+
+
+def _count_between(mask: NDArray, opens: NDArray, closes: NDArray) -> NDArray:
+    counts = np.cumsum(mask, dtype=np.int32)
+    return counts[closes] - counts[opens]
+
+
+def _get_json_array_shape(compact_body: bytes) -> Tuple[int, ...]:
+    # NOTE: only brackets and commas define the shape - the numbers are never scanned by python code
+    raw = np.frombuffer(compact_body, dtype=np.uint8)
+    positions = np.flatnonzero(np.isin(raw, _STRUCTURE_TOKENS))
+    tokens = raw[positions]
+
+    is_open = tokens == _OPEN_BRACKET
+    is_close = tokens == _CLOSE_BRACKET
+    is_comma = tokens == _COMMA
+
+    depth = np.cumsum(is_open.astype(np.int32) - is_close)
+    if not _is_valid_depth(depth):
+        raise ExtractNDArrayError(ndarray_error='invalid JSON array structure')
+
+    ndim = int(depth.max())
+
+    shape = []
+    num_of_arrays = 1
+    for level in range(1, ndim + 1):
+        opens = np.flatnonzero(np.logical_and(is_open, depth == level))
+        closes = np.flatnonzero(np.logical_and(is_close, depth == level - 1))
+        if opens.size != num_of_arrays:
+            raise ExtractNDArrayError(ndarray_error='JSON array is not rectangular')
+
+        num_of_commas = _count_between(np.logical_and(is_comma, depth == level), opens, closes)
+
+        if level < ndim:
+            # NOTE: nested arrays - every child is an array, scalars between them are not allowed
+            is_child_open = np.logical_and(is_open, depth == level + 1)
+            num_of_children = _count_between(is_child_open, opens, closes)
+            expected_num_of_commas = np.maximum(num_of_children - 1, 0)
+            if np.any(num_of_commas != expected_num_of_commas):
+                raise ExtractNDArrayError(ndarray_error='JSON array is not rectangular')
+        else:
+            num_of_children = num_of_commas + 1
+            # NOTE: `[]` is the only leaf array without values
+            open_positions = positions[opens]
+            is_empty = positions[closes] == open_positions + 1
+            num_of_children[is_empty] = 0
+
+        dim = int(num_of_children[0])
+        if np.any(num_of_children != dim):
+            raise ExtractNDArrayError(ndarray_error='JSON array is not rectangular')
+
+        shape.append(dim)
+        num_of_arrays *= dim
+
+    return tuple(shape)
+
+
+def _create_ndarray_from_json(
+        body: bytes,
+        *,
+        dtype: Optional[DType],
+        max_elements: Optional[int],
+) -> NDArray:
+    # NOTE: the structure is checked on the compacted body, the values are parsed from the original one
+    compact_body = body.translate(None, _JSON_WHITESPACES)
+    if not compact_body.startswith(b'[') or not compact_body.endswith(b']'):
+        raise ExtractNDArrayError(ndarray_error='JSON body must be an array')
+
+    if any(separator in compact_body for separator in _JSON_MISSING_VALUE_SEPARATORS):
+        raise ExtractNDArrayError(ndarray_error='invalid JSON array structure')
+
+    shape = _get_json_array_shape(compact_body)
+    num_of_elements = int(np.prod(shape))
+
+    _raise_if_too_many_elements(num_of_elements, max_elements)
+
+    parse_dtype = dtype if dtype is not None else np.dtype(np.float64)
+    if num_of_elements == 0:
+        if compact_body.translate(None, b'[],'):
+            raise ExtractNDArrayError(ndarray_error='JSON array is not rectangular')
+        return np.empty(shape, dtype=parse_dtype)
+
+    # NOTE: brackets are replaced by whitespaces - numpy parses the numbers without creating python objects
+    numbers = body.translate(_BRACKETS_TO_SPACES)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            ndarray = np.fromstring(numbers, dtype=parse_dtype, sep=',')
+    except (ValueError, DeprecationWarning):
+        raise ExtractNDArrayError(ndarray_error=f'JSON array contains values that are not `{parse_dtype}`')
+
+    if ndarray.size != num_of_elements:
+        raise ExtractNDArrayError(ndarray_error=f'JSON array contains values that are not `{parse_dtype}`')
+
+    return ndarray.reshape(shape)
+
+
+def _is_shape_matched(ndarray_shape: Tuple[int, ...], shape: Sequence[Optional[int]]) -> bool:
+    if len(ndarray_shape) != len(shape):
+        return False
+    return all(
+        expected_dim in {None, dim}
+        for dim, expected_dim in zip(ndarray_shape, shape)
+    )
+
+
+def _format_dim(dim: Optional[int]) -> str:
+    return '*' if dim is None else str(dim)
+
+
+def _raise_if_shape_mismatch(ndarray: NDArray, shape: Optional[Sequence[Optional[int]]]) -> None:
+    if shape is None:
+        return
+
+    if not _is_shape_matched(ndarray.shape, shape):
+        expected_shape = ','.join(_format_dim(dim) for dim in shape)
+        raise ExtractNDArrayError(
+            ndarray_error=f'array shape `{ndarray.shape}` does not match the expected `({expected_shape})`',
+        )
+
+
+async def extract_body_ndarray(
+        request: Request,
+        max_size: int,
+        dtype: Optional[DType],
+        shape: Optional[Sequence[Optional[int]]],
+        max_elements: Optional[int],
+) -> NDArray:
+    media_type = request.content_type
+    is_json = media_type == ApplicationJSON or media_type.endswith('+json')
+    if not is_json and media_type != ApplicationBytes:
+        raise UnsupportedMediaTypeError(media_type=media_type)
+
+    body = await _read_full_body(request=request, max_size=max_size)
+
+    if is_json:
+        ndarray = _create_ndarray_from_json(body, dtype=dtype, max_elements=max_elements)
+    else:
+        ndarray = _create_ndarray_from_bytes(
+            body,
+            raw_dtype=request.headers.get(NDARRAY_DTYPE_HEADER),
+            raw_shape=request.headers.get(NDARRAY_SHAPE_HEADER),
+            dtype=dtype,
+            max_elements=max_elements,
+        )
+
+    _raise_if_shape_mismatch(ndarray, shape)
+
+    return ndarray
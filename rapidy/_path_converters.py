@@ -0,0 +1,47 @@
+import re
+import uuid
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, Mapping, NamedTuple, Tuple
+
+__all__ = (
+    'PathConverter',
+    'PATH_CONVERTERS',
+    'compile_path_converters',
+)
+
+
+class PathConverter(NamedTuple):
+    pattern: str
+    convert: Callable[[str], Any]
+    type_: type
+
+
+PATH_CONVERTERS: Final[Mapping[str, PathConverter]] = MappingProxyType({
+    'int': PathConverter(pattern='[0-9]+', convert=int, type_=int),
+    'uuid': PathConverter(
+        pattern='[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}',
+        convert=uuid.UUID,
+        type_=uuid.UUID,
+    ),
+    'slug': PathConverter(pattern='[-a-zA-Z0-9_]+', convert=str, type_=str),
+})
+
+_CONVERTER_RE: Final = re.compile(
+    r'\{(?P<var>[_a-zA-Z][_a-zA-Z0-9]*):(?P<converter>{converters})\}'.replace(
+        '{converters}',
+        '|'.join(PATH_CONVERTERS),
+    ),
+)
+
+
+def compile_path_converters(path: str) -> Tuple[str, Dict[str, PathConverter]]:
+    # NOTE: `{id:int}` becomes `{id:[0-9]+}` - the value is checked by the pattern, `match_info` keeps the string
+    converters: Dict[str, PathConverter] = {}
+
+    def replace(match: 're.Match[str]') -> str:
+        var = match.group('var')
+        converter = PATH_CONVERTERS[match.group('converter')]
+        converters[var] = converter
+        return f'{{{var}:{converter.pattern}}}'
+
+    return _CONVERTER_RE.sub(replace, path), converters
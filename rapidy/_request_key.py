@@ -0,0 +1,45 @@
+from typing import Any, Awaitable, Callable, Dict, Final, Hashable, Optional
+
+from aiohttp.web_request import Request
+from aiohttp.web_response import StreamResponse
+
+from rapidy import hdrs
+from rapidy._json_encoders import create_json_bytes_encoder
+
+__all__ = (
+    'SAFE_METHODS',
+    'ParamsKeyFactory',
+    'ResponseFactory',
+    'create_request_key',
+)
+
+# NOTE: the other methods change the state - every request must reach the handler
+SAFE_METHODS: Final = frozenset((hdrs.METH_GET, hdrs.METH_HEAD))
+
+ParamsKeyFactory = Callable[[Dict[str, Any]], Hashable]
+ResponseFactory = Callable[[], Awaitable[StreamResponse]]
+
+
+def create_request_key(
+        request: Request,
+        validated_data: Dict[str, Any],
+        params_key_factory: Optional[ParamsKeyFactory] = None,
+) -> Optional[Hashable]:
+    if request.method not in SAFE_METHODS:
+        return None
+
+    # NOTE: the validated parameters are the canonical representation of the request for the handler
+    try:
+        params_key = _create_params_key(validated_data, params_key_factory)
+    except (TypeError, ValueError):
+        return None  # NOTE: the parameters can't be a key - the response is not shared
+
+    # NOTE: the key may be shared by several routes - the same parameters of another route are another response
+    return request.method, request.match_info.route, params_key
+
+
+def _create_params_key(validated_data: Dict[str, Any], params_key_factory: Optional[ParamsKeyFactory]) -> Hashable:
+    if params_key_factory is not None:
+        return params_key_factory(validated_data)
+
+    return create_json_bytes_encoder()(validated_data)
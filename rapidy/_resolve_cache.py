@@ -0,0 +1,46 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from aiohttp.web_urldispatcher import AbstractRoute
+
+__all__ = (
+    'ResolveCache',
+)
+
+_ResolveCacheKey = Tuple[str, str]
+_ResolveCacheEntry = Tuple[AbstractRoute, Dict[str, Any]]
+
+
+class ResolveCache:
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: 'OrderedDict[_ResolveCacheKey, _ResolveCacheEntry]' = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get(self, method: str, path: str) -> Optional[_ResolveCacheEntry]:
+        entry = self._entries.get((method, path))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end((method, path))
+        return entry
+
+    def set(self, method: str, path: str, route: AbstractRoute, match_dict: Dict[str, Any]) -> None:
+        # NOTE: the match dict is copied - the handlers and the middlewares may change `match_info`
+        self._entries[(method, path)] = (route, dict(match_dict))
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
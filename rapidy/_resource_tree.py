@@ -0,0 +1,220 @@
+from typing import Container, Dict, Final, Iterable, List, Optional, Tuple
+
+from aiohttp.web_urldispatcher import (
+    AbstractResource,
+    Domain,
+    DynamicResource,
+    MaskDomain,
+    MatchedSubAppResource,
+    PlainResource,
+    PrefixResource,
+)
+
+__all__ = (
+    'HostIndex',
+    'ResourceTree',
+)
+
+_DYNAMIC_VAR_PATTERN: Final[str] = f'>{DynamicResource.GOOD})'
+
+_IndexedResource = Tuple[int, AbstractResource]
+
+
+class _Node:
+    __slots__ = ('children', 'wildcard', 'resources', 'prefix_resources')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.wildcard: Optional[_Node] = None
+        # NOTE: the resources whose path ends at the node
+        self.resources: List[_IndexedResource] = []
+        # NOTE: the resources that may match any path under the node
+        self.prefix_resources: List[_IndexedResource] = []
+
+    def add_child(self, segment: str) -> '_Node':
+        child = self.children.get(segment)
+        if child is None:
+            child = _Node()
+            self.children[segment] = child
+        return child
+
+    def add_wildcard(self) -> '_Node':
+        if self.wildcard is None:
+            self.wildcard = _Node()
+        return self.wildcard
+
+    def add_path(self, path: str) -> '_Node':
+        node = self
+        for segment in _split_path(path):
+            node = node.add_child(segment)
+        return node
+
+
+def _split_path(path: str) -> List[str]:
+    return path.split('/')[1:]
+
+
+def _is_simple_dynamic_segment(segment: str, pattern: str, path_converters: Container[str]) -> bool:
+    # NOTE: a variable with the default pattern or a path converter never matches `/` - it stays within a single segment
+    for part in segment.split('{')[1:]:
+        var, _, _ = part.partition('}')
+        if var not in path_converters and f'(?P<{var}{_DYNAMIC_VAR_PATTERN}' not in pattern:
+            return False
+    return True
+
+
+def _is_registered_before(indexed_resource: _IndexedResource, other: Optional[_IndexedResource]) -> bool:
+    return other is None or indexed_resource[0] < other[0]
+
+
+class HostIndex:
+    # NOTE: the domain sub-applications are found by the `Host` header with dict lookups:
+    # `Domain` compares the lowercased host, `MaskDomain` `*.example.com` is a suffix of the host
+    def __init__(self) -> None:
+        self._hosts: Dict[str, _IndexedResource] = {}
+        self._host_suffixes: Dict[str, _IndexedResource] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._hosts or self._host_suffixes)
+
+    def add(self, indexed_resource: _IndexedResource) -> bool:
+        _, resource = indexed_resource
+        if not isinstance(resource, MatchedSubAppResource):
+            return False
+
+        rule = resource.get_info()['rule']
+        if type(rule) is Domain:  # noqa: WPS516
+            # NOTE: only the first registered resource of a host is ever matched
+            self._hosts.setdefault(rule.canonical, indexed_resource)
+            return True
+
+        if type(rule) is MaskDomain:  # noqa: WPS516
+            domain = rule.get_info()['domain']
+            if domain.startswith('*.') and '*' not in domain[1:]:
+                self._host_suffixes.setdefault(domain[1:], indexed_resource)
+                return True
+
+        return False
+
+    def find(self, host: Optional[str]) -> Optional[_IndexedResource]:
+        if not host:
+            return None
+
+        found = self._hosts.get(host.lower())
+
+        if self._host_suffixes:
+            dot_position = host.find('.')
+            while dot_position != -1:
+                suffix_found = self._host_suffixes.get(host[dot_position:])
+                if suffix_found is not None and _is_registered_before(suffix_found, found):
+                    found = suffix_found
+                dot_position = host.find('.', dot_position + 1)
+
+        return found
+
+
+class ResourceTree:
+    # NOTE: the tree only narrows the resources down to the ones that may match the path,
+    # each of them is still resolved by itself in the registration order - the match semantics are the same.
+    def __init__(self, resources: Iterable[AbstractResource]) -> None:
+        self._root = _Node()
+        self._host_index = HostIndex()
+        # NOTE: the resolution result depends only on the method and the path - it can be cached
+        self.is_path_resolvable = True
+        plain_paths = []
+        for index, resource in enumerate(resources):
+            if self._host_index.add((index, resource)):
+                self.is_path_resolvable = False
+                continue
+
+            self._add((index, resource))
+            if isinstance(resource, PlainResource):
+                plain_paths.append(resource.canonical)
+
+        # NOTE: the exact paths are found with a single dict lookup - the dynamic resources registered
+        # before a plain one and matching its path stay in front of it, so the registration order is kept
+        self._plain_path_candidates: Dict[str, List[_IndexedResource]] = {
+            path: self._find_candidates(path)
+            for path in plain_paths
+        }
+
+    def is_plain_path(self, path: str) -> bool:
+        return path in self._plain_path_candidates
+
+    def find_resources(self, path: str, host: Optional[str] = None) -> List[AbstractResource]:
+        candidates = self._plain_path_candidates.get(path)
+        if candidates is None:
+            candidates = self._find_candidates(path)
+
+        if self._host_index:
+            host_resource = self._host_index.find(host)
+            if host_resource is not None:
+                # NOTE: the sub-application of the matched host answers for any path - the later resources are skipped
+                host_resource_index, _ = host_resource
+                return [
+                    resource
+                    for index, resource in (*candidates, host_resource)
+                    if index <= host_resource_index
+                ]
+
+        return [resource for _, resource in candidates]
+
+    def _find_candidates(self, path: str) -> List[_IndexedResource]:
+        candidates: List[_IndexedResource] = []
+        self._collect(self._root, _split_path(path), 0, candidates)
+        if len(candidates) > 1:
+            candidates.sort(key=lambda indexed_resource: indexed_resource[0])
+        return candidates
+
+    def _collect(self, node: _Node, segments: List[str], position: int, candidates: List[_IndexedResource]) -> None:
+        candidates.extend(node.prefix_resources)
+
+        if position == len(segments):
+            candidates.extend(node.resources)
+            return
+
+        child = node.children.get(segments[position])
+        if child is not None:
+            self._collect(child, segments, position + 1, candidates)
+
+        if node.wildcard is not None:
+            self._collect(node.wildcard, segments, position + 1, candidates)
+
+    def _add(self, indexed_resource: _IndexedResource) -> None:
+        _, resource = indexed_resource
+
+        if isinstance(resource, PlainResource) and resource.canonical:
+            self._root.add_path(resource.canonical).resources.append(indexed_resource)
+            return
+
+        if isinstance(resource, DynamicResource):
+            self._add_dynamic(indexed_resource, resource)
+            return
+
+        is_path_prefix_resource = (
+            isinstance(resource, PrefixResource)
+            and not isinstance(resource, MatchedSubAppResource)  # NOTE: it is matched by the host
+            and resource.canonical not in ('', '/')
+        )
+        if is_path_prefix_resource:
+            self._root.add_path(resource.canonical).prefix_resources.append(indexed_resource)
+            return
+
+        # NOTE: the resources with the unknown matching rules are resolved for every path
+        self._root.prefix_resources.append(indexed_resource)
+        self.is_path_resolvable = False
+
+    def _add_dynamic(self, indexed_resource: _IndexedResource, resource: DynamicResource) -> None:
+        pattern = resource.get_info()['pattern'].pattern
+        path_converters = getattr(resource, 'path_converters', ())
+        node = self._root
+        for segment in _split_path(resource.canonical):
+            if '{' not in segment:
+                node = node.add_child(segment)
+            elif _is_simple_dynamic_segment(segment, pattern, path_converters):
+                node = node.add_wildcard()
+            else:
+                # NOTE: a custom pattern may match several segments
+                node.prefix_resources.append(indexed_resource)
+                return
+        node.resources.append(indexed_resource)
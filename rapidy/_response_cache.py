@@ -0,0 +1,190 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Final, Hashable, NamedTuple, Optional, TypeVar
+
+from aiohttp.web_request import Request
+from aiohttp.web_response import Response, StreamResponse
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from rapidy import hdrs
+from rapidy._request_key import create_request_key, ParamsKeyFactory, ResponseFactory
+
+__all__ = (
+    'ResponseCache',
+    'cached',
+    'get_handler_response_cache',
+)
+
+RESPONSE_CACHE_ATTR_NAME: Final[str] = '__rapidy_response_cache__'
+
+RESPONSE_CACHE_MAX_ENTRIES: Final[int] = 1024
+RESPONSE_CACHE_MAX_BYTES: Final[int] = 67108864
+
+# NOTE: the headers that are created for every response by the server
+_NOT_CACHED_HEADERS: Final = (hdrs.DATE, hdrs.SERVER, hdrs.CONTENT_LENGTH)
+
+THandler = TypeVar('THandler')
+
+
+class _CacheEntry(NamedTuple):
+    expires_at: float
+    size: int
+    status: int
+    headers: CIMultiDictProxy[str]
+    body: bytes
+
+
+class ResponseCache:
+    def __init__(
+            self,
+            ttl: float,
+            *,
+            key: Optional[ParamsKeyFactory] = None,
+            max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+            max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+    ) -> None:
+        self._ttl = ttl
+        self._key = key
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._entries: 'OrderedDict[Hashable, _CacheEntry]' = OrderedDict()
+        self._refreshes: Dict[Hashable, 'asyncio.Future[Optional[_CacheEntry]]'] = {}
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def create_key(self, request: Request, validated_data: Dict[str, Any]) -> Optional[Hashable]:
+        return create_request_key(request, validated_data, self._key)
+
+    async def get_response(self, cache_key: Hashable, create_response: ResponseFactory) -> StreamResponse:
+        loop = asyncio.get_running_loop()
+
+        entry = self._get_entry(cache_key, loop.time())
+        if entry is not None:
+            self.hits += 1
+            return Response(status=entry.status, headers=entry.headers, body=entry.body)
+
+        self.misses += 1
+
+        refresh = self._refreshes.get(cache_key)
+        if refresh is not None:
+            # NOTE: only one request refreshes the key, the others wait for its response
+            entry = await asyncio.shield(refresh)
+            if entry is not None:
+                return Response(status=entry.status, headers=entry.headers, body=entry.body)
+
+            return await create_response()
+
+        refresh = loop.create_future()
+        self._refreshes[cache_key] = refresh
+        try:
+            resp = await create_response()
+        except (Exception, asyncio.CancelledError):
+            self._finish_refresh(cache_key, refresh, None)
+            raise
+
+        entry = self._create_entry(resp, loop.time())
+        if entry is not None:
+            self._set_entry(cache_key, entry)
+
+        self._finish_refresh(cache_key, refresh, entry)
+        return resp
+
+    def _finish_refresh(
+            self,
+            cache_key: Hashable,
+            refresh: 'asyncio.Future[Optional[_CacheEntry]]',
+            entry: Optional[_CacheEntry],
+    ) -> None:
+        del self._refreshes[cache_key]
+        refresh.set_result(entry)
+
+    def _get_entry(self, cache_key: Hashable, now: float) -> Optional[_CacheEntry]:
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= now:
+            self._delete_entry(cache_key)
+            return None
+
+        self._entries.move_to_end(cache_key)
+        return entry
+
+    def _create_entry(self, resp: StreamResponse, now: float) -> Optional[_CacheEntry]:
+        if not isinstance(resp, Response) or resp.prepared or resp.status != 200:  # noqa: WPS432
+            return None
+
+        body = resp.body
+        if not isinstance(body, bytes) or hdrs.SET_COOKIE in resp.headers or resp.cookies:
+            return None
+
+        headers = CIMultiDict(resp.headers)
+        for not_cached_header_name in _NOT_CACHED_HEADERS:
+            headers.popall(not_cached_header_name, None)
+
+        size = len(body) + _get_headers_size(headers)
+        if size > self._max_bytes:
+            return None
+
+        return _CacheEntry(
+            expires_at=now + self._ttl,
+            size=size,
+            status=resp.status,
+            headers=CIMultiDictProxy(headers),
+            body=body,
+        )
+
+    def _set_entry(self, cache_key: Hashable, entry: _CacheEntry) -> None:
+        if cache_key in self._entries:
+            self._delete_entry(cache_key)
+
+        self._entries[cache_key] = entry
+        self._size += entry.size
+
+        # NOTE: the least recently used entries are evicted
+        while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+            _, evicted_entry = self._entries.popitem(last=False)
+            self._size -= evicted_entry.size
+
+    def _delete_entry(self, cache_key: Hashable) -> None:
+        entry = self._entries.pop(cache_key)
+        self._size -= entry.size
+
+
+def _get_headers_size(headers: CIMultiDict[str]) -> int:
+    names_size = sum(map(len, headers.keys()))
+    values_size = sum(map(len, headers.values()))
+    return names_size + values_size
+
+
+def cached(
+        ttl: float,
+        *,
+        key: Optional[ParamsKeyFactory] = None,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+) -> Callable[[THandler], THandler]:
+    def deco(handler: THandler) -> THandler:
+        response_cache = ResponseCache(ttl, key=key, max_entries=max_entries, max_bytes=max_bytes)
+        setattr(handler, RESPONSE_CACHE_ATTR_NAME, response_cache)  # noqa: B010
+        return handler
+
+    return deco
+
+
+def get_handler_response_cache(handler: Any) -> Optional[ResponseCache]:
+    return getattr(handler, RESPONSE_CACHE_ATTR_NAME, None)
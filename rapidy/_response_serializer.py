@@ -0,0 +1,32 @@
+from typing import Any, Callable, Optional
+
+from rapidy._json_encoders import create_json_bytes_encoder
+from rapidy._json_stream import JsonStreamFormat, JsonStreamResponse
+from rapidy.media_types import ApplicationJSON
+from rapidy.web_response import Response, StreamResponse
+
+__all__ = (
+    'ResponseSerializer',
+    'create_response_serializer',
+)
+
+ResponseSerializer = Callable[[Any], StreamResponse]
+
+
+def create_response_serializer(
+        response_model: Optional[Any] = None,
+        stream_format: str = JsonStreamFormat.ndjson,
+) -> ResponseSerializer:
+    encode = create_json_bytes_encoder(response_model)
+
+    def serialize(handler_result: Any) -> StreamResponse:
+        if isinstance(handler_result, StreamResponse):
+            return handler_result
+
+        if hasattr(handler_result, '__aiter__'):
+            # NOTE: the items are serialized while they are produced, `response_model` is the model of one item
+            return JsonStreamResponse(handler_result, stream_format=stream_format, json_encoder=encode)
+
+        return Response(body=encode(handler_result), content_type=ApplicationJSON, charset='utf-8')
+
+    return serialize
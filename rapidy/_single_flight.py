@@ -0,0 +1,126 @@
+import asyncio
+from functools import partial
+from typing import Any, Dict, Hashable, Optional
+
+from aiohttp.web_exceptions import HTTPException
+from aiohttp.web_request import Request
+from aiohttp.web_response import Response, StreamResponse
+
+from rapidy._request_key import create_request_key, ParamsKeyFactory, ResponseFactory
+
+__all__ = (
+    'SingleFlight',
+)
+
+
+class _Flight:
+    def __init__(self, task: 'asyncio.Future[StreamResponse]') -> None:
+        self.task = task
+        self.waiters = 0
+        self.is_response_claimed = False
+
+
+def _is_cloneable(resp: Response) -> bool:
+    if resp.prepared or resp.chunked or resp.compression:
+        return False
+
+    return resp.body is None or isinstance(resp.body, bytes)
+
+
+def _create_response_copy(resp: Response) -> Optional[Response]:
+    if isinstance(resp, HTTPException):
+        try:
+            return type(resp)(headers=resp.headers, reason=resp.reason)
+        except TypeError:
+            return None  # NOTE: the http exceptions with their own arguments (e.g. redirects) are not copied
+
+    # NOTE: a response subclass may change how it is sent - only the plain responses are copied
+    if type(resp) is not Response:  # noqa: WPS516
+        return None
+
+    return Response(status=resp.status, reason=resp.reason, headers=resp.headers)
+
+
+def _clone_response(resp: StreamResponse) -> Optional[Response]:
+    # NOTE: a response can be sent only once - every waiting request gets its own copy
+    if not isinstance(resp, Response) or not _is_cloneable(resp):
+        return None
+
+    clone = _create_response_copy(resp)
+    if clone is None:
+        return None
+
+    body = resp.body
+    if isinstance(body, bytes):
+        clone.body = body
+    clone.cookies.update(resp.cookies)
+
+    return clone
+
+
+class SingleFlight:
+    def __init__(self, *, key: Optional[ParamsKeyFactory] = None) -> None:
+        self._key = key
+        self._flights: Dict[Hashable, _Flight] = {}
+
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def create_key(self, request: Request, validated_data: Dict[str, Any]) -> Optional[Hashable]:
+        return create_request_key(request, validated_data, self._key)
+
+    async def get_response(self, flight_key: Hashable, create_response: ResponseFactory) -> StreamResponse:
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            flight = self._start_flight(flight_key, create_response)
+        else:
+            self.coalesced += 1
+
+        resp = self._claim_response(flight, await self._wait_response(flight_key, flight))
+        if resp is None:
+            # NOTE: a streamed response is not shared - the other requests call the handler themselves
+            return await create_response()
+
+        if isinstance(resp, HTTPException):
+            raise resp
+
+        return resp
+
+    def _start_flight(self, flight_key: Hashable, create_response: ResponseFactory) -> _Flight:
+        # NOTE: the handler runs in its own task - the cancellation of a single request does not stop it
+        task = asyncio.ensure_future(create_response())
+        flight = _Flight(task)
+        self._flights[flight_key] = flight
+        task.add_done_callback(partial(self._finish_flight, flight_key, flight))
+        return flight
+
+    async def _wait_response(self, flight_key: Hashable, flight: _Flight) -> StreamResponse:
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except HTTPException as exc:
+            return exc  # NOTE: the raised http exception is shared as the returned response
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # NOTE: all the requests are cancelled - nobody waits for the response
+                self._finish_flight(flight_key, flight)
+                flight.task.cancel()
+
+    def _claim_response(self, flight: _Flight, resp: StreamResponse) -> Optional[StreamResponse]:
+        clone = _clone_response(resp)
+        if clone is not None:
+            return clone
+
+        if flight.is_response_claimed:
+            return None
+
+        flight.is_response_claimed = True
+        return resp
+
+    def _finish_flight(self, flight_key: Hashable, flight: _Flight, *args: Any) -> None:
+        # NOTE: the flight holds no data after the handler is completed
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
@@ -0,0 +1,232 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Final, Optional, Pattern, Union
+
+from aiohttp.abc import AbstractStreamWriter, BaseRequest
+from aiohttp.typedefs import LooseHeaders
+from aiohttp.web_response import StreamResponse
+
+from rapidy import hdrs
+from rapidy._json_stream import ClosingAsyncIterable
+from rapidy.media_types import TextEventStream
+
+__all__ = (
+    'EventSourceResponse',
+    'ServerSentEvent',
+)
+
+SSE_HEARTBEAT_INTERVAL: Final[float] = 15.0
+SSE_MAX_BUFFER_SIZE: Final[int] = 65536
+# NOTE: the transport has no "connection lost" callback for the handler - its state is checked periodically
+SSE_CONNECTION_CHECK_INTERVAL: Final[float] = 1.0
+
+_HEARTBEAT_COMMENT: Final[bytes] = b': ping\n\n'
+# NOTE: the event stream lines end only with CRLF, LF or CR - `str.splitlines` splits on unicode line breaks too
+_LINE_BREAK_RE: Final[Pattern[str]] = re.compile(r'\r\n|\r|\n')
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    data: str
+    event: Optional[str] = None
+    id: Optional[str] = None  # noqa: WPS125
+    retry: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        for field_name in ('event', 'id'):
+            field_value = getattr(self, field_name)
+            if field_value is not None and ('\n' in field_value or '\r' in field_value):
+                raise ValueError(f'Server-sent event `{field_name}` must not contain line breaks.')
+
+    def encode(self) -> bytes:
+        lines = []
+        if self.event is not None:
+            lines.append(f'event: {self.event}')
+        if self.id is not None:
+            lines.append(f'id: {self.id}')
+        if self.retry is not None:
+            lines.append(f'retry: {self.retry}')
+
+        data_lines = _LINE_BREAK_RE.split(self.data)
+        lines.extend(f'data: {data_line}' for data_line in data_lines)
+
+        event_text = '\n'.join(lines)
+        return f'{event_text}\n\n'.encode()
+
+
+class EventSourceResponse(StreamResponse):
+    def __init__(
+            self,
+            events: Optional[AsyncIterable[Union[str, ServerSentEvent]]] = None,
+            *,
+            heartbeat_interval: Optional[float] = SSE_HEARTBEAT_INTERVAL,
+            max_buffer_size: int = SSE_MAX_BUFFER_SIZE,
+            status: int = 200,
+            reason: Optional[str] = None,
+            headers: Optional[LooseHeaders] = None,
+    ) -> None:
+        super().__init__(status=status, reason=reason, headers=headers)
+        self.content_type = TextEventStream
+        self.charset = 'utf-8'
+        self.headers[hdrs.CACHE_CONTROL] = 'no-cache'
+
+        self._events = events
+        self._heartbeat_interval = heartbeat_interval
+        self._max_buffer_size = max_buffer_size
+
+        self._request: Optional[BaseRequest] = None
+        self._last_event_id: Optional[str] = None
+        self._buffer = bytearray()
+        self._flush_task: Optional['asyncio.Task[None]'] = None
+        self._keepalive_task: Optional['asyncio.Task[None]'] = None
+        self._producer_task: Optional['asyncio.Task[Any]'] = None
+        self._last_write_time: float = 0
+        self._is_disconnected = False
+        self._write_error: Optional[Exception] = None
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        return self._last_event_id
+
+    @property
+    def is_disconnected(self) -> bool:
+        return self._is_disconnected
+
+    async def prepare(self, request: BaseRequest) -> Optional[AbstractStreamWriter]:
+        if self._payload_writer is not None:
+            return self._payload_writer
+
+        self._request = request
+        self._last_event_id = request.headers.get(hdrs.LAST_EVENT_ID)
+
+        writer = await super().prepare(request)
+
+        loop = asyncio.get_running_loop()
+        self._last_write_time = loop.time()
+        # NOTE: the task that produces the events is cancelled when the client disconnects
+        self._producer_task = asyncio.current_task()
+        self._keepalive_task = loop.create_task(self._keepalive())
+        if self._producer_task is not None:
+            self._producer_task.add_done_callback(self._on_producer_done)
+
+        if self._events is not None:
+            await self._send_events(self._events)
+
+        return writer
+
+    async def send(
+            self,
+            data: Union[str, ServerSentEvent],
+            *,
+            event: Optional[str] = None,
+            id: Optional[str] = None,  # noqa: WPS125
+            retry: Optional[int] = None,
+    ) -> None:
+        if not isinstance(data, ServerSentEvent):
+            data = ServerSentEvent(data=data, event=event, id=id, retry=retry)
+
+        self._enqueue(data.encode())
+
+        # NOTE: the producer waits while the client can't keep up with the events
+        if len(self._buffer) >= self._max_buffer_size and self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+    async def write_eof(self, data: bytes = b'') -> None:
+        self._producer_task = None
+
+        keepalive_task = self._keepalive_task
+        self._stop_keepalive()
+        if keepalive_task is not None:
+            await asyncio.wait([keepalive_task])
+
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+        self._raise_if_closed()
+        await super().write_eof(data)
+
+    async def _send_events(self, events: AsyncIterable[Union[str, ServerSentEvent]]) -> None:
+        async with ClosingAsyncIterable(events):
+            async for event in events:
+                await self.send(event)
+
+    def _enqueue(self, chunk: bytes) -> None:
+        self._raise_if_closed()
+
+        self._buffer += chunk
+        if self._flush_task is None:
+            # NOTE: the events queued in the same loop tick are sent with a single write
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def _flush(self) -> None:
+        try:
+            await self._write_buffer()
+        except ConnectionError:
+            self._on_disconnect()
+        except Exception as exc:
+            # NOTE: nobody may await the flush task - the error is raised to the producer by its next call
+            self._write_error = exc
+            self._buffer.clear()
+
+        self._flush_task = None
+
+    async def _write_buffer(self) -> None:
+        while self._buffer:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            await self.write(chunk)
+            await self._payload_writer.drain()  # type: ignore[union-attr]
+            self._last_write_time = asyncio.get_running_loop().time()
+
+    async def _keepalive(self) -> None:
+        loop = asyncio.get_running_loop()
+        check_interval = SSE_CONNECTION_CHECK_INTERVAL
+        if self._heartbeat_interval is not None:
+            check_interval = min(check_interval, self._heartbeat_interval)
+
+        while not self._is_disconnected:
+            await asyncio.sleep(check_interval)
+
+            transport = self._request.transport if self._request is not None else None
+            if transport is None or transport.is_closing():
+                self._on_disconnect()
+                return
+
+            is_heartbeat_time = (
+                self._heartbeat_interval is not None
+                and loop.time() - self._last_write_time >= self._heartbeat_interval
+            )
+            if is_heartbeat_time and not self._buffer:
+                self._enqueue(_HEARTBEAT_COMMENT)
+
+    def _on_disconnect(self) -> None:
+        self._is_disconnected = True
+        self._buffer.clear()
+        self._stop_keepalive()
+
+        producer_task = self._producer_task
+        if producer_task is not None and not producer_task.done() and producer_task is not asyncio.current_task():
+            producer_task.cancel()
+
+    def _on_producer_done(self, producer_task: 'asyncio.Task[Any]') -> None:
+        # NOTE: a handler that fails before `write_eof` leaves the tasks running - they must not outlive the request
+        self._producer_task = None
+        self._stop_keepalive()
+
+        flush_task = self._flush_task
+        if flush_task is not None:
+            flush_task.cancel()
+
+    def _stop_keepalive(self) -> None:
+        keepalive_task = self._keepalive_task
+        self._keepalive_task = None
+        if keepalive_task is not None and keepalive_task is not asyncio.current_task():
+            keepalive_task.cancel()
+
+    def _raise_if_closed(self) -> None:
+        if self._write_error is not None:
+            raise self._write_error
+
+        if self._is_disconnected:
+            raise ConnectionResetError('Client has disconnected from the event stream.')
@@ -1,9 +1,14 @@
-from typing import Any, cast, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, cast, Dict, Final, List, Mapping, Optional, Tuple
 
 from rapidy._client_errors import _regenerate_error_with_loc, RequiredFieldIsMissing
 from rapidy._fields import ModelField
 from rapidy.typedefs import DictStrAny, ErrorWrapper
 
+ValueConverter = Callable[[Any], Any]
+
+NO_CONVERTERS: Final[Mapping[str, ValueConverter]] = MappingProxyType({})
+
 
 def _validate_data_by_field(
         raw_data: Optional[Any],
@@ -29,44 +34,53 @@ def _validate_data_by_field(
     return validated_data, []
 
 
-def validate_request_param_data(
+def _validate_single_model_data(
         required_fields_map: Dict[str, ModelField],
         raw_data: DictStrAny,
-        is_single_model: bool,
 ) -> Tuple[DictStrAny, List[Any]]:
-    loc: Tuple[str, ...]
+    model_field = list(required_fields_map.values())[0]
 
-    if is_single_model:
-        model_field = list(required_fields_map.values())[0]
+    rapid_param_type = cast(str, model_field.rapid_param_type)
 
-        rapid_param_type = cast(str, model_field.rapid_param_type)
+    validated_data, validated_errors = _validate_data_by_field(
+        raw_data=raw_data if raw_data else None,
+        values={},
+        loc=(rapid_param_type,),
+        model_field=model_field,
+    )
+    if validated_errors:
+        return {}, validated_errors
 
-        loc = (rapid_param_type,)
+    return {model_field.name: validated_data}, validated_errors
 
-        validated_data, validated_errors = _validate_data_by_field(
-            raw_data=raw_data if raw_data else None,
-            values={},
-            loc=loc,
-            model_field=model_field,
-        )
-        if validated_errors:
-            return {}, validated_errors
 
-        return {model_field.name: validated_data}, validated_errors
+def validate_request_param_data(
+        required_fields_map: Dict[str, ModelField],
+        raw_data: DictStrAny,
+        is_single_model: bool,
+        prevalidated_converters: Mapping[str, ValueConverter] = NO_CONVERTERS,
+) -> Tuple[DictStrAny, List[Any]]:
+    if is_single_model:
+        return _validate_single_model_data(required_fields_map, raw_data)
 
     all_validated_values: Dict[str, Any] = {}
     all_validated_errors: List[Dict[str, Any]] = []
 
-    for required_field_name, model_field in required_fields_map.items():  # noqa: WPS440
+    for required_field_name, model_field in required_fields_map.items():
         rapid_param_type = cast(str, model_field.rapid_param_type)
 
-        loc = (rapid_param_type, model_field.alias)
         raw_param_data = raw_data.get(required_field_name)
 
+        convert = prevalidated_converters.get(required_field_name)
+        if raw_param_data is not None and convert is not None:
+            # NOTE: the value is already checked by the route pattern - it is converted without the validation
+            all_validated_values[model_field.name] = convert(raw_param_data)
+            continue
+
         validated_data, validated_errors = _validate_data_by_field(
             raw_data=raw_param_data,
             values=all_validated_values,
-            loc=loc,
+            loc=(rapid_param_type, model_field.alias),
             model_field=model_field,
         )
         if validated_errors:
@@ -1,11 +1,19 @@
+import inspect
 from functools import partial, wraps
-from typing import Any, cast, Dict, List, Type, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, cast, Dict, Iterable, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
+
+from aiohttp.web_urldispatcher import _default_expect_handler, View as AioHTTPView
 
 from rapidy import hdrs
-from rapidy._annotation_container import AnnotationContainer, create_annotation_container
+from rapidy._annotation_container import AnnotationContainer, create_annotation_container, ParamAnnotationContainer
 from rapidy._client_errors import _normalize_errors
-from rapidy.typedefs import Handler, HandlerType, MethodHandler, Middleware
-from rapidy.web_exceptions import HTTPValidationFailure
+from rapidy._request_key import ResponseFactory
+from rapidy._request_params_base import ParamType
+from rapidy._response_cache import ResponseCache
+from rapidy._response_serializer import ResponseSerializer
+from rapidy._single_flight import SingleFlight
+from rapidy.typedefs import Handler, HandlerOrMethod, HandlerType, MethodHandler, Middleware
+from rapidy.web_exceptions import HTTPMethodNotAllowed, HTTPRequestEntityTooLarge, HTTPValidationFailure
 from rapidy.web_middlewares import middleware as middleware_deco
 from rapidy.web_response import StreamResponse
 
@@ -14,10 +22,13 @@ if TYPE_CHECKING:
     from rapidy.web_urldispatcher import View
 
 
+ExpectHandler = Callable[['Request'], Awaitable[Optional[StreamResponse]]]
+
+
 async def validate_request(
         request: 'Request',
         *,
-        annotation_container: AnnotationContainer,
+        annotation_container: Iterable[ParamAnnotationContainer],
         errors_response_field_name: str,
 ) -> Dict[str, Any]:
     values: Dict[str, Any] = {}
@@ -34,13 +45,36 @@ async def validate_request(
         raise HTTPValidationFailure(
             validation_failure_field_name=errors_response_field_name,
             errors=_normalize_errors(errors),
+            errors_max_count=request._cache['errors_max_count'],  # FIXME
+            error_msg_max_length=request._cache['error_msg_max_length'],  # FIXME
         )
 
     return values
 
 
-def handler_validation_wrapper(handler: Handler) -> Handler:
-    annotation_container = create_annotation_container(handler, is_func_handler=True)
+async def _call_handler(handler: HandlerOrMethod, validated_data: Dict[str, Any], *args: Any) -> Any:
+    # NOTE: an async generator handler yields the items of a streamed response
+    if inspect.isasyncgenfunction(handler):
+        return handler(*args, **validated_data)
+
+    return await handler(*args, **validated_data)
+
+
+def handler_validation_wrapper(
+        handler: Handler,
+        annotation_container: AnnotationContainer,
+        response_serializer: ResponseSerializer,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+) -> Handler:
+    # NOTE: the handler may read any request data (e.g. the user session) - it is not a part of the shared response key
+    if response_cache is not None and annotation_container.request_exists:
+        raise TypeError('Response cache is not supported for handlers with the `request` parameter.')
+    if single_flight is not None and annotation_container.request_exists:
+        raise TypeError('Single flight is not supported for handlers with the `request` parameter.')
+
+    async def call_handler(validated_data: Dict[str, Any]) -> StreamResponse:
+        return response_serializer(await _call_handler(handler, validated_data))
 
     @wraps(handler)
     async def inner(request: 'Request') -> StreamResponse:
@@ -50,15 +84,33 @@ def handler_validation_wrapper(handler: Handler) -> Handler:
             errors_response_field_name=request._cache['errors_response_field_name'],  # FIXME
         )
 
+        cache_key = response_cache.create_key(request, validated_data) if response_cache is not None else None
+        flight_key = single_flight.create_key(request, validated_data) if single_flight is not None else None
+
         if annotation_container.request_exists:
             validated_data[annotation_container.request_param_name] = request
 
-        return await handler(**validated_data)
+        create_response: ResponseFactory = partial(call_handler, validated_data)
+        if flight_key is not None:
+            # NOTE: the identical concurrent requests wait for a single handler call
+            create_response = partial(
+                single_flight.get_response,  # type: ignore[union-attr]
+                flight_key,
+                create_response,
+            )
+        if cache_key is not None:
+            create_response = partial(
+                response_cache.get_response,  # type: ignore[union-attr]
+                cache_key,
+                create_response,
+            )
+
+        return await create_response()
 
     return inner
 
 
-def view_validation_wrapper(view: Type['View']) -> 'View':
+def create_view_annotation_containers(view: Type['View']) -> Dict[str, AnnotationContainer]:
     annotation_containers = {}
 
     for method in (  # noqa: WPS335 WPS352
@@ -70,36 +122,66 @@ def view_validation_wrapper(view: Type['View']) -> 'View':
 
         annotation_containers[method.lower()] = create_annotation_container(method_handler)
 
+    return annotation_containers
+
+
+def _is_view_dispatch_overridden(view: Type['View']) -> bool:
+    return any(
+        getattr(view, attr_name) is not getattr(AioHTTPView, attr_name)
+        for attr_name in ('_iter', '__await__')
+    )
+
+
+def view_validation_wrapper(
+        view: Type['View'],
+        annotation_containers: Dict[str, AnnotationContainer],
+        response_serializer: ResponseSerializer,
+) -> Handler:
+    # NOTE: the methods are found once - the request calls the method of the view directly
+    dispatch_table: Dict[str, Tuple[AnnotationContainer, MethodHandler]] = {
+        method_name.upper(): (annotation_container, getattr(view, method_name))
+        for method_name, annotation_container in annotation_containers.items()
+    }
+    allowed_methods = frozenset(dispatch_table)
+    # NOTE: a view that changes how its method is called (`_iter` or `__await__`) is still awaited
+    is_dispatch_overridden = _is_view_dispatch_overridden(view)
+
     @wraps(view)
     async def inner(request: 'Request') -> StreamResponse:
-        instance_view = view(request)
-        method_name = request.method.lower()
-
-        try:
-            annotation_container = annotation_containers[method_name]
-        except KeyError:
-            instance_view._raise_allowed_methods()
-            raise  # for linters only
+        dispatch_item = dispatch_table.get(request.method)
+        if dispatch_item is None and not is_dispatch_overridden:
+            raise HTTPMethodNotAllowed(request.method, allowed_methods)
 
-        try:
-            method = getattr(instance_view, method_name)  # noqa: WPS442
-        except AttributeError:
-            instance_view._raise_allowed_methods()
-            raise  # for linters only
+        instance_view = view(request)
+        if dispatch_item is None:
+            return await instance_view
 
+        annotation_container, method = dispatch_item
         validated_data = await validate_request(
             request=request,
             annotation_container=annotation_container,
             errors_response_field_name=request._cache['errors_response_field_name'],  # FIXME
         )
 
-        setattr(instance_view, method_name, partial(method, **validated_data))
+        call_method = partial(_call_view_method, method, validated_data, instance_view, response_serializer)
+        if not is_dispatch_overridden:
+            return await call_method()
 
+        setattr(instance_view, request.method.lower(), call_method)
         return await instance_view
 
     return inner
 
 
+async def _call_view_method(
+        method: MethodHandler,
+        validated_data: Dict[str, Any],
+        instance_view: 'View',
+        response_serializer: ResponseSerializer,
+) -> StreamResponse:
+    return response_serializer(await _call_handler(method, validated_data, instance_view))
+
+
 def middleware_validation_wrapper(middleware: Middleware) -> Middleware:
     annotation_container = create_annotation_container(middleware)
 
@@ -116,3 +198,65 @@ def middleware_validation_wrapper(middleware: Middleware) -> Middleware:
         return await middleware(request, handler, **validated_data)
 
     return inner
+
+
+def get_body_max_size(annotation_containers: Mapping[str, AnnotationContainer]) -> Optional[int]:
+    body_max_sizes = [
+        annotation_container.body_max_size
+        for annotation_container in annotation_containers.values()
+        if annotation_container.body_max_size is not None
+    ]
+    return max(body_max_sizes) if body_max_sizes else None
+
+
+def check_content_length(request: 'Request', body_max_size: int) -> None:
+    content_length = request.content_length
+    if content_length is not None and content_length > body_max_size:
+        raise HTTPRequestEntityTooLarge(max_size=body_max_size, actual_size=content_length)
+
+
+def create_body_max_size_wrapper(handler: Handler, body_max_size: int) -> Handler:
+    # NOTE: the declared body length is checked before the extractors buffer the body
+    @wraps(handler)
+    async def inner(request: 'Request') -> StreamResponse:
+        check_content_length(request, body_max_size)
+        return await handler(request)
+
+    return inner
+
+
+def create_expect_handler(
+        annotation_containers: Mapping[str, AnnotationContainer],
+        body_max_size: Optional[int] = None,
+) -> Optional[ExpectHandler]:
+    # NOTE: `Expect: 100-continue` - the client waits for the answer before sending the body,
+    # so everything except the body is validated before a single body byte is uploaded.
+    if body_max_size is None and all(
+        annotation_container.body_max_size is None for annotation_container in annotation_containers.values()
+    ):
+        return None
+
+    async def expect_handler(request: 'Request') -> None:
+        if body_max_size is not None:
+            check_content_length(request, body_max_size)
+
+        annotation_container = annotation_containers.get(request.method.lower())
+        if annotation_container is None:
+            annotation_container = annotation_containers.get(hdrs.METH_ANY)
+
+        if annotation_container is not None and annotation_container.body_max_size is not None:
+            check_content_length(request, annotation_container.body_max_size)
+
+            await validate_request(
+                request=request,
+                annotation_container=(
+                    param_container
+                    for param_container in annotation_container
+                    if param_container.param_type != ParamType.body
+                ),
+                errors_response_field_name=request._cache['errors_response_field_name'],  # FIXME
+            )
+
+        await _default_expect_handler(request)
+
+    return expect_handler
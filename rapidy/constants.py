@@ -7,3 +7,10 @@ PYDANTIC_V2: Final[bool] = PYDANTIC_VERSION.startswith('2.')
 
 CLIENT_MAX_SIZE: Final[int] = 1024 ** 2
 MAX_BODY_SIZE: Final[int] = 1024 ** 2
+
+# NOTE: the minimum body read rate is not checked during the first seconds of the body reading
+BODY_MIN_READ_RATE_GRACE_PERIOD: Final[float] = 5.0
+
+# NOTE: the limits of the validation errors that are reported to the client
+CLIENT_ERRORS_MAX_COUNT: Final[int] = 100
+CLIENT_ERROR_MSG_MAX_LENGTH: Final[int] = 1024
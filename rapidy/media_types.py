@@ -5,3 +5,8 @@ ApplicationXWWWForm: Final[str] = 'application/x-www-form-urlencoded'
 MultipartForm: Final[str] = 'multipart/form-data'
 ApplicationBytes: Final[str] = 'application/octet-stream'
 TextPlain: Final[str] = 'text/plain'
+AnyMediaType: Final[str] = '*/*'
+ApplicationArrowStream: Final[str] = 'application/vnd.apache.arrow.stream'
+TextCsv: Final[str] = 'text/csv'
+ApplicationNDJSON: Final[str] = 'application/x-ndjson'
+TextEventStream: Final[str] = 'text/event-stream'
@@ -27,12 +27,17 @@ PARAMETERS_WITHOUT_DEFAULT_VALUES: Set[str] = {  # noqa: WPS407
     # QUERY
     f'{RAPIDY_PARAM_BASE}QueryRaw',
     # BODY
+    f'{RAPIDY_PARAM_BASE}BodyRaw',
     f'{RAPIDY_PARAM_BASE}StreamBody',
     f'{RAPIDY_PARAM_BASE}BytesBody',
     f'{RAPIDY_PARAM_BASE}TextBody',
     f'{RAPIDY_PARAM_BASE}JsonBodyRaw',
     f'{RAPIDY_PARAM_BASE}FormDataBodyRaw',
     f'{RAPIDY_PARAM_BASE}MultipartBodyRaw',
+    f'{RAPIDY_PARAM_BASE}NDArrayBody',
+    f'{RAPIDY_PARAM_BASE}ArrowBody',
+    f'{RAPIDY_PARAM_BASE}CsvBody',
+    f'{RAPIDY_PARAM_BASE}FileBody',
 }
 
 
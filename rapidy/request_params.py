@@ -2,14 +2,19 @@ import inspect
 from abc import ABC
 from copy import copy
 from functools import partial
-from typing import Any, Optional
+from os import PathLike
+from typing import Any, Optional, Sequence, Type, Union
 
 from aiohttp.typedefs import DEFAULT_JSON_DECODER, JSONDecoder
 
+from rapidy._arrow import extract_body_arrow, raise_if_pyarrow_is_not_installed
+from rapidy._csv import extract_body_csv
 from rapidy._extractors import (
+    extract_body_by_content_type,
     extract_body_bytes,
     extract_body_json,
     extract_body_multi_part,
+    extract_body_params_by_content_type,
     extract_body_stream,
     extract_body_text,
     extract_body_x_www_form,
@@ -19,16 +24,34 @@ from rapidy._extractors import (
     extract_query,
 )
 from rapidy._fields import create_field, get_annotation_from_field_info, ModelField, ParamFieldInfo
+from rapidy._file_body import extract_body_file, FILE_BODY_CHUNK_SIZE, SUPPORTED_FILE_DIGESTS
+from rapidy._json_limits import JsonLimits
+from rapidy._ndarray import create_ndarray_dtype, extract_body_ndarray
 from rapidy._request_params_base import ParamType, ValidateType
 from rapidy.constants import MAX_BODY_SIZE
-from rapidy.media_types import ApplicationBytes, ApplicationJSON, ApplicationXWWWForm, MultipartForm, TextPlain
+from rapidy.media_types import (
+    AnyMediaType,
+    ApplicationArrowStream,
+    ApplicationBytes,
+    ApplicationJSON,
+    ApplicationXWWWForm,
+    MultipartForm,
+    TextCsv,
+    TextPlain,
+)
 from rapidy.typedefs import NoArgAnyCallable, Required, Undefined
 
 __all__ = (
+    'ArrowBody',
+    'Body',
+    'BodySchema',
+    'BodyRaw',
     'BytesBody',
     'Cookie',
     'CookieSchema',
     'CookieRaw',
+    'CsvBody',
+    'FileBody',
     'FormDataBody',
     'FormDataBodySchema',
     'FormDataBodyRaw',
@@ -38,9 +61,11 @@ __all__ = (
     'JsonBody',
     'JsonBodySchema',
     'JsonBodyRaw',
+    'JsonLimits',
     'MultipartBody',
     'MultipartBodySchema',
     'MultipartBodyRaw',
+    'NDArrayBody',
     'Path',
     'PathSchema',
     'PathRaw',
@@ -174,6 +199,155 @@ class TextBody(BodyBase):
     can_default = False
 
 
+class NDArrayBody(BodyBase):
+    media_type = ApplicationBytes
+    extractor = staticmethod(extract_body_ndarray)
+    validate_type = ValidateType.no_validate
+    can_default = False
+
+    def __init__(
+            self,
+            default: Any = Undefined,
+            *,
+            default_factory: Optional[NoArgAnyCallable] = None,
+            body_max_size: Optional[int] = None,
+            dtype: Any = None,
+            shape: Optional[Sequence[Optional[int]]] = None,
+            max_elements: Optional[int] = None,
+            **field_info_kwargs: Any,
+    ) -> None:
+        self.extractor = partial(  # noqa: WPS601
+            self.extractor,
+            dtype=create_ndarray_dtype(dtype),
+            shape=tuple(shape) if shape is not None else None,
+            max_elements=max_elements,
+        )
+
+        super().__init__(
+            default=default,
+            default_factory=default_factory,
+            body_max_size=body_max_size,
+            **field_info_kwargs,
+        )
+
+
+class ArrowBody(BodyBase):
+    media_type = ApplicationArrowStream
+    extractor = staticmethod(extract_body_arrow)
+    validate_type = ValidateType.no_validate
+    can_default = False
+
+    def __init__(
+            self,
+            default: Any = Undefined,
+            *,
+            default_factory: Optional[NoArgAnyCallable] = None,
+            body_max_size: Optional[int] = None,
+            **field_info_kwargs: Any,
+    ) -> None:
+        raise_if_pyarrow_is_not_installed()
+
+        super().__init__(
+            default=default,
+            default_factory=default_factory,
+            body_max_size=body_max_size,
+            **field_info_kwargs,
+        )
+
+
+class FileBody(BodyBase):
+    media_type = ApplicationBytes
+    extractor = staticmethod(extract_body_file)
+    validate_type = ValidateType.no_validate
+    can_default = False
+
+    def __init__(
+            self,
+            default: Any = Undefined,
+            *,
+            default_factory: Optional[NoArgAnyCallable] = None,
+            body_max_size: Optional[int] = None,
+            directory: Optional[Union[str, 'PathLike[str]']] = None,
+            digests: Sequence[str] = ('sha256',),
+            verify_digest_headers: bool = True,
+            chunk_size: int = FILE_BODY_CHUNK_SIZE,
+            **field_info_kwargs: Any,
+    ) -> None:
+        unsupported_digests = set(digests) - set(SUPPORTED_FILE_DIGESTS)
+        if unsupported_digests:
+            raise BodyParamAttrDefinitionError(
+                f'FileBody does not support digests: {sorted(unsupported_digests)}. '
+                f'Supported digests: {list(SUPPORTED_FILE_DIGESTS)}.',
+            )
+
+        self.extractor = partial(  # noqa: WPS601
+            self.extractor,
+            directory=str(directory) if directory is not None else None,
+            digest_names=tuple(digests),
+            verify_digest_headers=verify_digest_headers,
+            chunk_size=chunk_size,
+        )
+
+        super().__init__(
+            default=default,
+            default_factory=default_factory,
+            body_max_size=body_max_size,
+            **field_info_kwargs,
+        )
+
+
+class CsvBody(BodyBase):
+    media_type = TextCsv
+    extractor = staticmethod(extract_body_csv)
+    validate_type = ValidateType.no_validate
+    can_default = False
+
+    def __init__(
+            self,
+            row_model: Type[Any],
+            default: Any = Undefined,
+            *,
+            default_factory: Optional[NoArgAnyCallable] = None,
+            body_max_size: Optional[int] = None,
+            batch_size: int = 1000,
+            columns: Optional[Sequence[str]] = None,
+            has_header: bool = True,
+            delimiter: str = ',',
+            quotechar: str = '"',
+            skip_invalid_rows: bool = False,
+            **field_info_kwargs: Any,
+    ) -> None:
+        if columns is None and not has_header:
+            raise BodyParamAttrDefinitionError(
+                'CsvBody without a header row requires `columns` for the positional mapping.',
+            )
+
+        if batch_size < 1:
+            raise BodyParamAttrDefinitionError('CsvBody `batch_size` must be greater than 0.')
+
+        super().__init__(
+            default=default,
+            default_factory=default_factory,
+            body_max_size=body_max_size,
+            **field_info_kwargs,
+        )
+
+        row_field_info = copy(self)
+        row_field_info.default = Required
+        row_field_info.default_factory = None
+
+        self.extractor = partial(  # noqa: WPS601
+            self.extractor,
+            row_field=create_field(name='row', type_=row_model, field_info=row_field_info),
+            batch_size=batch_size,
+            columns=tuple(columns) if columns is not None else None,
+            has_header=has_header,
+            delimiter=delimiter,
+            quotechar=quotechar,
+            skip_invalid_rows=skip_invalid_rows,
+        )
+
+
 class JsonBodyBase(BodyBase):
     media_type = ApplicationJSON
     extractor = staticmethod(extract_body_json)
@@ -185,11 +359,13 @@ class JsonBodyBase(BodyBase):
             default_factory: Optional[NoArgAnyCallable] = None,
             body_max_size: Optional[int] = None,
             json_decoder: Optional[JSONDecoder] = None,
+            json_limits: Optional[JsonLimits] = None,
             **field_info_kwargs: Any,
     ) -> None:
         self.extractor = partial(  # noqa: WPS601
             self.extractor,
             json_decoder=json_decoder or DEFAULT_JSON_DECODER,
+            json_limits=json_limits,
         )
 
         super().__init__(
@@ -210,12 +386,13 @@ class JsonBody(JsonBodyBase):
             default_factory: Optional[NoArgAnyCallable] = None,
             body_max_size: Optional[int] = None,
             json_decoder: Optional[JSONDecoder] = None,
+            json_limits: Optional[JsonLimits] = None,
             **field_info_kwargs: Any,
     ) -> None:
-        if body_max_size is not None or json_decoder is not None:
+        if body_max_size is not None or json_decoder is not None or json_limits is not None:
             raise BodyParamAttrDefinitionError(
-                'A single JsonBody parameter does not allow to determine `body_max_size` or `json_decoder`. '
-                'Please use JsonSchema or JsonRaw.',
+                'A single JsonBody parameter does not allow to determine `body_max_size`, `json_decoder` '
+                'or `json_limits`. Please use JsonSchema or JsonRaw.',
             )
 
         super().__init__(
@@ -376,6 +553,46 @@ class MultipartBodyRaw(MultipartBodyBase):
     can_default = False
 
 
+class BodyDispatchBase(BodyBase):
+    media_type = AnyMediaType
+    extractor = staticmethod(extract_body_by_content_type)
+
+
+class Body(BodyDispatchBase):
+    validate_type = ValidateType.param
+    extractor = staticmethod(extract_body_params_by_content_type)
+
+    def __init__(
+            self,
+            default: Any = Undefined,
+            *,
+            default_factory: Optional[NoArgAnyCallable] = None,
+            body_max_size: Optional[int] = None,
+            **field_info_kwargs: Any,
+    ) -> None:
+        if body_max_size is not None:
+            raise BodyParamAttrDefinitionError(
+                'A single Body parameter does not allow to determine `body_max_size`. '
+                'Please use BodySchema or BodyRaw.',
+            )
+
+        super().__init__(
+            default=default,
+            default_factory=default_factory,
+            body_max_size=body_max_size,
+            **field_info_kwargs,
+        )
+
+
+class BodySchema(BodyDispatchBase):
+    validate_type = ValidateType.schema
+
+
+class BodyRaw(BodyDispatchBase):
+    validate_type = ValidateType.no_validate
+    can_default = False
+
+
 def create_param_model_field_by_request_param(
         *,
         annotated_type: Any,
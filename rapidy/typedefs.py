@@ -44,6 +44,8 @@ __all__ = (
     'MethodHandler',
     'HandlerType',
     'HandlerOrMethod',
+    'BodyDecoder',
+    'BodyExtractor',
 )
 
 DictStrAny = Dict[str, Any]
@@ -66,6 +68,9 @@ RouterDeco = Callable[[HandlerType], HandlerType]
 
 NoArgAnyCallable = Callable[[], Any]
 
+BodyDecoder = Callable[[bytes], Any]
+BodyExtractor = Callable[..., Awaitable[Any]]
+
 if PYDANTIC_V1:
     from pydantic.error_wrappers import ErrorWrapper as ErrorWrapper
     from pydantic.fields import (
@@ -15,10 +15,16 @@ from aiohttp.web_ws import (
 )
 
 from rapidy.request_params import (
+    ArrowBody as ArrowBody,
+    Body as Body,
+    BodyRaw as BodyRaw,
+    BodySchema as BodySchema,
     BytesBody as BytesBody,
     Cookie as Cookie,
     CookieRaw as CookieRaw,
     CookieSchema as CookieSchema,
+    CsvBody as CsvBody,
+    FileBody as FileBody,
     FormDataBody as FormDataBody,
     FormDataBodyRaw as FormDataBodyRaw,
     FormDataBodySchema as FormDataBodySchema,
@@ -28,9 +34,11 @@ from rapidy.request_params import (
     JsonBody as JsonBody,
     JsonBodyRaw as JsonBodyRaw,
     JsonBodySchema as JsonBodySchema,
+    JsonLimits as JsonLimits,
     MultipartBody as MultipartBody,
     MultipartBodyRaw as MultipartBodyRaw,
     MultipartBodySchema as MultipartBodySchema,
+    NDArrayBody as NDArrayBody,
     Path as Path,
     PathRaw as PathRaw,
     PathSchema as PathSchema,
@@ -101,16 +109,38 @@ from rapidy.web_exceptions import (
     HTTPVariantAlsoNegotiates as HTTPVariantAlsoNegotiates,
     HTTPVersionNotSupported as HTTPVersionNotSupported,
 )
-from rapidy.web_middlewares import middleware as middleware, normalize_path_middleware as normalize_path_middleware
-from rapidy.web_request import BaseRequest as BaseRequest, FileField as FileField, Request as Request
+from rapidy.web_middlewares import (
+    compression_middleware as compression_middleware,
+    CompressionStats as CompressionStats,
+    middleware as middleware,
+    normalize_path_middleware as normalize_path_middleware,
+)
+from rapidy.web_request import (
+    BaseRequest as BaseRequest,
+    CsvRowsReader as CsvRowsReader,
+    FileField as FileField,
+    Request as Request,
+    UploadedFile as UploadedFile,
+)
 from rapidy.web_response import (
+    ArrowStreamResponse as ArrowStreamResponse,
+    cached as cached,
+    check_etag as check_etag,
     ContentCoding as ContentCoding,
+    EventSourceResponse as EventSourceResponse,
     json_response as json_response,
+    JsonStreamFormat as JsonStreamFormat,
+    JsonStreamResponse as JsonStreamResponse,
     Response as Response,
+    ResponseCache as ResponseCache,
+    ServerSentEvent as ServerSentEvent,
+    SingleFlight as SingleFlight,
     StreamResponse as StreamResponse,
 )
 from rapidy.web_routedef import (
     AbstractRouteDef as AbstractRouteDef,
+    constant as constant,
+    ConstantDef as ConstantDef,
     delete as delete,
     get as get,
     head as head,
@@ -139,6 +169,7 @@ from rapidy.web_runner import (
 from rapidy.web_urldispatcher import (
     AbstractResource as AbstractResource,
     AbstractRoute as AbstractRoute,
+    ConstantHandler as ConstantHandler,
     DynamicResource as DynamicResource,
     PlainResource as PlainResource,
     PrefixedSubAppResource as PrefixedSubAppResource,
@@ -218,20 +249,35 @@ __all = [
     # web_middlewares
     'middleware',
     'normalize_path_middleware',
+    'compression_middleware',
+    'CompressionStats',
     # web_request
     'BaseRequest',
+    'CsvRowsReader',
     'FileField',
     'Request',
+    'UploadedFile',
     # web_response
+    'ArrowStreamResponse',
     'ContentCoding',
+    'EventSourceResponse',
+    'JsonStreamFormat',
+    'JsonStreamResponse',
     'Response',
+    'ServerSentEvent',
     'StreamResponse',
     'json_response',
+    'check_etag',
+    'cached',
+    'ResponseCache',
+    'SingleFlight',
     # web_routedef
     'AbstractRouteDef',
+    'ConstantDef',
     'RouteDef',
     'RouteTableDef',
     'StaticDef',
+    'constant',
     'delete',
     'get',
     'head',
@@ -257,6 +303,7 @@ __all = [
     # web_urldispatcher
     'AbstractResource',
     'AbstractRoute',
+    'ConstantHandler',
     'DynamicResource',
     'PlainResource',
     'PrefixedSubAppResource',
@@ -273,10 +320,16 @@ __all = [
     'WSMsgType',
     'run_app',
     # request_params
+    'ArrowBody',
+    'Body',
+    'BodySchema',
+    'BodyRaw',
     'BytesBody',
     'Cookie',
     'CookieSchema',
     'CookieRaw',
+    'CsvBody',
+    'FileBody',
     'FormDataBody',
     'FormDataBodySchema',
     'FormDataBodyRaw',
@@ -286,9 +339,11 @@ __all = [
     'JsonBody',
     'JsonBodySchema',
     'JsonBodyRaw',
+    'JsonLimits',
     'MultipartBody',
     'MultipartBodySchema',
     'MultipartBodyRaw',
+    'NDArrayBody',
     'Path',
     'PathSchema',
     'PathRaw',
@@ -1,19 +1,28 @@
 import asyncio
 import logging
 import warnings
-from typing import Any, Callable, Coroutine, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type
 
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.http import SERVER_SOFTWARE
+from aiohttp.http_parser import RawRequestMessage
 from aiohttp.log import web_logger
+from aiohttp.streams import StreamReader
+from aiohttp.typedefs import LooseHeaders
 from aiohttp.web_app import Application as AiohttpApplication, CleanupError
 from aiohttp.web_middlewares import _fix_request_current_app
+from aiohttp.web_protocol import RequestHandler
 from aiohttp.web_request import Request
+from multidict import CIMultiDict
 
 from rapidy import hdrs
 from rapidy._annotation_container import AnnotationContainer
+from rapidy._body_decoders import BodyDecoderRegistry
+from rapidy._json_limits import JsonLimits
 from rapidy._version import SERVER_INFO
 from rapidy._web_request_validation import middleware_validation_wrapper
-from rapidy.constants import CLIENT_MAX_SIZE
-from rapidy.typedefs import Middleware
+from rapidy.constants import CLIENT_ERROR_MSG_MAX_LENGTH, CLIENT_ERRORS_MAX_COUNT, CLIENT_MAX_SIZE
+from rapidy.typedefs import BodyDecoder, Middleware
 from rapidy.web_middlewares import is_aiohttp_new_style_middleware, is_rapidy_middleware
 from rapidy.web_response import StreamResponse
 from rapidy.web_urldispatcher import UrlDispatcher
@@ -24,23 +33,25 @@ __all__ = (
 )
 
 
-InnerDeco = Callable[[], Coroutine[Any, Any, None]]
+class _Request(Request):
+    # NOTE: the response headers policy is a class attribute - the class is created once for the application,
+    # so the policy is applied without allocations per response and is kept by `request.clone()`
+    _server_header: Optional[str] = None
+    _default_headers: Tuple[Tuple[str, str], ...] = ()
 
-
-def hide_server_info_deco(show_server_info_in_response: bool = False) -> Callable[[Any], InnerDeco]:
-    def deco(prepare_headers_bound_method: Any) -> InnerDeco:
-        response = prepare_headers_bound_method.__self__
-
-        async def inner() -> None:
-            await prepare_headers_bound_method()
-            if show_server_info_in_response:
-                response._headers[hdrs.SERVER] = SERVER_INFO
+    async def _prepare_hook(self, response: StreamResponse) -> None:
+        headers = response.headers
+        # NOTE: the `Server` header set by the handler is not changed
+        if headers.get(hdrs.SERVER) == SERVER_SOFTWARE:
+            if self._server_header is None:
+                del headers[hdrs.SERVER]
             else:
-                response._headers.pop(hdrs.SERVER)
+                headers[hdrs.SERVER] = self._server_header
 
-        return inner
+        for header_name, header_value in self._default_headers:
+            headers.setdefault(header_name, header_value)
 
-    return deco
+        await super()._prepare_hook(response)
 
 
 class Application(AiohttpApplication):
@@ -53,12 +64,20 @@ class Application(AiohttpApplication):
             handler_args: Optional[Mapping[str, Any]] = None,
             client_max_size: int = CLIENT_MAX_SIZE,
             client_errors_response_field_name: str = 'errors',
+            client_errors_max_count: Optional[int] = CLIENT_ERRORS_MAX_COUNT,
+            client_error_msg_max_length: Optional[int] = CLIENT_ERROR_MSG_MAX_LENGTH,
             loop: Optional[asyncio.AbstractEventLoop] = None,
             debug: Any = ...,
             server_info_in_response: bool = False,
+            body_decoders: Optional[Mapping[str, BodyDecoder]] = None,
+            body_read_timeout: Optional[float] = None,
+            body_min_read_rate: Optional[float] = None,
+            json_limits: Optional[JsonLimits] = None,
+            default_headers: Optional[LooseHeaders] = None,
+            resolve_cache_size: Optional[int] = None,
     ) -> None:
-        # TODO: Add a check that in body extractors the size does not exceed the client size
-
+        # NOTE: `client_max_size` is the limit of the routes without the body params -
+        # the route limit (`body_max_size` of the route or of its body params) replaces it on the route resolving.
         super().__init__(
             logger=logger,
             router=router,
@@ -70,19 +89,63 @@ class Application(AiohttpApplication):
         )
 
         # NOTE: override aiohttp router
-        self._router = UrlDispatcher()
+        self._router = UrlDispatcher(resolve_cache_size=resolve_cache_size)
 
         self._client_errors_response_field_name = client_errors_response_field_name
+        self._client_errors_max_count = client_errors_max_count
+        self._client_error_msg_max_length = client_error_msg_max_length
 
         self._middleware_annotation_containers: Dict[int, AnnotationContainer] = {}
 
         # It is hidden by default, as I believe showing server information is a potential vulnerability.
-        self._hide_server_info_deco = hide_server_info_deco(server_info_in_response)
+        request_cls_attrs = {
+            '_server_header': SERVER_INFO if server_info_in_response else None,
+            '_default_headers': tuple(CIMultiDict(default_headers or {}).items()),
+        }
+        self._request_cls = type('Request', (_Request,), request_cls_attrs)
+
+        self._body_decoders = BodyDecoderRegistry(body_decoders)
+
+        self._body_read_timeout = body_read_timeout
+        self._body_min_read_rate = body_min_read_rate
+        self._json_limits = json_limits
 
     @property
     def router(self) -> UrlDispatcher:
         return self._router
 
+    @property
+    def body_decoders(self) -> BodyDecoderRegistry:
+        return self._body_decoders
+
+    @property
+    def body_read_timeout(self) -> Optional[float]:
+        return self._body_read_timeout
+
+    @property
+    def body_min_read_rate(self) -> Optional[float]:
+        return self._body_min_read_rate
+
+    @property
+    def json_limits(self) -> Optional[JsonLimits]:
+        return self._json_limits
+
+    def add_body_decoder(self, media_type: str, decoder: BodyDecoder) -> None:
+        self._body_decoders.add(media_type, decoder)
+
+    def pre_freeze(self) -> None:
+        if self.pre_frozen:
+            return
+
+        super().pre_freeze()
+        self._freeze_body_decoders()
+
+    def _freeze_body_decoders(self, parent: Optional[BodyDecoderRegistry] = None) -> None:
+        self._body_decoders.freeze(parent)
+        for subapp in self._subapps:
+            if isinstance(subapp, Application):
+                subapp._freeze_body_decoders(self._body_decoders)
+
     def _prepare_middleware(self) -> Iterator[Tuple[Middleware, bool]]:
         for middleware in reversed(self._middlewares):
             if is_aiohttp_new_style_middleware(middleware):
@@ -103,15 +166,20 @@ class Application(AiohttpApplication):
 
         yield _fix_request_current_app(self), True
 
-    async def _prepare_response(self, resp: StreamResponse) -> StreamResponse:
-        resp._prepare_headers = self._hide_server_info_deco(resp._prepare_headers)
-        return resp
+    def _make_request(
+            self,
+            message: RawRequestMessage,
+            payload: StreamReader,
+            protocol: RequestHandler,
+            writer: AbstractStreamWriter,
+            task: 'asyncio.Task[None]',
+            _cls: Type[Request] = Request,  # noqa: WPS117 the name must match the aiohttp `_make_request` signature
+    ) -> Request:
+        return super()._make_request(message, payload, protocol, writer, task, _cls=self._request_cls)
 
     async def _handle(self, request: Request) -> StreamResponse:
         request._cache['errors_response_field_name'] = self._client_errors_response_field_name  # FIXME
+        request._cache['errors_max_count'] = self._client_errors_max_count  # FIXME
+        request._cache['error_msg_max_length'] = self._client_error_msg_max_length  # FIXME
 
-        resp = await super()._handle(request)
-
-        await self._prepare_response(resp)
-
-        return resp
+        return await super()._handle(request)
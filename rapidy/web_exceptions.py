@@ -3,8 +3,7 @@ from rapidy._version import AIOHTTP_VERSION_TUPLE
 if AIOHTTP_VERSION_TUPLE >= (3, 9, 0):
     from aiohttp.web_exceptions import HTTPMove, NotAppKeyWarning
 
-import json
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from aiohttp.web_exceptions import (
     HTTPAccepted,
@@ -66,6 +65,8 @@ from aiohttp.web_exceptions import (
     HTTPVersionNotSupported,
 )
 
+from rapidy._json_encoders import encode_json_errors
+from rapidy.constants import CLIENT_ERROR_MSG_MAX_LENGTH, CLIENT_ERRORS_MAX_COUNT
 from rapidy.media_types import ApplicationJSON
 from rapidy.typedefs import LooseHeaders, ValidationErrorList
 
@@ -139,6 +140,28 @@ if AIOHTTP_VERSION_TUPLE >= (3, 9, 0):
 __all__ = tuple(__all)
 
 
+def _limit_errors(
+        errors: ValidationErrorList,
+        max_count: Optional[int],
+        msg_max_length: Optional[int],
+) -> ValidationErrorList:
+    if max_count is not None and len(errors) > max_count:
+        errors = errors[:max_count]
+
+    if msg_max_length is None:
+        return errors
+
+    return [_truncate_error_msg(error, msg_max_length) for error in errors]
+
+
+def _truncate_error_msg(error: Dict[str, Any], msg_max_length: int) -> Dict[str, Any]:
+    error_msg = error.get('msg')
+    if isinstance(error_msg, str) and len(error_msg) > msg_max_length:
+        return {**error, 'msg': error_msg[:msg_max_length]}
+
+    return error
+
+
 class HTTPValidationFailure(HTTPUnprocessableEntity):
     def __init__(
             self,
@@ -150,16 +173,29 @@ class HTTPValidationFailure(HTTPUnprocessableEntity):
             body: Any = None,
             text: Optional[str] = None,
             content_type: Optional[str] = None,
+            errors_max_count: Optional[int] = CLIENT_ERRORS_MAX_COUNT,
+            error_msg_max_length: Optional[int] = CLIENT_ERROR_MSG_MAX_LENGTH,
     ) -> None:
         self._errors = errors
+
+        is_rendered = body is None and text is None
+        if is_rendered:
+            # NOTE: the malformed requests can produce a lot of errors - only the first ones are rendered
+            body = encode_json_errors({
+                validation_failure_field_name: _limit_errors(errors, errors_max_count, error_msg_max_length),
+            })
+
         super().__init__(
             headers=headers,
             reason=reason,
             body=body,
-            text=json.dumps({validation_failure_field_name: errors}) if text is None else text,
+            text=text,
             content_type=ApplicationJSON if content_type is None else content_type,
         )
 
+        if is_rendered:
+            self.charset = 'utf-8'
+
     @property
     def validation_errors(self) -> ValidationErrorList:
         return self._errors
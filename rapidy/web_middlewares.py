@@ -2,13 +2,16 @@ from typing import TypeVar
 
 from aiohttp.web_middlewares import middleware as aiohttp_middleware, normalize_path_middleware
 
+from rapidy._compression import compression_middleware, CompressionStats
+from rapidy.typedefs import Middleware
+
 __all__ = (
     'middleware',
     'normalize_path_middleware',
+    'compression_middleware',
+    'CompressionStats',
 )
 
-from rapidy.typedefs import Middleware
-
 TMiddleware = TypeVar('TMiddleware')
 
 
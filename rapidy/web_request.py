@@ -1,7 +1,12 @@
 from aiohttp.web_request import BaseRequest, FileField, Request
 
+from rapidy._csv import CsvRowsReader
+from rapidy._file_body import UploadedFile
+
 __all__ = (
     'BaseRequest',
+    'CsvRowsReader',
     'FileField',
     'Request',
+    'UploadedFile',
 )
@@ -1,7 +1,23 @@
 from aiohttp.web_response import ContentCoding, json_response, Response, StreamResponse
 
+from rapidy._arrow import ArrowStreamResponse
+from rapidy._etag import check_etag
+from rapidy._json_stream import JsonStreamFormat, JsonStreamResponse
+from rapidy._response_cache import cached, ResponseCache
+from rapidy._single_flight import SingleFlight
+from rapidy._sse import EventSourceResponse, ServerSentEvent
+
 __all__ = (
+    'ArrowStreamResponse',
+    'check_etag',
+    'cached',
+    'ResponseCache',
+    'SingleFlight',
     'ContentCoding',
+    'EventSourceResponse',
+    'ServerSentEvent',
+    'JsonStreamFormat',
+    'JsonStreamResponse',
     'StreamResponse',
     'Response',
     'json_response',
@@ -1,4 +1,5 @@
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 from aiohttp.web_routedef import (
     AbstractRouteDef,
@@ -11,11 +12,13 @@ from aiohttp.web_routedef import (
 
 from rapidy import hdrs
 from rapidy.typedefs import HandlerType, RouterDeco
+from rapidy.web_urldispatcher import AbstractRoute, UrlDispatcher
 
 __all__ = (
     'AbstractRouteDef',
     'RouteDef',
     'StaticDef',
+    'ConstantDef',
     'RouteTableDef',
     'head',
     'options',
@@ -27,6 +30,7 @@ __all__ = (
     'route',
     'view',
     'static',
+    'constant',
 )
 
 
@@ -71,6 +75,24 @@ def delete(path: str, handler: HandlerType, **kwargs: Any) -> RouteDef:
     return route(hdrs.METH_DELETE, path, handler, **kwargs)
 
 
+@dataclass(frozen=True, repr=False)
+class ConstantDef(AbstractRouteDef):
+    path: str
+    data: Any
+    kwargs: Dict[str, Any]
+
+    def __repr__(self) -> str:
+        return f'<ConstantDef {self.path}>'
+
+    def register(self, router: UrlDispatcher) -> List[AbstractRoute]:  # type: ignore[override]
+        constant_handler = router.add_constant(self.path, self.data, **self.kwargs)
+        return [route_obj for route_obj in router.routes() if route_obj.handler == constant_handler.handle]
+
+
+def constant(path: str, data: Any, **kwargs: Any) -> ConstantDef:
+    return ConstantDef(path, data, kwargs)
+
+
 class RouteTableDef(AioHTTPRouteTableDef):
     def route(self, method: str, path: str, **kwargs: Any) -> RouterDeco:
         def inner(handler: HandlerType) -> HandlerType:
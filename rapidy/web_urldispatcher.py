@@ -1,14 +1,17 @@
 from abc import ABC
 from types import FunctionType
-from typing import Awaitable, Callable, cast, Optional, Type, Union
+from typing import Any, Awaitable, Callable, cast, Dict, Mapping, Optional, Set, Tuple, Type, Union
 
 from aiohttp.abc import AbstractView
+from aiohttp.web_exceptions import HTTPMethodNotAllowed, HTTPNotFound
+from aiohttp.web_request import Request
 from aiohttp.web_response import StreamResponse
 from aiohttp.web_urldispatcher import (
     _requote_path,
     AbstractResource,
     AbstractRoute,
     DynamicResource as AioHTTPDynamicResource,
+    MatchInfoError,
     PlainResource as AioHTTPPlainResource,
     PrefixedSubAppResource,
     Resource as AioHTTPResource,
@@ -21,10 +24,28 @@ from aiohttp.web_urldispatcher import (
 )
 
 from rapidy import hdrs
-from rapidy._web_request_validation import handler_validation_wrapper, view_validation_wrapper
+from rapidy._annotation_container import AnnotationContainer, create_annotation_container
+from rapidy._constant_handler import ConstantHandler
+from rapidy._etag import create_etag_wrapper, ETagVersion
+from rapidy._json_stream import JsonStreamFormat
+from rapidy._path_converters import compile_path_converters, PathConverter
+from rapidy._resolve_cache import ResolveCache
+from rapidy._resource_tree import ResourceTree
+from rapidy._response_cache import get_handler_response_cache, ResponseCache
+from rapidy._response_serializer import create_response_serializer, ResponseSerializer
+from rapidy._single_flight import SingleFlight
+from rapidy._web_request_validation import (
+    create_body_max_size_wrapper,
+    create_expect_handler,
+    create_view_annotation_containers,
+    get_body_max_size,
+    handler_validation_wrapper,
+    view_validation_wrapper,
+)
 from rapidy.typedefs import Handler, HandlerType
 
 __all__ = [
+    'ConstantHandler',
     'UrlDispatcher',
     'UrlMappingMatchInfo',
     'AbstractResource',
@@ -50,11 +71,40 @@ class ResourceRoute(AioHTTPResourceRoute, ABC):
             resource: AbstractResource,
             *,
             expect_handler: Optional[_ExpectHandler] = None,
+            body_read_timeout: Optional[float] = None,
+            body_min_read_rate: Optional[float] = None,
+            response_model: Optional[Any] = None,
+            response_stream_format: str = JsonStreamFormat.ndjson,
+            etag: Union[bool, ETagVersion] = False,
+            cache: Optional[ResponseCache] = None,
+            single_flight: Union[bool, SingleFlight] = False,
+            body_max_size: Optional[int] = None,
     ) -> None:
-        if isinstance(handler, FunctionType):
-            handler = handler_validation_wrapper(handler)
-        elif issubclass(handler, View):  # type: ignore[arg-type]
-            handler = view_validation_wrapper(handler)  # type: ignore[arg-type]
+        self.body_read_timeout = body_read_timeout
+        self.body_min_read_rate = body_min_read_rate
+        self.cache = cache if cache is not None else get_handler_response_cache(handler)
+        self.single_flight = _create_single_flight(single_flight)
+
+        # NOTE: handlers may return any json-serializable data instead of a response
+        response_serializer = create_response_serializer(response_model, response_stream_format)
+        handler, annotation_containers = self._create_validation_wrapper(handler, response_serializer)
+
+        path_converters: Mapping[str, PathConverter] = getattr(resource, 'path_converters', {})
+        for annotation_container in annotation_containers.values():
+            annotation_container.set_path_converters(path_converters)
+
+        if etag:
+            handler = create_etag_wrapper(handler, etag)
+
+        # NOTE: the route limit replaces the application `client_max_size` - see `UrlDispatcher.resolve`
+        self.body_max_size = body_max_size if body_max_size is not None else get_body_max_size(annotation_containers)
+        if body_max_size is not None:
+            # NOTE: the body params report the exceeded size as a validation error - the explicit limit is checked
+            # by the declared body length before the body is read
+            handler = create_body_max_size_wrapper(handler, body_max_size)
+
+        if expect_handler is None:
+            expect_handler = create_expect_handler(annotation_containers, body_max_size)
 
         super().__init__(
             method=method,
@@ -63,6 +113,43 @@ class ResourceRoute(AioHTTPResourceRoute, ABC):
             resource=resource,
         )
 
+    def _create_validation_wrapper(
+            self,
+            handler: HandlerType,
+            response_serializer: ResponseSerializer,
+    ) -> Tuple[HandlerType, Dict[str, AnnotationContainer]]:
+        if isinstance(handler, FunctionType):
+            annotation_container = create_annotation_container(handler, is_func_handler=True)
+            return (
+                handler_validation_wrapper(
+                    handler,
+                    annotation_container,
+                    response_serializer,
+                    self.cache,
+                    self.single_flight,
+                ),
+                {hdrs.METH_ANY: annotation_container},
+            )
+
+        if isinstance(handler, type) and issubclass(handler, View):
+            if self.cache is not None:
+                raise TypeError('Response cache is supported only for function handlers.')
+            if self.single_flight is not None:
+                raise TypeError('Single flight is supported only for function handlers.')
+
+            annotation_containers = create_view_annotation_containers(handler)
+            return view_validation_wrapper(handler, annotation_containers, response_serializer), annotation_containers
+
+        # NOTE: the other callables (e.g. `ConstantHandler`) are not validated
+        return cast(HandlerType, handler), {}
+
+
+def _create_single_flight(single_flight: Union[bool, SingleFlight]) -> Optional[SingleFlight]:
+    if isinstance(single_flight, SingleFlight):
+        return single_flight
+
+    return SingleFlight() if single_flight else None
+
 
 class Resource(AioHTTPResource, ABC):
     def add_route(
@@ -71,6 +158,7 @@ class Resource(AioHTTPResource, ABC):
         handler: Handler,
         *,
         expect_handler: Optional[_ExpectHandler] = None,
+        **route_options: Any,
     ) -> 'ResourceRoute':
 
         for route_obj in self._routes:
@@ -81,7 +169,7 @@ class Resource(AioHTTPResource, ABC):
                     'registered'.format(route=route_obj),
                 )
 
-        route_obj = ResourceRoute(method, handler, self, expect_handler=expect_handler)  # noqa: WPS440
+        route_obj = ResourceRoute(method, handler, self, expect_handler=expect_handler, **route_options)  # noqa: WPS440
         self.register_route(route_obj)  # noqa: WPS441
 
         return route_obj  # noqa: WPS441
@@ -92,10 +180,54 @@ class PlainResource(Resource, AioHTTPPlainResource):
 
 
 class DynamicResource(Resource, AioHTTPDynamicResource):
-    pass
+    def __init__(self, path: str, *, name: Optional[str] = None) -> None:
+        compiled_path, path_converters = compile_path_converters(path)
+        self._path_converters = path_converters
+        super().__init__(compiled_path, name=name)
+
+    @property
+    def path_converters(self) -> Mapping[str, PathConverter]:
+        return self._path_converters
 
 
 class UrlDispatcher(AioHTTPUrlDispatcher):
+    def __init__(self, *, resolve_cache_size: Optional[int] = None) -> None:
+        super().__init__()
+        self._resource_tree: Optional[ResourceTree] = None
+        self._resolve_cache = ResolveCache(resolve_cache_size) if resolve_cache_size else None
+        self._is_resolve_cache_enabled = False
+
+    @property
+    def resolve_cache(self) -> Optional[ResolveCache]:
+        return self._resolve_cache
+
+    def register_resource(self, resource: AbstractResource) -> None:
+        super().register_resource(resource)
+        if self._resolve_cache is not None:
+            self._resolve_cache.clear()
+
+    def freeze(self) -> None:
+        super().freeze()
+        # NOTE: the resources and their prefixes do not change after the freeze
+        self._resource_tree = ResourceTree(self._resources)
+        self._is_resolve_cache_enabled = self._resolve_cache is not None and self._resource_tree.is_path_resolvable
+        if self._resolve_cache is not None:
+            self._resolve_cache.clear()
+
+    async def resolve(self, request: Request) -> UrlMappingMatchInfo:
+        if self._resource_tree is None:
+            match_info = await super().resolve(request)
+        else:
+            match_info = await self._resolve(request, self._resource_tree)
+
+        # NOTE: the limit is set before the middlewares and the handler can read a single body byte
+        body_max_size: Optional[int] = getattr(match_info.route, 'body_max_size', None)
+        if body_max_size is not None:
+            # NOTE: the real limit is passed, so the aiohttp `413` reports the route limit
+            request._client_max_size = body_max_size  # noqa: WPS437
+
+        return match_info
+
     def add_resource(self, path: str, *, name: Optional[str] = None) -> Resource:
         if path and not path.startswith('/'):  # aiohttp code  # pragma: no cover
             raise ValueError('path should be started with / or be empty')
@@ -124,6 +256,55 @@ class UrlDispatcher(AioHTTPUrlDispatcher):
         *,
         name: Optional[str] = None,
         expect_handler: Optional[_ExpectHandler] = None,
+        **route_options: Any,
     ) -> AbstractRoute:
         resource = self.add_resource(path, name=name)
-        return resource.add_route(method, handler, expect_handler=expect_handler)
+        return resource.add_route(method, handler, expect_handler=expect_handler, **route_options)
+
+    def add_constant(
+        self,
+        path: str,
+        data: Any,
+        *,
+        name: Optional[str] = None,
+        **constant_options: Any,
+    ) -> ConstantHandler:
+        # NOTE: the response is encoded once - the route serves it without the validation and the handler call
+        constant_handler = ConstantHandler(data, **constant_options)
+        resource = self.add_resource(path, name=name)
+        resource.add_route(hdrs.METH_GET, constant_handler.handle)
+        resource.add_route(hdrs.METH_HEAD, constant_handler.handle)
+        return constant_handler
+
+    async def _resolve(self, request: Request, resource_tree: ResourceTree) -> UrlMappingMatchInfo:
+        method, path = request.method, request.rel_url.raw_path
+
+        # NOTE: the plain paths are found by a dict lookup and never cached - only the dynamic paths use the cache
+        is_cache_used = self._is_resolve_cache_enabled and not resource_tree.is_plain_path(path)
+        if is_cache_used:
+            cache_entry = self._resolve_cache.get(method, path)  # type: ignore[union-attr]
+            if cache_entry is not None:
+                route, match_dict = cache_entry
+                return UrlMappingMatchInfo(dict(match_dict), route)
+
+        allowed_methods: Set[str] = set()
+
+        for resource in resource_tree.find_resources(path, request.headers.get(hdrs.HOST)):
+            match_info, allowed = await resource.resolve(request)
+            if match_info is not None:
+                is_cacheable = (
+                    is_cache_used
+                    and isinstance(resource, AioHTTPDynamicResource)
+                    and not match_info.apps
+                )
+                if is_cacheable:
+                    self._resolve_cache.set(method, path, match_info.route, match_info)  # type: ignore[union-attr]
+
+                return match_info
+
+            allowed_methods |= allowed
+
+        if allowed_methods:
+            return MatchInfoError(HTTPMethodNotAllowed(request.method, allowed_methods))
+
+        return MatchInfoError(HTTPNotFound())
@@ -0,0 +1,100 @@
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+from rapidy.media_types import ApplicationArrowStream
+from tests.helpers import create_content_type_header
+
+pa = pytest.importorskip('pyarrow')
+
+SCHEMA = pa.schema([('id', pa.int64()), ('name', pa.string())])
+
+
+def _create_table(num_rows: int) -> Any:
+    return pa.table({'id': list(range(num_rows)), 'name': [str(i) for i in range(num_rows)]}, schema=SCHEMA)
+
+
+def _serialize_table(table: Any) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=100)
+    return sink.getvalue().to_pybytes()
+
+
+async def test_success_arrow_body(aiohttp_client: AiohttpClient) -> None:
+    table = _create_table(1000)
+
+    async def handler(
+            body: Annotated[Any, web.ArrowBody()],
+    ) -> web.Response:
+        assert body.equals(table)
+        return web.Response()
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post(
+        '/',
+        data=_serialize_table(table),
+        headers=create_content_type_header(ApplicationArrowStream),
+    )
+    assert resp.status == HTTPStatus.OK
+
+
+@pytest.mark.parametrize(
+    'body_max_size, data, err_msg', [
+        (None, b'not an arrow stream', 'Failed to extract body data as Arrow IPC stream: '),
+        (10, _serialize_table(_create_table(10)), 'Failed to extract body data. Body data exceeds the allowed size `10`'),
+    ],
+    ids=['invalid_stream', 'body_size_exceeded'],
+)
+async def test_failure_arrow_body(
+        aiohttp_client: AiohttpClient,
+        body_max_size: Any,
+        data: bytes,
+        err_msg: str,
+) -> None:
+    async def handler(
+            body: Annotated[Any, web.ArrowBody(body_max_size=body_max_size)],
+    ) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=data, headers=create_content_type_header(ApplicationArrowStream))
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    resp_json = await resp.json()
+    assert resp_json['errors'][0]['msg'].startswith(err_msg)
+
+
+async def test_success_arrow_stream_response(aiohttp_client: AiohttpClient) -> None:
+    table = _create_table(100_000)
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        response = web.ArrowStreamResponse(SCHEMA)
+        await response.prepare(request)
+        await response.write_table(table, max_chunksize=10_000)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == HTTPStatus.OK
+    assert resp.content_type == ApplicationArrowStream
+
+    with pa.ipc.open_stream(await resp.read()) as reader:
+        assert reader.read_all().equals(table)
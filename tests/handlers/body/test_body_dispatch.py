@@ -0,0 +1,200 @@
+import json
+from http import HTTPStatus
+from typing import Any, Dict
+
+import pytest
+from pydantic import BaseModel
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+from rapidy.media_types import ApplicationBytes, ApplicationJSON, ApplicationXWWWForm, TextPlain
+from rapidy.request_params import BodyParamAttrDefinitionError
+from tests.helpers import create_content_type_header
+
+
+class Schema(BaseModel):
+    attr1: str
+    attr2: int
+
+
+def _reversed_json_decoder(data: bytes) -> Dict[str, Any]:
+    return json.loads(data[::-1])
+
+
+@pytest.mark.parametrize(
+    'content_type, data', [
+        (ApplicationJSON, '{"attr1": "1", "attr2": 2}'),
+        ('application/vnd.api+json', '{"attr1": "1", "attr2": 2}'),
+        (f'{ApplicationJSON}; charset=utf-8', '{"attr1": "1", "attr2": 2}'),
+        (ApplicationXWWWForm, 'attr1=1&attr2=2'),
+    ],
+)
+async def test_success_dispatch_by_content_type(
+        aiohttp_client: AiohttpClient,
+        content_type: str,
+        data: str,
+) -> None:
+    async def schema_handler(
+            body: Annotated[Schema, web.BodySchema()],
+    ) -> web.Response:
+        assert body == Schema(attr1='1', attr2=2)
+        return web.Response()
+
+    async def param_handler(
+            attr1: Annotated[str, web.Body()],
+            attr2: Annotated[int, web.Body()],
+    ) -> web.Response:
+        assert attr1 == '1'
+        assert attr2 == 2
+        return web.Response()
+
+    app = web.Application()
+    app.add_routes([
+        web.post('/schema', schema_handler),
+        web.post('/param', param_handler),
+    ])
+
+    client = await aiohttp_client(app)
+
+    for path in ('/schema', '/param'):
+        resp = await client.post(path, data=data, headers=create_content_type_header(content_type))
+        assert resp.status == HTTPStatus.OK
+
+
+async def test_success_custom_body_decoder(aiohttp_client: AiohttpClient) -> None:
+    async def handler(
+            body: Annotated[Schema, web.BodySchema()],
+    ) -> web.Response:
+        assert body == Schema(attr1='1', attr2=2)
+        return web.Response()
+
+    app = web.Application(body_decoders={'application/x-reversed-json': _reversed_json_decoder})
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post(
+        '/',
+        data='{"attr1": "1", "attr2": 2}'[::-1],
+        headers=create_content_type_header('application/x-reversed-json'),
+    )
+    assert resp.status == HTTPStatus.OK
+
+
+async def test_success_subapp_inherits_body_decoders(aiohttp_client: AiohttpClient) -> None:
+    async def handler(
+            body: Annotated[Dict[str, Any], web.BodyRaw()],
+    ) -> web.Response:
+        return web.json_response(body)
+
+    subapp = web.Application()
+    subapp.add_routes([web.post('/', handler)])
+
+    app = web.Application()
+    app.add_body_decoder('Application/X-Reversed-Json', _reversed_json_decoder)
+    app.add_subapp('/v1', subapp)
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post(
+        '/v1/',
+        data='{"attr1": "1"}'[::-1],
+        headers=create_content_type_header('application/x-reversed-json'),
+    )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {'attr1': '1'}
+
+
+async def test_unsupported_media_type(aiohttp_client: AiohttpClient) -> None:
+    async def handler(
+            body: Annotated[Schema, web.BodySchema()],
+    ) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data='<xml/>', headers=create_content_type_header('application/xml'))
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert await resp.json() == {
+        'errors': [
+            {
+                'loc': ['body'],
+                'msg': 'Failed to extract body data. Unsupported media type `application/xml`',
+                'type': 'body_extraction',
+            },
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    'content_type, data', [
+        (TextPlain, 'attr1=1'),
+        (ApplicationBytes, b'attr1=1'),
+        (ApplicationJSON, '"abc"'),
+        (ApplicationJSON, '[1]'),
+        (ApplicationJSON, '1'),
+    ],
+)
+async def test_failure_body_params_from_not_object_body(
+        aiohttp_client: AiohttpClient,
+        content_type: str,
+        data: Any,
+) -> None:
+    async def handler(
+            attr1: Annotated[str, web.Body()],
+    ) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=data, headers=create_content_type_header(content_type))
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert await resp.json() == {
+        'errors': [
+            {
+                'loc': ['body'],
+                'msg': f'Failed to extract body data as `{content_type}`: the body is not an object',
+                'type': 'body_extraction',
+            },
+        ],
+    }
+
+
+async def test_custom_body_decoder_failure(aiohttp_client: AiohttpClient) -> None:
+    async def handler(
+            body: Annotated[Schema, web.BodySchema()],
+    ) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    app = web.Application(body_decoders={'application/x-reversed-json': _reversed_json_decoder})
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data='{', headers=create_content_type_header('application/x-reversed-json'))
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    resp_json = await resp.json()
+    assert resp_json['errors'][0]['msg'].startswith(
+        'Failed to extract body data as `application/x-reversed-json`: ',
+    )
+
+
+async def test_add_body_decoder_to_frozen_app() -> None:
+    app = web.Application()
+    app.freeze()
+
+    with pytest.raises(RuntimeError):
+        app.add_body_decoder('application/x-reversed-json', _reversed_json_decoder)
+
+
+async def test_failure_def_body_size_to_param() -> None:
+    with pytest.raises(BodyParamAttrDefinitionError):
+        web.Body(body_max_size=1)
@@ -0,0 +1,108 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+from rapidy.media_types import ApplicationJSON
+from tests.helpers import create_content_type_header
+
+
+async def _slow_body(num_of_chunks: int, delay: float) -> AsyncIterator[bytes]:
+    yield b'{"data": "'
+    for _ in range(num_of_chunks):
+        await asyncio.sleep(delay)
+        yield b'a'
+    yield b'"}'
+
+
+async def handler(
+        body: Annotated[Dict[str, Any], web.JsonBodyRaw()],
+) -> web.Response:
+    return web.json_response(body)
+
+
+@pytest.mark.parametrize(
+    'app_kwargs, route_kwargs', [
+        ({'body_read_timeout': 0.05}, {}),
+        ({}, {'body_read_timeout': 0.05}),
+        ({'body_read_timeout': 10}, {'body_read_timeout': 0.05}),
+    ],
+)
+async def test_body_read_timeout(
+        aiohttp_client: AiohttpClient,
+        app_kwargs: Dict[str, Any],
+        route_kwargs: Dict[str, Any],
+) -> None:
+    app = web.Application(**app_kwargs)
+    app.add_routes([web.post('/', handler, **route_kwargs)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=_slow_body(10, 0.02), headers=create_content_type_header(ApplicationJSON))
+    assert resp.status == HTTPStatus.REQUEST_TIMEOUT
+
+
+async def test_body_read_timeout_in_subapp(aiohttp_client: AiohttpClient) -> None:
+    subapp = web.Application()
+    subapp.add_routes([web.post('/', handler)])
+
+    app = web.Application(body_read_timeout=0.05)
+    app.add_subapp('/v1', subapp)
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/v1/', data=_slow_body(10, 0.02), headers=create_content_type_header(ApplicationJSON))
+    assert resp.status == HTTPStatus.REQUEST_TIMEOUT
+
+
+async def test_success_body_read_in_time(aiohttp_client: AiohttpClient) -> None:
+    app = web.Application(body_read_timeout=5, body_min_read_rate=1)
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=_slow_body(3, 0.01), headers=create_content_type_header(ApplicationJSON))
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {'data': 'aaa'}
+
+
+async def test_body_min_read_rate(aiohttp_client: AiohttpClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('rapidy._extractors.BODY_MIN_READ_RATE_GRACE_PERIOD', 0.05)
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler, body_min_read_rate=100)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=_slow_body(10, 0.05), headers=create_content_type_header(ApplicationJSON))
+    assert resp.status == HTTPStatus.REQUEST_TIMEOUT
+
+
+async def test_multipart_body_read_timeout(aiohttp_client: AiohttpClient) -> None:
+    async def multipart_handler(
+            body: Annotated[Dict[str, Any], web.MultipartBodyRaw()],
+    ) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    async def slow_multipart_body() -> AsyncIterator[bytes]:
+        yield b'--boundary\r\nContent-Disposition: form-data; name="data"\r\n\r\n'
+        for _ in range(10):
+            await asyncio.sleep(0.02)
+            yield b'a'
+        yield b'\r\n--boundary--\r\n'
+
+    app = web.Application()
+    app.add_routes([web.post('/', multipart_handler, body_read_timeout=0.05)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post(
+        '/',
+        data=slow_multipart_body(),
+        headers=create_content_type_header('multipart/form-data; boundary=boundary'),
+    )
+    assert resp.status == HTTPStatus.REQUEST_TIMEOUT
@@ -0,0 +1,130 @@
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+from pydantic import BaseModel
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+from rapidy.media_types import TextCsv
+from rapidy.request_params import BodyParamAttrDefinitionError
+from tests.helpers import create_content_type_header
+
+
+class Row(BaseModel):
+    id: int
+    name: str
+
+
+async def _create_client(aiohttp_client: AiohttpClient, **csv_kwargs: Any) -> Any:
+    async def handler(
+            rows: Annotated[web.CsvRowsReader[Row], web.CsvBody(Row, **csv_kwargs)],
+    ) -> web.Response:
+        batches: List[List[Dict[str, Any]]] = []
+        async for batch in rows:
+            batches.append([row.model_dump() if hasattr(row, 'model_dump') else row.dict() for row in batch])
+
+        return web.json_response({'batches': batches, 'errors': rows.errors})
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    return await aiohttp_client(app)
+
+
+async def _iter_chunks(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), chunk_size):
+        yield data[i:i + chunk_size]
+
+
+@pytest.mark.parametrize(
+    'csv_kwargs, data', [
+        ({}, 'id,name\n1,a\n2,b\n3,c\n'),
+        ({}, 'name,id\r\na,1\r\nb,2\r\n\r\nc,3'),
+        ({'has_header': False, 'columns': ['id', 'name']}, '1,a\n2,b\n3,c\n'),
+        ({'columns': ['id', 'name']}, 'ID,NAME\n1,a\n2,b\n3,c\n'),
+        ({'delimiter': ';'}, 'id;name\n1;a\n2;b\n3;c\n'),
+    ],
+)
+async def test_success_csv_body(aiohttp_client: AiohttpClient, csv_kwargs: Dict[str, Any], data: str) -> None:
+    client = await _create_client(aiohttp_client, batch_size=2, **csv_kwargs)
+
+    resp = await client.post('/', data=data, headers=create_content_type_header(TextCsv))
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {
+        'batches': [
+            [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}],
+            [{'id': 3, 'name': 'c'}],
+        ],
+        'errors': [],
+    }
+
+
+async def test_success_csv_body_streamed_by_chunks(aiohttp_client: AiohttpClient) -> None:
+    client = await _create_client(aiohttp_client, batch_size=100)
+
+    lines = ['id,name'] + [f'{i},"multi\nline, {i}"' for i in range(1000)]
+    data = '\n'.join(lines).encode()
+
+    resp = await client.post('/', data=_iter_chunks(data, 7), headers=create_content_type_header(TextCsv))
+    assert resp.status == HTTPStatus.OK
+
+    resp_json = await resp.json()
+    assert len(resp_json['batches']) == 10
+    assert resp_json['batches'][9][99] == {'id': 999, 'name': 'multi\nline, 999'}
+
+
+async def test_success_csv_quoted_field_spanning_chunks(aiohttp_client: AiohttpClient) -> None:
+    client = await _create_client(aiohttp_client)
+
+    name = 'a "quoted"\nvalue, ' * 2_000
+    escaped_name = name.replace('"', '""')
+    data = f'id,name\n1,"{escaped_name}"\n2,b\n'.encode()
+
+    resp = await client.post('/', data=_iter_chunks(data, 1024), headers=create_content_type_header(TextCsv))
+    assert resp.status == HTTPStatus.OK
+    assert (await resp.json())['batches'] == [[{'id': 1, 'name': name}, {'id': 2, 'name': 'b'}]]
+
+
+async def test_failure_csv_row_validation(aiohttp_client: AiohttpClient) -> None:
+    client = await _create_client(aiohttp_client)
+
+    resp = await client.post('/', data='id,name\n1,a\nx,b\n3\n', headers=create_content_type_header(TextCsv))
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    errors = (await resp.json())['errors']
+    assert [error['loc'] for error in errors] == [['body', 3, 'id'], ['body', 4]]
+    assert errors[1]['msg'] == 'Failed to extract body data as CSV: row has `1` columns, expected `2`'
+
+
+async def test_success_csv_skip_invalid_rows(aiohttp_client: AiohttpClient) -> None:
+    client = await _create_client(aiohttp_client, skip_invalid_rows=True)
+
+    resp = await client.post('/', data='id,name\n1,a\nx,b\n3,c\n', headers=create_content_type_header(TextCsv))
+    assert resp.status == HTTPStatus.OK
+
+    resp_json = await resp.json()
+    assert resp_json['batches'] == [[{'id': 1, 'name': 'a'}, {'id': 3, 'name': 'c'}]]
+    assert [error['loc'] for error in resp_json['errors']] == [['body', 3, 'id']]
+
+
+async def test_failure_csv_body_size_exceeded(aiohttp_client: AiohttpClient) -> None:
+    client = await _create_client(aiohttp_client, body_max_size=10)
+
+    resp = await client.post('/', data='id,name\n1,a\n2,b\n', headers=create_content_type_header(TextCsv))
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert (await resp.json())['errors'][0]['msg'] == (
+        'Failed to extract body data. Body data exceeds the allowed size `10`'
+    )
+
+
+@pytest.mark.parametrize(
+    'csv_kwargs', [
+        {'has_header': False},
+        {'batch_size': 0},
+    ],
+)
+def test_failure_csv_body_definition(csv_kwargs: Dict[str, Any]) -> None:
+    with pytest.raises(BodyParamAttrDefinitionError):
+        web.CsvBody(Row, **csv_kwargs)
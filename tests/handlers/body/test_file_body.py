@@ -0,0 +1,167 @@
+import asyncio
+import base64
+import hashlib
+import zlib
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import hdrs, web
+from rapidy.request_params import BodyParamAttrDefinitionError
+
+DATA = b'artifact' * 100_000
+
+
+async def test_success_file_body(aiohttp_client: AiohttpClient, tmp_path: Path) -> None:
+    async def handler(
+            file: Annotated[web.UploadedFile, web.FileBody(directory=tmp_path, digests=('sha256', 'md5', 'crc32'))],
+    ) -> web.Response:
+        assert file.path.parent == tmp_path
+        assert file.path.read_bytes() == DATA
+        return web.json_response({'size': file.size, 'digests': file.digests})
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=DATA)
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {
+        'size': len(DATA),
+        'digests': {
+            'sha256': hashlib.sha256(DATA).hexdigest(),
+            'md5': hashlib.md5(DATA).hexdigest(),  # noqa: S324
+            'crc32': zlib.crc32(DATA).to_bytes(4, 'big').hex(),
+        },
+    }
+
+
+async def test_success_temporary_file_is_removed(aiohttp_client: AiohttpClient, tmp_path: Path) -> None:
+    paths = []
+
+    async def handler(
+            file: Annotated[web.UploadedFile, web.FileBody()],
+    ) -> web.Response:
+        assert file.path.exists()
+        paths.append(file.path)
+        return web.Response()
+
+    async def move_handler(
+            file: Annotated[web.UploadedFile, web.FileBody()],
+    ) -> web.Response:
+        await file.move_to(tmp_path / 'artifact')
+        return web.Response()
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler), web.post('/move', move_handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=DATA)
+    assert resp.status == HTTPStatus.OK
+    await _wait_removed(paths[0])
+
+    resp = await client.post('/move', data=DATA)
+    assert resp.status == HTTPStatus.OK
+    assert (tmp_path / 'artifact').read_bytes() == DATA
+
+
+async def test_success_temporary_file_response(aiohttp_client: AiohttpClient) -> None:
+    paths = []
+
+    async def handler(
+            file: Annotated[web.UploadedFile, web.FileBody()],
+    ) -> web.FileResponse:
+        paths.append(file.path)
+        return web.FileResponse(file.path)
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    # NOTE: the temporary file is removed only after it is sent
+    resp = await client.post('/', data=DATA)
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == DATA
+    await _wait_removed(paths[0])
+
+
+async def _wait_removed(path: Path) -> None:
+    # NOTE: the file is removed in the thread pool after the response is sent
+    for _ in range(100):
+        if not path.exists():
+            return
+        await asyncio.sleep(0.01)
+
+    raise AssertionError(f'{path} is not removed')
+
+
+@pytest.mark.parametrize(
+    'headers, file_body_kwargs, err_msg', [
+        ({hdrs.CONTENT_MD5: base64.b64encode(hashlib.md5(b'').digest()).decode()}, {}, '`md5` digest does not match the body'),  # noqa: E501 S324
+        ({hdrs.DIGEST: 'sha-256=' + base64.b64encode(hashlib.sha256(b'').digest()).decode()}, {}, '`sha256` digest does not match the body'),  # noqa: E501
+        ({hdrs.CONTENT_MD5: '!'}, {}, 'invalid digest header'),
+        ({}, {'body_max_size': 10}, None),
+    ],
+)
+async def test_failure_file_body(
+        aiohttp_client: AiohttpClient,
+        tmp_path: Path,
+        headers: Dict[str, str],
+        file_body_kwargs: Dict[str, Any],
+        err_msg: Any,
+) -> None:
+    async def handler(
+            file: Annotated[web.UploadedFile, web.FileBody(directory=tmp_path, **file_body_kwargs)],
+    ) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data=DATA, headers=headers)
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    resp_msg = (await resp.json())['errors'][0]['msg']
+    if err_msg is None:
+        assert resp_msg == 'Failed to extract body data. Body data exceeds the allowed size `10`'
+    else:
+        assert resp_msg == f'Failed to extract body data as file: {err_msg}'
+
+    assert not list(tmp_path.iterdir())
+
+
+async def test_success_verify_digest_headers(aiohttp_client: AiohttpClient) -> None:
+    async def handler(
+            file: Annotated[web.UploadedFile, web.FileBody(digests=())],
+    ) -> web.Response:
+        assert file.digests == {}
+        return web.Response()
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post(
+        '/',
+        data=DATA,
+        headers={
+            hdrs.CONTENT_MD5: base64.b64encode(hashlib.md5(DATA).digest()).decode(),  # noqa: S324
+            hdrs.DIGEST: 'SHA-256=' + base64.b64encode(hashlib.sha256(DATA).digest()).decode(),
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+
+
+def test_failure_def_unsupported_digest() -> None:
+    with pytest.raises(BodyParamAttrDefinitionError):
+        web.FileBody(digests=('sha3',))
@@ -0,0 +1,147 @@
+from http import HTTPStatus
+from typing import Any, Dict
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+from rapidy._client_errors import ExtractJsonLimitError
+from rapidy.request_params import BodyParamAttrDefinitionError
+
+
+async def handler(
+        body: Annotated[Any, web.JsonBodyRaw(json_limits=web.JsonLimits(max_depth=2, max_keys=2))],
+) -> web.Response:
+    return web.json_response(body)
+
+
+async def app_limits_handler(
+        body: Annotated[Any, web.JsonBodyRaw()],
+) -> web.Response:
+    return web.json_response(body)
+
+
+def _limit_error(limit_error: str) -> Dict[str, Any]:
+    return {
+        'errors': [
+            {
+                'loc': ['body'],
+                'type': 'body_extraction',
+                'msg': f'Failed to extract body data as Json: {limit_error}',
+            },
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    'json_limits, body', [
+        (web.JsonLimits(max_depth=2), {'a': [1, {'b': 2}]}),
+        (web.JsonLimits(max_depth=2), [[[]]]),
+        (web.JsonLimits(max_keys=1), {'a': 1, 'b': 2}),
+        (web.JsonLimits(max_keys=1), [{'a': 1}, {'a': 1, 'b': {}}]),
+        (web.JsonLimits(max_array_length=2), [1, 2, 3]),
+        (web.JsonLimits(max_array_length=2), {'a': [[], [1, '2', 3]]}),
+        (web.JsonLimits(max_string_length=3), {'a': 'abcd'}),
+        (web.JsonLimits(max_string_length=3), {'abcd': 1}),
+        (web.JsonLimits(max_string_length=3), {'a': 'ab\\u0441d'}),
+    ],
+)
+async def test_json_limits_exceeded(aiohttp_client: AiohttpClient, json_limits: web.JsonLimits, body: Any) -> None:
+    app = web.Application(json_limits=json_limits)
+    app.add_routes([web.post('/', app_limits_handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', json=body)
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    'json_limits, body', [
+        (web.JsonLimits(max_depth=2), {'a': [1, '[[[{{{', 2]}),
+        (web.JsonLimits(max_keys=2), {'a': 1, 'b': 'x,y,z'}),
+        (web.JsonLimits(max_array_length=3), [1, [4, 5, 6], '\\",,,,']),
+        (web.JsonLimits(max_string_length=3), {'abc': 'a\\"'}),
+        (web.JsonLimits(max_string_length=3), {'a': 'a\u0441d'}),  # NOTE: sent as an escape sequence
+        (web.JsonLimits(max_depth=1, max_keys=1, max_array_length=1, max_string_length=1), {}),
+    ],
+)
+async def test_json_limits_not_exceeded(aiohttp_client: AiohttpClient, json_limits: web.JsonLimits, body: Any) -> None:
+    app = web.Application(json_limits=json_limits)
+    app.add_routes([web.post('/', app_limits_handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', json=body)
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == body
+
+
+@pytest.mark.parametrize(
+    'body, limit_error', [
+        ([[[1]]], 'nesting depth exceeds the allowed `2`'),
+        ({'a': 1, 'b': 2, 'c': 3}, 'object key count exceeds the allowed `2`'),
+    ],
+)
+async def test_param_json_limits(aiohttp_client: AiohttpClient, body: Any, limit_error: str) -> None:
+    app = web.Application(json_limits=web.JsonLimits(max_depth=10, max_keys=10))
+    app.add_routes([web.post('/', handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', json=body)
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert await resp.json() == _limit_error(limit_error)
+
+
+async def test_json_limits_in_subapp(aiohttp_client: AiohttpClient) -> None:
+    subapp = web.Application()
+    subapp.add_routes([web.post('/', app_limits_handler)])
+
+    app = web.Application(json_limits=web.JsonLimits(max_array_length=1))
+    app.add_subapp('/v1', subapp)
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/v1/', json=[1, 2])
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert await resp.json() == _limit_error('array length exceeds the allowed `1`')
+
+
+async def test_json_limits_default_max_depth(aiohttp_client: AiohttpClient) -> None:
+    app = web.Application(json_limits=web.JsonLimits(max_keys=10))
+    app.add_routes([web.post('/', app_limits_handler)])
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', data='[' * 1001 + ']' * 1001, headers={'Content-Type': 'application/json'})
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert await resp.json() == _limit_error('nesting depth exceeds the allowed `1000`')
+
+
+@pytest.mark.parametrize(
+    'json_limits, limit_error', [
+        (web.JsonLimits(max_array_length=1000), 'array length exceeds the allowed `1000`'),
+        (web.JsonLimits(max_depth=900), 'nesting depth exceeds the allowed `900`'),
+    ],
+)
+def test_json_limits_deep_and_long_body(json_limits: web.JsonLimits, limit_error: str) -> None:
+    # NOTE: the structure is scanned once - the nesting does not multiply the work on the long arrays
+    body = '[' + '[' * 900 + ']' * 900 + ',0' * 450_000 + ']'
+
+    with pytest.raises(ExtractJsonLimitError) as exc_info:
+        json_limits.check(body)
+
+    assert exc_info.value.get_error_info(loc=('body',))['msg'] == f'Failed to extract body data as Json: {limit_error}'
+
+
+@pytest.mark.parametrize('limit_name', ['max_depth', 'max_keys', 'max_array_length', 'max_string_length'])
+def test_json_limits_must_be_positive(limit_name: str) -> None:
+    with pytest.raises(ValueError):
+        web.JsonLimits(**{limit_name: 0})
+
+
+def test_single_json_body_json_limits_not_allowed() -> None:
+    with pytest.raises(BodyParamAttrDefinitionError):
+        web.JsonBody(json_limits=web.JsonLimits(max_depth=1))
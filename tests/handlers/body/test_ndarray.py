@@ -0,0 +1,109 @@
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Sequence
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+from rapidy.media_types import ApplicationBytes, ApplicationJSON
+from tests.helpers import create_content_type_header
+
+np = pytest.importorskip('numpy')
+
+
+def _create_ndarray_headers(dtype: str, shape: Optional[str] = None) -> Dict[str, str]:
+    headers = {**create_content_type_header(ApplicationBytes), 'X-NDArray-Dtype': dtype}
+    if shape is not None:
+        headers['X-NDArray-Shape'] = shape
+    return headers
+
+
+async def _create_client(aiohttp_client: AiohttpClient, **ndarray_kwargs: Any) -> Any:
+    async def handler(
+            array: Annotated[Any, web.NDArrayBody(**ndarray_kwargs)],
+    ) -> web.Response:
+        return web.json_response({'dtype': str(array.dtype), 'shape': list(array.shape), 'data': array.tolist()})
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+
+    return await aiohttp_client(app)
+
+
+@pytest.mark.parametrize(
+    'data, expected_shape', [
+        ('[1, 2.5, 3]', [3]),
+        ('[[1, 2], [3, 4], [5, 6]]', [3, 2]),
+        ('[[[1], [2]], [[3], [4]]]', [2, 2, 1]),
+        ('[ ]', [0]),
+        ('[[], []]', [2, 0]),
+    ],
+)
+async def test_success_json_array(aiohttp_client: AiohttpClient, data: str, expected_shape: Sequence[int]) -> None:
+    client = await _create_client(aiohttp_client)
+
+    resp = await client.post('/', data=data, headers=create_content_type_header(ApplicationJSON))
+    assert resp.status == HTTPStatus.OK
+
+    resp_json = await resp.json()
+    assert resp_json['dtype'] == 'float64'
+    assert resp_json['shape'] == expected_shape
+    assert np.array_equal(np.array(resp_json['data']).reshape(expected_shape), np.array(eval(data)))  # noqa: S307
+
+
+async def test_success_bytes_array(aiohttp_client: AiohttpClient) -> None:
+    client = await _create_client(aiohttp_client, dtype='float32', shape=(None, 2))
+
+    data = np.arange(6, dtype='>f4')
+
+    resp = await client.post('/', data=data.tobytes(), headers=_create_ndarray_headers('>f4', '3,2'))
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {
+        'dtype': 'float32',
+        'shape': [3, 2],
+        'data': [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]],
+    }
+
+
+@pytest.mark.parametrize(
+    'ndarray_kwargs, data, headers, err_msg', [
+        ({}, '[[1, 2], [3]]', create_content_type_header(ApplicationJSON), 'JSON array is not rectangular'),
+        ({}, '[[1, 2], 3]', create_content_type_header(ApplicationJSON), 'JSON array is not rectangular'),
+        ({}, '[1, "2"]', create_content_type_header(ApplicationJSON), 'JSON array contains values that are not `float64`'),
+        ({}, '[1, 2]]', create_content_type_header(ApplicationJSON), 'invalid JSON array structure'),
+        ({}, '{"a": 1}', create_content_type_header(ApplicationJSON), 'JSON body must be an array'),
+        ({'max_elements': 2}, '[1, 2, 3]', create_content_type_header(ApplicationJSON), 'number of elements exceeds the allowed `2`'),
+        ({'shape': (2,)}, '[1, 2, 3]', create_content_type_header(ApplicationJSON), 'array shape `(3,)` does not match the expected `(2)`'),
+        ({}, b'\x00' * 8, create_content_type_header(ApplicationBytes), 'header `X-NDArray-Dtype` is required'),
+        ({}, b'\x00' * 8, _create_ndarray_headers('object'), 'unsupported dtype `object`'),
+        ({}, b'\x00' * 7, _create_ndarray_headers('float32'), 'body size is not a multiple of the dtype `float32` item size'),
+        ({}, b'\x00' * 8, _create_ndarray_headers('float32', '3'), 'shape `3` does not match the body size'),
+        ({'dtype': 'int32'}, b'\x00' * 8, _create_ndarray_headers('float32'), 'dtype `float32` cannot be converted to `int32`'),
+    ],
+)
+async def test_failure_extract(
+        aiohttp_client: AiohttpClient,
+        ndarray_kwargs: Dict[str, Any],
+        data: Any,
+        headers: Dict[str, str],
+        err_msg: str,
+) -> None:
+    client = await _create_client(aiohttp_client, **ndarray_kwargs)
+
+    resp = await client.post('/', data=data, headers=headers)
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert await resp.json() == {
+        'errors': [
+            {
+                'loc': ['body'],
+                'msg': f'Failed to extract body data as NDArray: {err_msg}',
+                'type': 'body_extraction',
+            },
+        ],
+    }
+
+
+async def test_failure_def_not_numeric_dtype() -> None:
+    with pytest.raises(TypeError):
+        web.NDArrayBody(dtype=object)
@@ -0,0 +1,83 @@
+from http import HTTPStatus
+from typing import List
+
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+from rapidy.typedefs import Handler
+
+CLIENT_MAX_SIZE = 1024
+LARGE_BODY = b'0' * CLIENT_MAX_SIZE * 10
+
+
+async def test_body_param_max_size(aiohttp_client: AiohttpClient) -> None:
+    async def upload_handler(body: Annotated[bytes, web.BytesBody(body_max_size=len(LARGE_BODY))]) -> int:
+        return len(body)
+
+    async def raw_handler(request: web.Request) -> int:
+        return len(await request.read())  # pragma: no cover
+
+    app = web.Application(client_max_size=CLIENT_MAX_SIZE)
+    upload_route = app.router.add_post('/upload', upload_handler)
+    raw_route = app.router.add_post('/raw', raw_handler)
+    client = await aiohttp_client(app)
+
+    assert upload_route.body_max_size == len(LARGE_BODY)  # type: ignore[attr-defined]
+    assert raw_route.body_max_size is None  # type: ignore[attr-defined]
+
+    resp = await client.post('/upload', data=LARGE_BODY)
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == len(LARGE_BODY)
+
+    # NOTE: the routes without the body params keep the application limit
+    resp = await client.post('/raw', data=LARGE_BODY)
+    assert resp.status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+async def test_route_body_max_size(aiohttp_client: AiohttpClient) -> None:
+    read_sizes: List[int] = []
+
+    @web.middleware
+    async def read_body_middleware(request: web.Request, handler: Handler) -> web.StreamResponse:
+        # NOTE: the route limit is already applied when the middlewares read the body
+        read_sizes.append(len(await request.read()))
+        return await handler(request)
+
+    async def handler(request: web.Request) -> int:
+        return len(await request.read())
+
+    app = web.Application(client_max_size=CLIENT_MAX_SIZE, middlewares=[read_body_middleware])
+    app.router.add_post('/upload', handler, body_max_size=len(LARGE_BODY))
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/upload', data=LARGE_BODY[:-1])
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == len(LARGE_BODY) - 1
+    assert read_sizes == [len(LARGE_BODY) - 1]
+
+    # NOTE: `request.read()` follows the aiohttp `client_max_size` rule - the body that reaches the limit is rejected
+    resp = await client.post('/upload', data=LARGE_BODY)
+    assert resp.status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert f'Maximum request body size {len(LARGE_BODY)} exceeded' in await resp.text()
+
+
+async def test_route_body_max_size_checked_before_read(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    async def handler(body: Annotated[bytes, web.BytesBody(body_max_size=len(LARGE_BODY))]) -> int:
+        handler_calls.append(len(body))  # pragma: no cover
+        return len(body)  # pragma: no cover
+
+    app = web.Application()
+    app.router.add_post('/upload', handler, body_max_size=CLIENT_MAX_SIZE)
+    client = await aiohttp_client(app)
+
+    # NOTE: the declared body length exceeds the route limit - the body is not read at all
+    resp = await client.post('/upload', data=LARGE_BODY)
+    assert resp.status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert 'Maximum request body size 1024 exceeded' in await resp.text()
+
+    resp = await client.post('/upload', data=LARGE_BODY, expect100=True)
+    assert resp.status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert handler_calls == []
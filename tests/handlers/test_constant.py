@@ -0,0 +1,87 @@
+import gzip
+import json
+from typing import Any, Dict, List
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+BIG_CONFIG = {'flags': {f'flag_{flag_num}': True for flag_num in range(200)}}
+
+
+@pytest.mark.parametrize(
+    'data, content_type, expected_body', [
+        ({'status': 'ok'}, 'application/json; charset=utf-8', b'{"status":"ok"}'),
+        ('ok', 'text/plain; charset=utf-8', b'ok'),
+        (b'\x00\x01', 'application/octet-stream', b'\x00\x01'),
+    ],
+)
+async def test_constant(aiohttp_client: AiohttpClient, data: Any, content_type: str, expected_body: bytes) -> None:
+    app = web.Application()
+    app.add_routes([web.constant('/', data)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert resp.headers['Content-Type'] == content_type
+    assert resp.headers['ETag']
+    assert await resp.read() == expected_body
+
+    resp = await client.head('/')
+    assert resp.status == 200
+
+
+async def test_constant_not_modified(aiohttp_client: AiohttpClient) -> None:
+    app = web.Application()
+    app.router.add_constant('/', {'status': 'ok'})
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    etag = resp.headers['ETag']
+
+    resp = await client.get('/', headers={'If-None-Match': f'"other", W/{etag}'})
+    assert resp.status == 304
+    assert resp.headers['ETag'] == etag
+    assert await resp.read() == b''
+
+
+async def test_constant_codings(aiohttp_client: AiohttpClient) -> None:
+    app = web.Application()
+    app.router.add_constant('/config.json', BIG_CONFIG, codings=('gzip',))
+    client = await aiohttp_client(app, auto_decompress=False)
+
+    resp = await client.get('/config.json', headers={'Accept-Encoding': 'gzip'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert resp.headers['Vary'] == 'Accept-Encoding'
+    gzip_etag = resp.headers['ETag']
+    body = gzip.decompress(await resp.read())
+    assert json.loads(body) == BIG_CONFIG
+
+    resp = await client.get('/config.json', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in resp.headers
+    assert resp.headers['ETag'] != gzip_etag
+    assert await resp.read() == body
+
+
+async def test_constant_factory_invalidate(aiohttp_client: AiohttpClient) -> None:
+    calls: List[int] = []
+
+    async def factory() -> Dict[str, int]:
+        calls.append(1)
+        return {'version': len(calls)}
+
+    app = web.Application()
+    constant_handler = app.router.add_constant('/', factory, headers={'Cache-Control': 'no-cache'})
+    client = await aiohttp_client(app)
+
+    for _ in range(3):
+        resp = await client.get('/')
+        assert await resp.json() == {'version': 1}
+        assert resp.headers['Cache-Control'] == 'no-cache'
+
+    constant_handler.invalidate()
+
+    resp = await client.get('/')
+    assert await resp.json() == {'version': 2}
+    assert len(calls) == 2
@@ -0,0 +1,104 @@
+from typing import Dict, List
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+
+async def test_body_etag(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> Dict[str, str]:
+        return {'data': 'value'}
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, etag=True)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    etag = resp.headers['ETag']
+
+    resp = await client.get('/', headers={'If-None-Match': etag})
+    assert resp.status == 304
+    assert resp.headers['ETag'] == etag
+    assert await resp.read() == b''
+
+    resp = await client.get('/', headers={'If-None-Match': '"other"'})
+    assert resp.status == 200
+
+
+async def test_not_modified_headers(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> web.Response:
+        return web.Response(text='data', headers={'Cache-Control': 'max-age=60', 'X-Custom': 'value'})
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, etag=True)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    resp = await client.get('/', headers={'If-None-Match': resp.headers['ETag']})
+    assert resp.status == 304
+    assert resp.headers['Cache-Control'] == 'max-age=60'
+    assert 'X-Custom' not in resp.headers
+
+
+@pytest.mark.parametrize('is_async_version', [True, False])
+async def test_version_etag(aiohttp_client: AiohttpClient, is_async_version: bool) -> None:
+    handler_calls: List[int] = []
+
+    async def handler() -> Dict[str, str]:
+        handler_calls.append(1)
+        return {'data': 'value'}
+
+    async def async_version(request: web.Request) -> str:
+        return request.match_info['version']
+
+    def version(request: web.Request) -> str:
+        return request.match_info['version']
+
+    app = web.Application()
+    app.add_routes([web.get('/{version}', handler, etag=async_version if is_async_version else version)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/v1')
+    assert resp.status == 200
+    assert resp.headers['ETag'] == '"v1"'
+
+    resp = await client.get('/v1', headers={'If-None-Match': 'W/"v1"'})
+    assert resp.status == 304
+    assert resp.headers['ETag'] == '"v1"'
+    assert len(handler_calls) == 1
+
+    resp = await client.get('/v2', headers={'If-None-Match': '"v1"'})
+    assert resp.status == 200
+    assert resp.headers['ETag'] == '"v2"'
+
+
+async def test_check_etag_in_handler(aiohttp_client: AiohttpClient) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        etag = web.check_etag(request, 'v1')
+        return web.Response(text='data', headers={'ETag': etag})
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert resp.headers['ETag'] == '"v1"'
+
+    resp = await client.get('/', headers={'If-None-Match': '*'})
+    assert resp.status == 304
+
+
+async def test_etag_not_for_unsafe_methods(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> web.Response:
+        return web.Response(text='data')
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler, etag=True)])
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', headers={'If-None-Match': '*'})
+    assert resp.status == 200
+    assert 'ETag' not in resp.headers
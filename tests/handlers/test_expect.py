@@ -0,0 +1,68 @@
+from http import HTTPStatus
+from typing import Any, Dict
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+from typing_extensions import Annotated
+
+from rapidy import web
+
+
+class BodyView(web.View):
+    async def post(
+            self,
+            token: Annotated[str, web.Header(alias='X-Token', min_length=3)],
+            body: Annotated[bytes, web.BytesBody(body_max_size=10)],
+    ) -> web.Response:
+        return web.Response(body=body)
+
+
+async def handler(
+        token: Annotated[str, web.Header(alias='X-Token', min_length=3)],
+        body: Annotated[bytes, web.BytesBody(body_max_size=10)],
+) -> web.Response:
+    return web.Response(body=body)
+
+
+@pytest.fixture
+async def client(aiohttp_client: AiohttpClient) -> Any:
+    app = web.Application()
+    app.add_routes([
+        web.post('/', handler),
+        web.view('/view', BodyView),
+    ])
+    return await aiohttp_client(app)
+
+
+@pytest.mark.parametrize('path', ['/', '/view'])
+async def test_success_expect_continue(client: Any, path: str) -> None:
+    resp = await client.post(path, data=b'data', headers={'X-Token': 'token'}, expect100=True)
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b'data'
+
+
+@pytest.mark.parametrize('path', ['/', '/view'])
+@pytest.mark.parametrize(
+    'headers, data, expected_status', [
+        ({'X-Token': 't'}, b'data', HTTPStatus.UNPROCESSABLE_ENTITY),
+        ({}, b'data', HTTPStatus.UNPROCESSABLE_ENTITY),
+        ({'X-Token': 'token'}, b'd' * 11, HTTPStatus.REQUEST_ENTITY_TOO_LARGE),
+    ],
+)
+async def test_failure_expect_continue(
+        client: Any,
+        path: str,
+        headers: Dict[str, str],
+        data: bytes,
+        expected_status: HTTPStatus,
+) -> None:
+    resp = await client.post(path, data=data, headers=headers, expect100=True)
+    assert resp.status == expected_status
+
+
+async def test_validation_errors_in_expect_phase(client: Any) -> None:
+    resp = await client.post('/', data=b'data', headers={'X-Token': 't'}, expect100=True)
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    resp_json = await resp.json()
+    assert [error['loc'] for error in resp_json['errors']] == [['header', 'X-Token']]
@@ -33,3 +33,53 @@ async def test_class_handler_method_not_allowed(aiohttp_client: AiohttpClient) -
     resp = await client.post('/')
 
     assert resp.status == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+async def test_class_handler_allowed_methods(aiohttp_client: AiohttpClient) -> None:
+    class ViewHandler(web.View):
+        async def get(self, item_id: int = web.Query()) -> int:
+            assert isinstance(self, ViewHandler)
+            return item_id
+
+        async def post(self) -> web.Response:
+            return web.Response()
+
+    app = web.Application()
+    app.router.add_view('/', ViewHandler)
+
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/', params={'item_id': '1'})
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == 1
+
+    resp = await client.delete('/')
+    assert resp.status == HTTPStatus.METHOD_NOT_ALLOWED
+    assert resp.headers['Allow'] == 'GET,POST'
+
+
+async def test_class_handler_overridden_iter(aiohttp_client: AiohttpClient) -> None:
+    class ViewHandler(web.View):
+        async def _iter(self) -> web.StreamResponse:
+            if self.request.method == 'DELETE':
+                return web.Response(text='custom')
+
+            resp = await super()._iter()
+            resp.headers['X-View'] = 'custom'
+            return resp
+
+        async def get(self, item_id: int = web.Query()) -> int:
+            return item_id
+
+    app = web.Application()
+    app.router.add_view('/', ViewHandler)
+
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/', params={'item_id': '1'})
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers['X-View'] == 'custom'
+    assert await resp.json() == 1
+
+    resp = await client.delete('/')
+    assert await resp.text() == 'custom'
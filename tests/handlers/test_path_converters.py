@@ -0,0 +1,112 @@
+import uuid
+from http import HTTPStatus
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+
+async def test_int_converter(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[Any] = []
+
+    async def handler(request: web.Request, item_id: int = web.Path()) -> Dict[str, Any]:
+        handler_calls.append(request.match_info['item_id'])
+        return {'item_id': item_id}
+
+    async def new_item_handler() -> str:
+        return 'new'
+
+    app = web.Application()
+    app.router.add_get('/items/{item_id:int}', handler, name='item')
+    app.router.add_get('/items/new', new_item_handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/items/42')
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {'item_id': 42}
+    # NOTE: `match_info` keeps the raw string - only the handler param is converted
+    assert handler_calls == ['42']
+
+    resp = await client.get('/items/new')
+    assert await resp.json() == 'new'
+
+    # NOTE: the value that is not converted does not match the route - the handler is not called
+    resp = await client.get('/items/abc')
+    assert resp.status == HTTPStatus.NOT_FOUND
+    assert handler_calls == ['42']
+
+    assert str(app.router['item'].url_for(item_id='7')) == '/items/7'
+
+
+async def test_uuid_and_slug_converters(aiohttp_client: AiohttpClient) -> None:
+    async def handler(
+            user_id: uuid.UUID = web.Path(),
+            slug: str = web.Path(),
+    ) -> Dict[str, Any]:
+        assert isinstance(user_id, uuid.UUID)
+        return {'user_id': str(user_id), 'slug': slug}
+
+    app = web.Application()
+    app.router.add_get('/users/{user_id:uuid}/posts/{slug:slug}', handler)
+    client = await aiohttp_client(app)
+
+    user_id = uuid.uuid4()
+    resp = await client.get(f'/users/{user_id}/posts/hello-world_1')
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {'user_id': str(user_id), 'slug': 'hello-world_1'}
+
+    resp = await client.get('/users/1/posts/hello-world')
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+    resp = await client.get(f'/users/{user_id}/posts/hello.world')
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_converter_with_constraints(aiohttp_client: AiohttpClient) -> None:
+    async def handler(item_id: int = web.Path(ge=10)) -> int:
+        return item_id
+
+    app = web.Application()
+    app.router.add_get('/items/{item_id:int}', handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/items/10')
+    assert await resp.json() == 10
+
+    # NOTE: the field constraints are still validated
+    resp = await client.get('/items/5')
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+class ItemPath(BaseModel):
+    item_id: str
+
+
+async def test_converter_with_other_field_types(aiohttp_client: AiohttpClient) -> None:
+    async def str_handler(item_id: str = web.Path()) -> Dict[str, Any]:
+        return {'item_id': item_id}
+
+    async def raw_handler(path: Dict[str, Any] = web.PathRaw()) -> Dict[str, Any]:
+        return {'types': [type(path_value).__name__ for path_value in path.values()]}
+
+    async def schema_handler(path: ItemPath = web.PathSchema()) -> Dict[str, Any]:
+        return {'item_id': path.item_id}
+
+    app = web.Application()
+    app.router.add_get('/str/{item_id:int}', str_handler)
+    app.router.add_get('/raw/{item_id:int}/{user_id:uuid}', raw_handler)
+    app.router.add_get('/schema/{item_id:int}', schema_handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/str/007')
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {'item_id': '007'}
+
+    resp = await client.get(f'/raw/1/{uuid.uuid4()}')
+    assert await resp.json() == {'types': ['str', 'str']}
+
+    resp = await client.get('/schema/007')
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {'item_id': '007'}
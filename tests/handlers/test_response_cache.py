@@ -0,0 +1,175 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+
+async def test_cached(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    @web.cached(ttl=60)
+    async def handler(item_id: int = web.Path()) -> Dict[str, Any]:
+        handler_calls.append(item_id)
+        return {'item_id': item_id, 'call': len(handler_calls)}
+
+    app = web.Application()
+    app.add_routes([web.get('/{item_id}', handler)])
+    client = await aiohttp_client(app)
+
+    for _ in range(3):
+        resp = await client.get('/1')
+        assert resp.status == 200
+        assert resp.headers['Content-Type'] == 'application/json; charset=utf-8'
+        assert await resp.json() == {'item_id': 1, 'call': 1}
+
+    resp = await client.get('/2')
+    assert await resp.json() == {'item_id': 2, 'call': 2}
+
+    route_cache = next(iter(app.router.routes())).cache  # type: ignore[attr-defined]
+    assert route_cache.hits == 2
+    assert route_cache.misses == 2
+    assert len(route_cache) == 2
+
+
+async def test_cache_ttl_and_key(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    async def handler(item_id: int = web.Path(), version: str = web.Query('v1')) -> Dict[str, Any]:
+        handler_calls.append(item_id)
+        return {'call': len(handler_calls)}
+
+    cache = web.ResponseCache(ttl=0.05, key=lambda validated_data: validated_data['item_id'])
+    app = web.Application()
+    app.add_routes([web.get('/{item_id}', handler, cache=cache)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/1')
+    assert await resp.json() == {'call': 1}
+
+    resp = await client.get('/1', params={'version': 'v2'})
+    assert await resp.json() == {'call': 1}
+
+    await asyncio.sleep(0.06)
+
+    resp = await client.get('/1')
+    assert await resp.json() == {'call': 2}
+
+
+async def test_cache_eviction(aiohttp_client: AiohttpClient) -> None:
+    async def handler(item_id: int = web.Path()) -> web.Response:
+        return web.Response(body=b'x' * 100)
+
+    cache = web.ResponseCache(ttl=60, max_entries=3, max_bytes=250)
+    app = web.Application()
+    app.add_routes([web.get('/{item_id}', handler, cache=cache)])
+    client = await aiohttp_client(app)
+
+    for item_id in range(5):
+        await client.get(f'/{item_id}')
+
+    assert len(cache) == 2
+    assert cache.size <= 250
+
+
+@pytest.mark.parametrize(
+    'response_kwargs', [
+        {'status': 201, 'text': 'data'},
+        {'text': 'data', 'headers': {'Set-Cookie': 'session=1'}},
+    ],
+)
+async def test_not_cached_responses(aiohttp_client: AiohttpClient, response_kwargs: Dict[str, Any]) -> None:
+    async def handler() -> web.Response:
+        return web.Response(**response_kwargs)
+
+    cache = web.ResponseCache(ttl=60)
+    app = web.Application()
+    app.add_routes([web.get('/', handler, cache=cache)])
+    client = await aiohttp_client(app)
+
+    await client.get('/')
+    assert len(cache) == 0
+
+
+async def test_cache_stampede_protection(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    async def handler() -> Dict[str, int]:
+        handler_calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'call': len(handler_calls)}
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, cache=web.ResponseCache(ttl=60))])
+    client = await aiohttp_client(app)
+
+    responses = await asyncio.gather(*(client.get('/') for _ in range(10)))
+    assert [await resp.json() for resp in responses] == [{'call': 1}] * 10
+    assert len(handler_calls) == 1
+
+
+async def test_shared_cache_key_has_route(aiohttp_client: AiohttpClient) -> None:
+    async def get_user(item_id: int = web.Path()) -> Dict[str, Any]:
+        return {'user': item_id}
+
+    async def get_admin(item_id: int = web.Path()) -> Dict[str, Any]:
+        return {'admin': item_id}
+
+    cache = web.ResponseCache(ttl=60)
+    app = web.Application()
+    app.add_routes([
+        web.get('/users/{item_id}', get_user, cache=cache),
+        web.get('/admins/{item_id}', get_admin, cache=cache),
+    ])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/users/1')
+    assert await resp.json() == {'user': 1}
+
+    resp = await client.get('/admins/1')
+    assert await resp.json() == {'admin': 1}
+    assert len(cache) == 2
+
+
+async def test_unsafe_methods_not_cached(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    async def handler() -> Dict[str, int]:
+        handler_calls.append(1)
+        return {'call': len(handler_calls)}
+
+    cache = web.ResponseCache(ttl=60)
+    app = web.Application()
+    app.add_routes([web.route('*', '/', handler, cache=cache)])
+    client = await aiohttp_client(app)
+
+    for call_num in range(1, 4):
+        resp = await client.post('/')
+        assert await resp.json() == {'call': call_num}
+
+    assert len(cache) == 0
+
+    resp = await client.get('/')
+    assert await resp.json() == {'call': 4}
+    assert len(cache) == 1
+
+
+def test_request_param_handler_cache_not_supported() -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    app = web.Application()
+    with pytest.raises(TypeError, match='`request` parameter'):
+        app.add_routes([web.get('/', handler, cache=web.ResponseCache(ttl=60))])
+
+
+def test_view_cache_not_supported() -> None:
+    class ItemView(web.View):
+        async def get(self) -> web.Response:
+            return web.Response()
+
+    app = web.Application()
+    with pytest.raises(TypeError):
+        app.add_routes([web.view('/', ItemView, cache=web.ResponseCache(ttl=60))])
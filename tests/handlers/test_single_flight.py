@@ -0,0 +1,182 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+
+async def test_single_flight(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+    release = asyncio.Event()
+
+    async def handler(item_id: int = web.Path()) -> Dict[str, Any]:
+        handler_calls.append(item_id)
+        call = len(handler_calls)
+        await release.wait()
+        return {'item_id': item_id, 'call': call}
+
+    app = web.Application()
+    app.add_routes([web.get('/{item_id}', handler, single_flight=True)])
+    client = await aiohttp_client(app)
+
+    requests = [asyncio.ensure_future(client.get(path)) for path in ('/1', '/1', '/1', '/2')]
+    await asyncio.sleep(0.05)
+    release.set()
+
+    responses = await asyncio.gather(*requests)
+    assert [await resp.json() for resp in responses] == [
+        {'item_id': 1, 'call': 1},
+        {'item_id': 1, 'call': 1},
+        {'item_id': 1, 'call': 1},
+        {'item_id': 2, 'call': 2},
+    ]
+
+    get_route = next(route for route in app.router.routes() if route.method == 'GET')
+    route_single_flight = get_route.single_flight  # type: ignore[attr-defined]
+    assert route_single_flight.coalesced == 2
+    assert len(route_single_flight) == 0
+
+    # NOTE: the completed flight holds no data
+    await client.get('/1')
+    assert handler_calls == [1, 2, 1]
+
+
+async def test_single_flight_exception(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    async def handler(item_id: int = web.Path()) -> Dict[str, Any]:
+        handler_calls.append(item_id)
+        await asyncio.sleep(0.05)
+        if item_id == 1:
+            raise web.HTTPNotFound(text='not found')
+        raise ValueError
+
+    app = web.Application()
+    app.add_routes([web.get('/{item_id}', handler, single_flight=True)])
+    client = await aiohttp_client(app)
+
+    responses = await asyncio.gather(*(client.get(path) for path in ('/1', '/1', '/2', '/2')))
+    assert [resp.status for resp in responses] == [404, 404, 500, 500]
+    assert [await resp.text() for resp in responses[:2]] == ['not found', 'not found']
+    assert handler_calls == [1, 2]
+
+
+async def test_single_flight_cancellation() -> None:
+    single_flight = web.SingleFlight()
+    handler_calls: List[int] = []
+    handler_cancelled = asyncio.Event()
+
+    async def create_response() -> web.StreamResponse:
+        handler_calls.append(1)
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            handler_cancelled.set()
+            raise
+        return web.Response(text='ok')
+
+    leader = asyncio.ensure_future(single_flight.get_response('key', create_response))
+    waiter = asyncio.ensure_future(single_flight.get_response('key', create_response))
+    await asyncio.sleep(0)
+
+    # NOTE: the cancelled request does not cancel the handler of the other requests
+    leader.cancel()
+    resp = await waiter
+    assert resp.text == 'ok'
+    assert handler_calls == [1]
+
+    leader = asyncio.ensure_future(single_flight.get_response('key', create_response))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.wait_for(handler_cancelled.wait(), 1)
+    assert len(single_flight) == 0
+
+
+async def test_single_flight_stream(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    async def handler() -> AsyncIterator[Dict[str, Any]]:
+        handler_calls.append(1)
+        await asyncio.sleep(0.05)
+        yield {'call': len(handler_calls)}
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, single_flight=True)])
+    client = await aiohttp_client(app)
+
+    # NOTE: a streamed response is sent only once - the other requests get their own stream
+    responses = await asyncio.gather(client.get('/'), client.get('/'))
+    assert [resp.status for resp in responses] == [200, 200]
+    assert len(handler_calls) == 2
+
+
+async def test_single_flight_not_copied_exception(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[int] = []
+
+    async def handler() -> Dict[str, Any]:
+        handler_calls.append(1)
+        await asyncio.sleep(0.05)
+        raise web.HTTPFound('/other')
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, single_flight=True)])
+    client = await aiohttp_client(app)
+
+    # NOTE: a redirect can't be copied - the other requests call the handler themselves
+    responses = await asyncio.gather(*(client.get('/', allow_redirects=False) for _ in range(2)))
+    assert [(resp.status, resp.headers['Location']) for resp in responses] == [(302, '/other')] * 2
+    assert len(handler_calls) == 2
+
+
+async def test_single_flight_key_has_route_and_method(aiohttp_client: AiohttpClient) -> None:
+    handler_calls: List[str] = []
+
+    async def get_user(item_id: int = web.Path()) -> Dict[str, Any]:
+        handler_calls.append('user')
+        await asyncio.sleep(0.05)
+        return {'user': item_id}
+
+    async def create_item(item_id: int = web.Path()) -> Dict[str, Any]:
+        handler_calls.append('create')
+        await asyncio.sleep(0.05)
+        return {'item': item_id}
+
+    single_flight = web.SingleFlight()
+    app = web.Application()
+    app.add_routes([
+        web.get('/users/{item_id}', get_user, single_flight=single_flight),
+        web.get('/admins/{item_id}', get_user, single_flight=single_flight),
+        web.post('/items/{item_id}', create_item, single_flight=single_flight),
+    ])
+    client = await aiohttp_client(app)
+
+    responses = await asyncio.gather(client.get('/users/1'), client.get('/admins/1'))
+    assert [await resp.json() for resp in responses] == [{'user': 1}, {'user': 1}]
+    assert handler_calls == ['user', 'user']
+
+    # NOTE: the unsafe methods are never coalesced
+    responses = await asyncio.gather(*(client.post('/items/1') for _ in range(3)))
+    assert [resp.status for resp in responses] == [200] * 3
+    assert handler_calls.count('create') == 3
+    assert single_flight.coalesced == 0
+
+
+def test_single_flight_request_param_not_supported() -> None:
+    async def handler(request: web.Request) -> str:
+        return 'ok'  # pragma: no cover
+
+    app = web.Application()
+    with pytest.raises(TypeError, match='`request` parameter'):
+        app.router.add_route('GET', '/', handler, single_flight=True)
+
+
+def test_single_flight_view() -> None:
+    class View(web.View):
+        async def get(self) -> str:
+            return 'ok'
+
+    app = web.Application()
+    with pytest.raises(TypeError, match='Single flight is supported only for function handlers.'):
+        app.router.add_route('GET', '/', View, single_flight=True)
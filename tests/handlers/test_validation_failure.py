@@ -1,6 +1,7 @@
 from http import HTTPStatus
 from typing import Any, Dict, List
 
+import pytest
 from pydantic import BaseModel, Field
 from pytest_aiohttp.plugin import AiohttpClient
 from typing_extensions import Annotated, Final
@@ -347,3 +348,56 @@ def pydantic_v2_err_check(resp_json: Dict[str, Any]) -> None:
             },
         ],
     }
+
+
+async def test_errors_limits(aiohttp_client: AiohttpClient) -> None:
+    async def handler(
+            attr1: Annotated[int, Query()],
+            attr2: Annotated[int, Query()],
+            attr3: Annotated[int, Query()],
+    ) -> web.Response:
+        return web.Response()
+
+    app = web.Application(client_errors_max_count=2, client_error_msg_max_length=5)
+    app.router.add_get('/', handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert resp.headers['Content-Type'] == 'application/json; charset=utf-8'
+
+    resp_json = await resp.json()
+    assert [error['loc'] for error in resp_json['errors']] == [['query', 'attr1'], ['query', 'attr2']]
+    assert {error['msg'] for error in resp_json['errors']} == {'field' if PYDANTIC_V1 else 'Field'}
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason='pydantic v1 errors have no exceptions in the context')
+async def test_errors_context_rendering(aiohttp_client: AiohttpClient) -> None:
+    from pydantic import field_validator
+
+    class QueryModel(BaseModel):
+        attr: str
+
+        @field_validator('attr')
+        @classmethod
+        def check_attr(cls, value: str) -> str:
+            raise ValueError('bad value')
+
+    async def handler(
+            query: Annotated[QueryModel, QuerySchema()],
+    ) -> web.Response:
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get('/', handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/', params={'attr': 'value'})
+    assert resp.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    error = (await resp.json())['errors'][0]
+    assert error['loc'] == ['query', 'attr']
+    # NOTE: the exception in the error context is rendered as a string
+    assert error['ctx'] == {'error': 'bad value'}
+    assert 'input' not in error
+    assert 'url' not in error
@@ -0,0 +1,131 @@
+import gzip
+from typing import Any, AsyncIterator, Dict
+
+import pytest
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+BIG_TEXT = 'compressible text ' * 1000
+
+
+async def _create_client(aiohttp_client: AiohttpClient, handler: Any, **middleware_kwargs: Any) -> Any:
+    app = web.Application(middlewares=[web.compression_middleware(codings=('gzip',), **middleware_kwargs)])
+    app.add_routes([web.get('/', handler)])
+    return await aiohttp_client(app, auto_decompress=False)
+
+
+async def test_gzip_compression(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> web.Response:
+        return web.Response(text=BIG_TEXT)
+
+    stats = web.CompressionStats()
+    client = await _create_client(aiohttp_client, handler, stats=stats)
+
+    resp = await client.get('/', headers={'Accept-Encoding': 'gzip, deflate'})
+    assert resp.status == 200
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert resp.headers['Vary'] == 'Accept-Encoding'
+
+    body = await resp.read()
+    assert int(resp.headers['Content-Length']) == len(body)
+    assert gzip.decompress(body).decode() == BIG_TEXT
+
+    assert stats.compressed_responses == 1
+    assert stats.bytes_before == len(BIG_TEXT)
+    assert stats.bytes_saved == len(BIG_TEXT) - len(body)
+
+
+@pytest.mark.parametrize(
+    'headers, response_kwargs', [
+        ({'Accept-Encoding': 'br, identity'}, {'text': BIG_TEXT}),
+        ({'Accept-Encoding': 'gzip;q=0, *'}, {'text': BIG_TEXT}),
+        ({'Accept-Encoding': 'identity'}, {'text': BIG_TEXT}),
+        ({'Accept-Encoding': 'gzip'}, {'text': 'small'}),
+        ({'Accept-Encoding': 'gzip'}, {'body': BIG_TEXT.encode(), 'content_type': 'image/png'}),
+        ({'Accept-Encoding': 'gzip'}, {'body': BIG_TEXT.encode(), 'content_type': 'video/mp4'}),
+        ({'Accept-Encoding': 'gzip'}, {'text': BIG_TEXT, 'headers': {'Cache-Control': 'no-transform'}}),
+        ({'Accept-Encoding': 'gzip'}, {'text': BIG_TEXT, 'headers': {'Content-Encoding': 'identity'}}),
+    ],
+)
+async def test_not_compressed(
+        aiohttp_client: AiohttpClient,
+        headers: Dict[str, str],
+        response_kwargs: Dict[str, Any],
+) -> None:
+    async def handler() -> web.Response:
+        return web.Response(**response_kwargs)
+
+    client = await _create_client(aiohttp_client, handler)
+
+    resp = await client.get('/', headers=headers)
+    assert resp.status == 200
+    assert resp.headers.get('Content-Encoding') in (None, 'identity')
+    body = response_kwargs['body'] if 'body' in response_kwargs else response_kwargs['text'].encode()
+    assert await resp.read() == body
+
+
+@pytest.mark.parametrize(
+    'etag, expected_etag', [
+        ('"v1"', 'W/"v1"'),
+        ('W/"v1"', 'W/"v1"'),
+    ],
+)
+async def test_compressed_response_etag_is_weak(aiohttp_client: AiohttpClient, etag: str, expected_etag: str) -> None:
+    async def handler() -> web.Response:
+        return web.Response(text=BIG_TEXT, headers={'ETag': etag})
+
+    client = await _create_client(aiohttp_client, handler)
+
+    resp = await client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert resp.headers['ETag'] == expected_etag
+
+    resp = await client.get('/', headers={'Accept-Encoding': 'identity'})
+    assert resp.headers['ETag'] == etag
+
+
+async def test_compression_in_executor(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> web.Response:
+        return web.Response(text=BIG_TEXT)
+
+    client = await _create_client(aiohttp_client, handler, executor_min_size=1)
+
+    resp = await client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert gzip.decompress(await resp.read()).decode() == BIG_TEXT
+
+
+async def test_stream_compression(aiohttp_client: AiohttpClient) -> None:
+    async def items() -> AsyncIterator[str]:
+        for _ in range(100):
+            yield BIG_TEXT
+
+    async def handler() -> AsyncIterator[str]:
+        return items()
+
+    client = await _create_client(aiohttp_client, handler)
+
+    resp = await client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(await resp.read()).decode() == f'"{BIG_TEXT}"\n' * 100
+
+
+@pytest.mark.parametrize('coding, module_name', [('br', 'brotli'), ('zstd', 'zstandard')])
+async def test_optional_codings(aiohttp_client: AiohttpClient, coding: str, module_name: str) -> None:
+    module = pytest.importorskip(module_name)
+
+    async def handler() -> web.Response:
+        return web.Response(text=BIG_TEXT)
+
+    app = web.Application(middlewares=[web.compression_middleware()])
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app, auto_decompress=False)
+
+    resp = await client.get('/', headers={'Accept-Encoding': f'gzip;q=0.5, {coding}'})
+    assert resp.headers['Content-Encoding'] == coding
+
+    body = await resp.read()
+    if coding == 'br':
+        assert module.decompress(body).decode() == BIG_TEXT
+    else:
+        assert module.ZstdDecompressor().decompress(body).decode() == BIG_TEXT
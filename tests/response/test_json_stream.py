@@ -0,0 +1,106 @@
+import json
+from typing import AsyncIterator, List
+
+import pytest
+from pydantic import BaseModel
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+
+class Item(BaseModel):
+    id: int
+
+
+async def _items(num_of_items: int) -> AsyncIterator[Item]:
+    for item_id in range(num_of_items):
+        yield Item(id=item_id)
+
+
+@pytest.mark.parametrize('num_of_items', [0, 1, 5000])
+async def test_ndjson_stream(aiohttp_client: AiohttpClient, num_of_items: int) -> None:
+    async def handler() -> AsyncIterator[Item]:
+        return _items(num_of_items)
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert resp.headers['Content-Type'] == 'application/x-ndjson; charset=utf-8'
+
+    lines = (await resp.text()).splitlines()
+    assert [json.loads(line) for line in lines] == [{'id': item_id} for item_id in range(num_of_items)]
+
+
+@pytest.mark.parametrize('num_of_items', [0, 1, 5000])
+async def test_json_array_stream(aiohttp_client: AiohttpClient, num_of_items: int) -> None:
+    async def handler() -> AsyncIterator[Item]:
+        return _items(num_of_items)
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, response_stream_format=web.JsonStreamFormat.json_array)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert resp.headers['Content-Type'] == 'application/json; charset=utf-8'
+    assert await resp.json() == [{'id': item_id} for item_id in range(num_of_items)]
+
+
+async def test_json_stream_response(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> web.JsonStreamResponse:
+        return web.JsonStreamResponse(_items(3), stream_format=web.JsonStreamFormat.json_array, chunk_size=1)
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert await resp.json() == [{'id': 0}, {'id': 1}, {'id': 2}]
+
+
+async def test_json_stream_head(aiohttp_client: AiohttpClient) -> None:
+    consumed_items: List[int] = []
+
+    async def items() -> AsyncIterator[int]:
+        consumed_items.append(1)
+        yield 1
+
+    async def handler() -> AsyncIterator[int]:
+        return items()
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.head('/')
+    assert resp.status == 200
+    assert await resp.read() == b''
+    assert consumed_items == []
+
+
+async def test_async_generator_handler(aiohttp_client: AiohttpClient) -> None:
+    async def handler(num_of_items: int = web.Query()) -> AsyncIterator[Item]:
+        for item_id in range(num_of_items):
+            yield Item(id=item_id)
+
+    class ItemView(web.View):
+        async def get(self) -> AsyncIterator[Item]:
+            yield Item(id=0)
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler), web.view('/view', ItemView)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/', params={'num_of_items': 2})
+    assert await resp.text() == '{"id":0}\n{"id":1}\n'
+
+    resp = await client.get('/view')
+    assert await resp.text() == '{"id":0}\n'
+
+
+def test_json_stream_unsupported_format() -> None:
+    with pytest.raises(ValueError):
+        web.JsonStreamResponse(_items(1), stream_format='xml')
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+from rapidy.constants import PYDANTIC_V1, PYDANTIC_V2
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class ItemWithSecret(Item):
+    secret: str
+
+
+@dataclass
+class DataclassItem:
+    id: int
+    name: str
+
+
+@pytest.mark.parametrize(
+    'handler_result, expected_json', [
+        (Item(id=1, name='a'), {'id': 1, 'name': 'a'}),
+        (DataclassItem(id=1, name='a'), {'id': 1, 'name': 'a'}),
+        ({'id': 1, 'items': [Item(id=2, name='b')]}, {'id': 1, 'items': [{'id': 2, 'name': 'b'}]}),
+        ([1, 'a', None], [1, 'a', None]),
+        (None, None),
+    ],
+)
+async def test_handler_result_serialization(
+        aiohttp_client: AiohttpClient,
+        handler_result: Any,
+        expected_json: Any,
+) -> None:
+    async def handler() -> Any:
+        return handler_result
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert resp.headers['Content-Type'] == 'application/json; charset=utf-8'
+    assert await resp.json() == expected_json
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason='compiled serializers are available only with pydantic v2')
+async def test_handler_response_is_not_serialized(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> web.Response:
+        return web.Response(text='text')
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, response_model=Item)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert await resp.text() == 'text'
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason='compiled serializers are available only with pydantic v2')
+async def test_response_model(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> List[Item]:
+        return [ItemWithSecret(id=1, name='a', secret='secret')]
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler, response_model=List[Item])])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert await resp.json() == [{'id': 1, 'name': 'a'}]
+
+
+@pytest.mark.skipif(not PYDANTIC_V1, reason='pydantic v1 has no compiled serializers')
+def test_response_model_requires_pydantic_v2() -> None:
+    async def handler() -> List[Item]:
+        return []  # pragma: no cover
+
+    app = web.Application()
+    with pytest.raises(TypeError, match='`response_model` is supported only with pydantic v2'):
+        app.add_routes([web.get('/', handler, response_model=List[Item])])
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason='compiled serializers are available only with pydantic v2')
+async def test_view_response_model(aiohttp_client: AiohttpClient) -> None:
+    class ItemView(web.View):
+        async def get(self) -> Dict[str, Item]:
+            return {'item': Item(id=1, name='a')}
+
+    app = web.Application()
+    app.add_routes([web.view('/', ItemView, response_model=Dict[str, Item])])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert await resp.json() == {'item': {'id': 1, 'name': 'a'}}
@@ -17,3 +17,53 @@ async def test_server_info(aiohttp_client: AiohttpClient, server_info_in_respons
     resp = await client.post('/')
     assert resp.status == 200
     assert bool(resp.headers.get('Server')) == server_info_in_response
+
+
+@pytest.mark.parametrize('server_info_in_response', [True, False])
+async def test_server_info_in_prepared_stream(aiohttp_client: AiohttpClient, server_info_in_response: bool) -> None:
+    app = web.Application(server_info_in_response=server_info_in_response)
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        await resp.write(b'data')
+        return resp
+
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert bool(resp.headers.get('Server')) == server_info_in_response
+
+
+async def test_handler_server_header(aiohttp_client: AiohttpClient) -> None:
+    app = web.Application()
+
+    async def handler() -> web.Response:
+        return web.Response(headers={'Server': 'custom'})
+
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.headers['Server'] == 'custom'
+
+
+async def test_default_headers(aiohttp_client: AiohttpClient) -> None:
+    app = web.Application(default_headers={'X-Frame-Options': 'DENY', 'Cache-Control': 'no-store'})
+
+    async def handler() -> web.Response:
+        return web.Response(headers={'Cache-Control': 'max-age=60'})
+
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.headers['X-Frame-Options'] == 'DENY'
+    assert resp.headers['Cache-Control'] == 'max-age=60'
+
+    resp = await client.get('/not_found')
+    assert resp.status == 404
+    assert resp.headers['X-Frame-Options'] == 'DENY'
+    assert 'Server' not in resp.headers
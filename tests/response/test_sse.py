@@ -0,0 +1,188 @@
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+from aiohttp import ClientError
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+
+
+async def _events() -> AsyncIterator[web.ServerSentEvent]:
+    yield web.ServerSentEvent(data='first')
+    yield web.ServerSentEvent(data='multi\nline', event='update', id='2', retry=1000)
+
+
+async def test_event_source_response(aiohttp_client: AiohttpClient) -> None:
+    async def handler() -> web.EventSourceResponse:
+        return web.EventSourceResponse(_events())
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert resp.status == 200
+    assert resp.headers['Content-Type'] == 'text/event-stream; charset=utf-8'
+    assert resp.headers['Cache-Control'] == 'no-cache'
+    assert await resp.text() == (
+        'data: first\n\n'
+        'event: update\nid: 2\nretry: 1000\ndata: multi\ndata: line\n\n'
+    )
+
+
+async def test_events_are_coalesced(aiohttp_client: AiohttpClient) -> None:
+    writes: List[bytes] = []
+
+    class EventSourceResponse(web.EventSourceResponse):
+        async def write(self, data: bytes) -> None:
+            writes.append(data)
+            await super().write(data)
+
+    async def handler(request: web.Request) -> web.EventSourceResponse:
+        resp = EventSourceResponse()
+        await resp.prepare(request)
+        for event_num in range(100):
+            await resp.send(str(event_num))
+        return resp
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert await resp.text() == ''.join(f'data: {event_num}\n\n' for event_num in range(100))
+    assert len(writes) == 1
+
+
+async def test_heartbeat(aiohttp_client: AiohttpClient) -> None:
+    async def handler(request: web.Request) -> web.EventSourceResponse:
+        resp = web.EventSourceResponse(heartbeat_interval=0.02)
+        await resp.prepare(request)
+        await asyncio.sleep(0.1)
+        return resp
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert ': ping\n\n' in await resp.text()
+
+
+async def test_last_event_id(aiohttp_client: AiohttpClient) -> None:
+    async def handler(request: web.Request) -> web.EventSourceResponse:
+        resp = web.EventSourceResponse()
+        await resp.prepare(request)
+        await resp.send(f'after {resp.last_event_id}')
+        return resp
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/', headers={'Last-Event-ID': '42'})
+    assert await resp.text() == 'data: after 42\n\n'
+
+
+async def test_producer_is_cancelled_on_disconnect(
+        aiohttp_client: AiohttpClient,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr('rapidy._sse.SSE_CONNECTION_CHECK_INTERVAL', 0.01)
+    producer_cancelled = asyncio.Event()
+
+    async def handler(request: web.Request) -> web.EventSourceResponse:
+        resp = web.EventSourceResponse()
+        await resp.prepare(request)
+        await resp.send('first')
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            producer_cancelled.set()
+            raise
+        return resp
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert await resp.content.readline() == b'data: first\n'
+    resp.close()
+
+    await asyncio.wait_for(producer_cancelled.wait(), timeout=1)
+
+
+async def test_keepalive_is_cancelled_on_handler_failure(aiohttp_client: AiohttpClient) -> None:
+    keepalive_cancelled = asyncio.Event()
+
+    class EventSourceResponse(web.EventSourceResponse):
+        async def _keepalive(self) -> None:
+            try:
+                await super()._keepalive()
+            except asyncio.CancelledError:
+                keepalive_cancelled.set()
+                raise
+
+    async def handler(request: web.Request) -> web.EventSourceResponse:
+        resp = EventSourceResponse()
+        await resp.prepare(request)
+        await resp.send('first')
+        raise ValueError
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/')
+    assert await resp.content.readline() == b'data: first\n'
+
+    await asyncio.wait_for(keepalive_cancelled.wait(), timeout=1)
+
+
+async def test_write_error_is_raised_to_producer(aiohttp_client: AiohttpClient) -> None:
+    producer_errors: List[BaseException] = []
+
+    class EventSourceResponse(web.EventSourceResponse):
+        async def write(self, data: bytes) -> None:
+            raise RuntimeError('write failed')
+
+    async def handler(request: web.Request) -> web.Response:
+        resp = EventSourceResponse()
+        await resp.prepare(request)
+        await resp.send('first')
+        await asyncio.sleep(0)
+        try:
+            await resp.send('second')
+        except RuntimeError as exc:
+            producer_errors.append(exc)
+        raise web.HTTPInternalServerError
+
+    app = web.Application()
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+
+    # NOTE: nothing has been written - the connection is closed without a response
+    with pytest.raises(ClientError):
+        await client.get('/')
+
+    assert [str(error) for error in producer_errors] == ['write failed']
+
+
+@pytest.mark.parametrize(
+    'data, expected_data_lines', [
+        ('a\r\nb\rc\nd', 'data: a\ndata: b\ndata: c\ndata: d\n\n'),
+        ('a\n', 'data: a\ndata: \n\n'),
+        ('a\u2028b\x0cc', 'data: a\u2028b\x0cc\n\n'),
+        ('', 'data: \n\n'),
+    ],
+)
+def test_server_sent_event_data_lines(data: str, expected_data_lines: str) -> None:
+    assert web.ServerSentEvent(data=data).encode() == expected_data_lines.encode()
+
+
+@pytest.mark.parametrize('field_name', ['event', 'id'])
+def test_server_sent_event_line_breaks(field_name: str) -> None:
+    with pytest.raises(ValueError):
+        web.ServerSentEvent(data='data', **{field_name: 'a\nb'})
@@ -0,0 +1,235 @@
+from http import HTTPStatus
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+from aiohttp.web_urldispatcher import UrlDispatcher as AioHTTPUrlDispatcher
+from pytest_aiohttp.plugin import AiohttpClient
+
+from rapidy import web
+from rapidy._resource_tree import ResourceTree
+from rapidy.web_urldispatcher import UrlDispatcher
+
+
+async def handler() -> web.Response:
+    return web.Response()
+
+
+def create_router(paths: List[Tuple[str, str]]) -> UrlDispatcher:
+    router = UrlDispatcher()
+    for method, path in paths:
+        router.add_route(method, path, handler)
+    return router
+
+
+async def resolve(router: UrlDispatcher, method: str, path: str) -> Tuple[Optional[str], Optional[int]]:
+    match_info = await router.resolve(make_mocked_request(method, path))
+    if match_info.http_exception is not None:
+        return None, match_info.http_exception.status
+    return match_info.route.resource.canonical, None  # type: ignore[union-attr]
+
+
+ROUTES = [
+    ('GET', '/'),
+    ('GET', '/users'),
+    ('POST', '/users'),
+    ('GET', '/users/{user_id}'),
+    ('GET', '/users/me'),
+    ('PUT', '/users/me'),
+    ('GET', '/users/{user_id}/posts/{post_id}'),
+    ('GET', '/files/{name}.{ext}'),
+    ('GET', '/static/{tail:.+}'),
+    ('GET', '/items/{item_id:\\d+}'),
+    ('GET', '/items/new'),
+    ('GET', '/trailing/'),
+    ('*', '/any/{name}'),
+    ('GET', '/orders/{order_id:int}/lines'),
+    ('GET', '/orders/{slug:slug}/lines'),
+]
+
+PATHS = [
+    '/',
+    '/users',
+    '/users/',
+    '/users/1',
+    '/users/me',
+    '/users/1/posts/2',
+    '/users/1/posts',
+    '/files/report.pdf',
+    '/files/report',
+    '/static/css/main.css',
+    '/static/',
+    '/items/12',
+    '/items/new',
+    '/items/abc',
+    '/trailing',
+    '/trailing/',
+    '/any/x',
+    '/unknown/path',
+    '/users/%D0%B8',
+    '/assets/test.txt',
+    '/assets',
+    '/orders/1/lines',
+    '/orders/new-order/lines',
+    '/orders/new.order/lines',
+]
+
+
+@pytest.mark.parametrize('method', ['GET', 'POST', 'PUT', 'DELETE'])
+@pytest.mark.parametrize('path', PATHS)
+async def test_resolve_same_as_linear(method: str, path: str) -> None:
+    router = create_router(ROUTES)
+    router.add_static('/assets', Path(__file__).parent / 'test_static')
+    router.freeze()
+
+    match_info = await router.resolve(make_mocked_request(method, path))
+    linear_match_info = await AioHTTPUrlDispatcher.resolve(router, make_mocked_request(method, path))
+
+    assert match_info.route is linear_match_info.route or (
+        match_info.http_exception is not None
+        and linear_match_info.http_exception is not None
+        and match_info.http_exception.status == linear_match_info.http_exception.status
+    )
+    assert dict(match_info) == dict(linear_match_info)
+
+
+async def test_resolve_registration_order() -> None:
+    router = create_router([('GET', '/users/{user_id}'), ('GET', '/users/me')])
+    router.freeze()
+
+    # NOTE: the first registered resource wins, as in the aiohttp router
+    assert await resolve(router, 'GET', '/users/me') == ('/users/{user_id}', None)
+
+
+async def test_resolve_method_not_allowed() -> None:
+    router = create_router([('GET', '/users/{user_id}'), ('POST', '/users/me'), ('PUT', '/{any}/me')])
+    router.freeze()
+
+    match_info = await router.resolve(make_mocked_request('DELETE', '/users/me'))
+    assert match_info.http_exception.status == HTTPStatus.METHOD_NOT_ALLOWED  # type: ignore[union-attr]
+    assert match_info.http_exception.allowed_methods == {'GET', 'POST', 'PUT'}  # type: ignore[union-attr]
+
+    assert await resolve(router, 'GET', '/posts') == (None, HTTPStatus.NOT_FOUND)
+
+
+async def test_subapp_and_url_for(aiohttp_client: AiohttpClient) -> None:
+    async def user_handler(user_id: str = web.Path()) -> str:
+        return user_id
+
+    subapp = web.Application()
+    subapp.router.add_get('/users/{user_id}', user_handler, name='user')
+
+    app = web.Application()
+    app.router.add_get('/api/health', handler)
+    app.add_subapp('/api/v1', subapp)
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/api/v1/users/1')
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == '1'
+
+    resp = await client.get('/api/health')
+    assert resp.status == HTTPStatus.OK
+
+    resp = await client.get('/api/v1/unknown')
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+    assert str(subapp.router['user'].url_for(user_id='2')) == '/api/v1/users/2'
+
+
+def test_plain_path_candidates() -> None:
+    router = create_router([('GET', '/health'), ('GET', '/users/{user_id}'), ('GET', '/users/me'), ('GET', '/{any}')])
+    health_resource, user_resource, me_resource, any_resource = router.resources()
+
+    tree = ResourceTree(router.resources())
+    assert tree.find_resources('/health') == [health_resource, any_resource]
+    # NOTE: the dynamic resource registered before the plain one keeps its precedence
+    assert tree.find_resources('/users/me') == [user_resource, me_resource]
+    assert tree.find_resources('/users/1') == [user_resource]
+
+
+async def test_resolve_cache() -> None:
+    router = UrlDispatcher(resolve_cache_size=2)
+    router.add_get('/health', handler)
+    router.add_get('/tenants/{tenant_id}/config', handler)
+    router.freeze()
+
+    resolve_cache = router.resolve_cache
+    assert resolve_cache is not None
+
+    match_info = await router.resolve(make_mocked_request('GET', '/tenants/1/config'))
+    match_info['tenant_id'] = 'changed'
+
+    # NOTE: the cached result is not affected by the changes of the returned `match_info`
+    cached_match_info = await router.resolve(make_mocked_request('GET', '/tenants/1/config'))
+    assert cached_match_info == {'tenant_id': '1'}
+    assert cached_match_info.route is match_info.route
+    assert (resolve_cache.hits, resolve_cache.misses) == (1, 1)
+
+    await router.resolve(make_mocked_request('GET', '/tenants/2/config'))
+    await router.resolve(make_mocked_request('GET', '/tenants/3/config'))
+    assert len(resolve_cache) == 2
+
+    # NOTE: the least recently used path is evicted, the errors are not cached
+    await router.resolve(make_mocked_request('GET', '/tenants/1/config'))
+    await router.resolve(make_mocked_request('POST', '/tenants/1/config'))
+    assert (resolve_cache.hits, resolve_cache.misses) == (1, 5)
+
+    # NOTE: the plain paths are found by a dict lookup - the cache is not consulted
+    await router.resolve(make_mocked_request('GET', '/health'))
+    assert (resolve_cache.hits, resolve_cache.misses) == (1, 5)
+    assert len(resolve_cache) == 2
+
+
+async def test_resolve_cache_disabled_for_domain_resources(aiohttp_client: AiohttpClient) -> None:
+    subapp = web.Application()
+    subapp.router.add_get('/users/{user_id}', handler)
+
+    app = web.Application(resolve_cache_size=100)
+    app.add_domain('example.com', subapp)
+    app.router.add_get('/users/{user_id}', handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get('/users/1')
+    assert resp.status == HTTPStatus.OK
+
+    # NOTE: the result depends on the host - it is not cached
+    assert len(app.router.resolve_cache) == 0  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize('method', ['GET', 'POST'])
+@pytest.mark.parametrize(
+    'host',
+    [None, 'example.com', 'EXAMPLE.com', 'example.com:8080', 'api.example.com', 'a.b.example.com', 'api.example.org'],
+)
+@pytest.mark.parametrize('path', ['/', '/users/1', '/health', '/unknown'])
+async def test_resolve_hosts_same_as_linear(method: str, host: Optional[str], path: str) -> None:
+    def create_subapp(*paths: str) -> web.Application:
+        subapp = web.Application()
+        for subapp_path in paths:
+            subapp.router.add_get(subapp_path, handler)
+        return subapp
+
+    app = web.Application()
+    app.router.add_get('/health', handler)
+    app.add_domain('example.com', create_subapp('/', '/users/{user_id}'))
+    app.add_domain('*.example.com', create_subapp('/users/{user_id}'))
+    app.add_domain('api.example.org', create_subapp('/'))
+    app.add_domain('example.com', create_subapp('/unknown'))
+    app.router.add_get('/unknown', handler)
+    app.router.freeze()
+
+    headers = {'Host': host} if host is not None else {}
+    match_info = await app.router.resolve(make_mocked_request(method, path, headers=headers))
+    linear_match_info = await AioHTTPUrlDispatcher.resolve(
+        app.router,
+        make_mocked_request(method, path, headers=headers),
+    )
+
+    assert match_info.route is linear_match_info.route or (
+        match_info.http_exception is not None
+        and linear_match_info.http_exception is not None
+        and match_info.http_exception.status == linear_match_info.http_exception.status
+    )
+    assert match_info.apps == linear_match_info.apps